@@ -0,0 +1,211 @@
+"""
+Benchmark sin conexión del analizador de seguidores.
+
+Levanta un servidor local que imita a Instagram (datos sintéticos o una grabación
+hecha con `python main.py --record archivo.jsonl`), redirige allí a Instaloader y
+ejecuta el análisis completo de InstagramAnalyzerApp en modo por lotes.
+
+Con --set-backends compara, sin servidor, los motores de conjuntos del analizador
+para encontrar el tamaño a partir del cual conviene cada uno.
+"""
+
+import argparse
+import pickle
+import random
+import tempfile
+import time
+from pathlib import Path
+from src.analysis import SET_BACKENDS
+from src.analysis.user_table import to_id_array
+from src.app import InstagramAnalyzerApp
+from src.replay import (
+    Cassette,
+    InstagramRedirect,
+    InstagramStandInServer,
+    InstaloaderPacingDisabled,
+    SyntheticInstagram
+)
+from src.utils import ConfigLoader
+
+
+def parse_args() -> argparse.Namespace:
+    """Lee los argumentos de la línea de comandos."""
+    parser = argparse.ArgumentParser(description="Benchmark sin conexión del analizador de seguidores")
+    parser.add_argument("--followers", type=int, default=5000, help="Seguidores de la cuenta sintética")
+    parser.add_argument("--following", type=int, default=3000, help="Seguidos de la cuenta sintética")
+    parser.add_argument("--cassette", type=Path, help="Grabación a reproducir en lugar de datos sintéticos")
+    parser.add_argument("--target", help="Cuenta a analizar (con --cassette, la cuenta grabada)")
+    parser.add_argument("--session", help="Sesión con la que se consulta (con --cassette, la grabada)")
+    parser.add_argument("--latency", type=float, default=0.05, help="Segundos de latencia por respuesta")
+    parser.add_argument("--page-size", type=int, default=50, help="Tamaño de página máximo aceptado")
+    parser.add_argument(
+        "--request-page-size",
+        type=int,
+        default=50,
+        help="Tamaño de página que pide la aplicación (instagram.page_size); se reduce si el servidor lo rechaza"
+    )
+    parser.add_argument("--throttle-every", type=int, default=0, help="Responde 429 a una de cada N consultas")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Probabilidad de 429 por consulta")
+    parser.add_argument("--delay", type=float, default=0.0, help="rate_limit_delay de la aplicación")
+    parser.add_argument("--incremental", action="store_true", help="Activa la sincronización incremental")
+    parser.add_argument(
+        "--instaloader-pacing",
+        action="store_true",
+        help="Mantiene las pausas internas de Instaloader (por defecto se desactivan)"
+    )
+    parser.add_argument(
+        "--set-backends",
+        metavar="USUARIOS",
+        type=int,
+        nargs="*",
+        help="Compara los motores de conjuntos con estos tamaños (seguidores + seguidos) y termina"
+    )
+    return parser.parse_args()
+
+
+def _best_time(function, repeat: int) -> float:
+    """Menor tiempo de varias ejecuciones, en segundos."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _categories(backend, followers, following):
+    """
+    Calcula las categorías de un análisis con un motor, como las pide el resultado.
+
+    Args:
+        backend: Motor de conjuntos.
+        followers: Identificadores de los seguidores.
+        following: Identificadores de los seguidos.
+    """
+    follower_ids = to_id_array(followers)
+    following_ids = to_id_array(following)
+    mutual = backend.intersection(follower_ids, following_ids)
+    backend.subset_difference(following_ids, mutual)
+    backend.subset_difference(follower_ids, mutual)
+
+
+def benchmark_set_backends(sizes):
+    """
+    Mide cada motor de conjuntos con listas sintéticas de varios tamaños.
+    'análisis' es ordenar las dos listas descargadas y calcular las tres categorías derivadas
+    (lo que hace FollowerAnalysisResult al pedirlas todas, p. ej. al exportar);
+    'intersección' y 'unión' combinan dos resultados ya ordenados (p. ej. dos cuentas o dos fechas).
+
+    Args:
+        sizes: Usuarios (seguidores + seguidos) de cada medición.
+    """
+    print("=" * 70)
+    print("  ⏱️  MOTORES DE CONJUNTOS (ms, mejor de varias ejecuciones)")
+    print("=" * 70)
+    backends = {name: backend() for name, backend in SET_BACKENDS.items()}
+    print(f"   {'usuarios':>9}  {'operación':<13}" + "".join(f"{name:>10}" for name in backends))
+
+    rng = random.Random(0)
+    crossover = None
+    for size in sizes:
+        # Cuenta con el doble de seguidores que de seguidos y la mitad de los seguidos mutuos
+        ids = rng.sample(range(1, 10 ** 11), size)
+        followers = set(ids[:size * 2 // 3])
+        following = set(ids[size * 2 // 3:]) | set(ids[:size // 6])
+        other = set(ids[size // 10:size * 2 // 3]) | set(rng.sample(range(1, 10 ** 11), size // 10))
+        sorted_followers = to_id_array(followers)
+        sorted_other = to_id_array(other)
+        repeat = 5 if size <= 100_000 else 2
+
+        timings = {}
+        for operation, run in (
+            ("análisis", lambda backend: _categories(backend, followers, following)),
+            ("intersección", lambda backend: backend.intersection(sorted_followers, sorted_other)),
+            ("unión", lambda backend: backend.union(sorted_followers, sorted_other)),
+            ("diferencia", lambda backend: backend.difference(sorted_followers, sorted_other))
+        ):
+            timings[operation] = {name: _best_time(lambda: run(backend), repeat) for name, backend in backends.items()}
+            print(f"   {size:>9}  {operation:<13}" +
+                  "".join(f"{timings[operation][name] * 1000:>10.1f}" for name in backends))
+
+        if crossover is None and timings["análisis"]['sorted'] < timings["análisis"]['hash']:
+            crossover = size
+
+    if crossover:
+        print(f"\n   En el análisis, 'sorted' es más rápido desde unos {crossover} usuarios")
+    else:
+        print("\n   En el análisis, 'hash' fue más rápido en todos los tamaños medidos")
+
+
+def main():
+    """Función principal."""
+    args = parse_args()
+    if args.set_backends is not None:
+        benchmark_set_backends(args.set_backends or [1_000, 10_000, 100_000, 300_000, 1_000_000])
+        return
+
+    dataset = None
+    cassette = Cassette.load(args.cassette) if args.cassette else None
+    if cassette is None:
+        dataset = SyntheticInstagram(followers=args.followers, following=args.following)
+
+    target = args.target or (dataset.target if dataset else None)
+    session = args.session or (dataset.viewer if dataset else target)
+    if not target:
+        raise SystemExit("Con --cassette hay que indicar --target")
+
+    work_directory = Path(tempfile.mkdtemp(prefix="instagram_benchmark_"))
+    with open(work_directory / session, 'wb') as f:
+        pickle.dump({'sessionid': 'benchmark', 'csrftoken': 'benchmark', 'ds_user_id': '2'}, f)
+    jobs_file = work_directory / "cuentas.txt"
+    jobs_file.write_text(f"{target} {session}\n", encoding='utf-8')
+
+    config = ConfigLoader(data={
+        'instagram': {
+            'rate_limit_delay': args.delay,
+            'min_rate_limit_delay': args.delay,
+            'max_retries': 5,
+            'page_size': args.request_page_size
+        },
+        'analysis': {'incremental_sync': args.incremental},
+        'batch': {'max_workers': 1}
+    })
+    app = InstagramAnalyzerApp(base_directory=work_directory, config=config)
+
+    server = InstagramStandInServer(
+        dataset=dataset,
+        cassette=cassette,
+        latency=args.latency,
+        page_size=args.page_size,
+        throttle_every=args.throttle_every,
+        throttle_rate=args.throttle_rate,
+        seed=0
+    )
+
+    pacing = InstaloaderPacingDisabled() if not args.instaloader_pacing else None
+    start = time.monotonic()
+    with server, InstagramRedirect(server.base_url):
+        if pacing:
+            with pacing:
+                success = app.run_batch(jobs_file)
+        else:
+            success = app.run_batch(jobs_file)
+    elapsed = time.monotonic() - start
+
+    stats = server.stats
+    users = (args.followers + args.following) if dataset else 0
+    print("\n" + "=" * 70)
+    print("  ⏱️  BENCHMARK")
+    print("=" * 70)
+    print(f"   • Resultado: {'correcto' if success else 'con errores'}")
+    print(f"   • Tiempo total: {elapsed:.2f}s")
+    print(f"   • Solicitudes al servidor: {stats.requests} ({stats.throttled} respondidas con 429)")
+    print(f"   • Por tipo: {stats.by_endpoint}")
+    if users:
+        print(f"   • Usuarios descargados: {users} ({users / elapsed:.0f}/s, "
+              f"{1000 * stats.requests / users:.1f} solicitudes por cada 1000)")
+    print(f"   • Archivos generados en: {work_directory}")
+
+
+if __name__ == "__main__":
+    main()
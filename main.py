@@ -5,14 +5,70 @@ Analizador de seguidores de Instagram.
 Este programa te ayuda a identificar quién te dejó de seguir en Instagram.
 """
 
+import argparse
+import sys
+from contextlib import nullcontext
 from pathlib import Path
 from src.app import InstagramAnalyzerApp
+from src.replay import HTTPRecorder
 
 
 def main():
     """Función principal."""
+    parser = argparse.ArgumentParser(description="Analizador de seguidores de Instagram")
+    parser.add_argument(
+        "--batch",
+        metavar="ARCHIVO",
+        type=Path,
+        help="Analiza las cuentas del archivo (una por línea: 'cuenta [sesion]') sin menú interactivo"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Cuentas analizadas a la vez en modo por lotes (por defecto, config.yaml)"
+    )
+    parser.add_argument(
+        "--record",
+        metavar="ARCHIVO",
+        type=Path,
+        help="Graba las respuestas de Instagram en un .jsonl para reproducirlas sin conexión (benchmark.py)"
+    )
+    parser.add_argument(
+        "--compare-snapshots",
+        metavar=("ANTERIOR", "POSTERIOR"),
+        nargs=2,
+        type=Path,
+        help="Compara dos instantáneas binarias (.igsnap) exportadas de análisis anteriores"
+    )
+    parser.add_argument(
+        "--overlap",
+        metavar="CUENTA",
+        nargs="+",
+        help="Compara las audiencias de varias cuentas del historial o instantáneas (.igsnap) y termina"
+    )
+    parser.add_argument(
+        "--compact-history",
+        action="store_true",
+        help="Descarta los análisis antiguos según la política de retención de config.yaml y compacta el historial"
+    )
+    args = parser.parse_args()
+    
     app = InstagramAnalyzerApp(base_directory=Path.cwd())
-    app.run()
+    with HTTPRecorder(args.record) if args.record else nullcontext():
+        if args.compact_history:
+            success = app.compact_history()
+        elif args.overlap:
+            success = app.audience_overlap(args.overlap)
+        elif args.compare_snapshots:
+            success = app.compare_snapshots(*args.compare_snapshots)
+        elif args.batch:
+            success = app.run_batch(args.batch, args.workers)
+        else:
+            app.run()
+            success = True
+    
+    if not success:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -4,12 +4,43 @@ Proporciona servicios para analizar seguidores y seguidos.
 """
 
 from .follower_analyzer import FollowerAnalyzer
+from .incremental_analyzer import IncrementalFollowerAnalyzer
 from .statistics_calculator import StatisticsCalculator
-from .models import FollowerAnalysisResult, FollowerStatistics
+from .models import (
+    FollowerAnalysisResult,
+    FollowerStatistics,
+    ChurnStatistics,
+    DailyChurn,
+    AudienceOverlap,
+    UserRecord
+)
+from .user_table import UserTable
+from .audience_overlap import AudienceOverlapCalculator
+from .set_backends import (
+    IdSetBackend,
+    HashSetBackend,
+    SortedArrayBackend,
+    SET_BACKENDS,
+    get_set_backend,
+    choose_set_backend
+)
 
 __all__ = [
     'FollowerAnalyzer',
+    'IncrementalFollowerAnalyzer',
     'StatisticsCalculator',
     'FollowerAnalysisResult',
-    'FollowerStatistics'
+    'FollowerStatistics',
+    'ChurnStatistics',
+    'DailyChurn',
+    'AudienceOverlap',
+    'UserRecord',
+    'UserTable',
+    'AudienceOverlapCalculator',
+    'IdSetBackend',
+    'HashSetBackend',
+    'SortedArrayBackend',
+    'SET_BACKENDS',
+    'get_set_backend',
+    'choose_set_backend'
 ]
@@ -3,29 +3,79 @@ Analizador de seguidores.
 Implementa la lógica de análisis de seguidores vs seguidos.
 """
 
-from typing import Set
-from .models import FollowerAnalysisResult, FollowerStatistics
+from typing import Iterable, Optional, Set, Union
+from .models import FollowerAnalysisResult, UserRecord
+from .set_backends import IdSetBackend
 from .statistics_calculator import StatisticsCalculator
+from .user_table import UserTable, to_id_array
 
 
 class FollowerAnalyzer:
     """
     Servicio para analizar seguidores y seguidos.
     Siguiendo Single Responsibility Principle: solo analiza relaciones de seguidores.
+    
+    Los datos pueden entregarse completos en el constructor o por lotes con
+    add_followers/add_following mientras se descargan; en ese caso los seguidores
+    mutuos se van calculando a medida que llegan los lotes.
+    
+    Internamente trabaja con identificadores numéricos; los nombres quedan en la
+    tabla de usuarios y solo se resuelven al mostrar o exportar. Las operaciones de
+    conjunto de las categorías las hace un motor intercambiable (IdSetBackend), y solo
+    cuando el resultado las pide.
     """
     
-    def __init__(self, followers: Set[str], following: Set[str]):
+    def __init__(
+        self,
+        followers: Optional[Iterable[Union[UserRecord, str]]] = None,
+        following: Optional[Iterable[Union[UserRecord, str]]] = None,
+        users: Optional[UserTable] = None,
+        set_backend: Optional[IdSetBackend] = None
+    ):
         """
         Inicializa el analizador.
         
         Args:
-            followers: Conjunto de usuarios que te siguen.
-            following: Conjunto de usuarios que sigues.
+            followers: Usuarios que te siguen (registros o nombres de usuario).
+            following: Usuarios que sigues (registros o nombres de usuario).
+            users: Tabla de usuarios a reutilizar. Por defecto se crea una nueva.
+            set_backend: Motor de conjuntos. Por defecto se elige según el tamaño de las listas.
         """
-        self._followers = followers
-        self._following = following
+        self._users = users or UserTable()
+        self._followers: Set[int] = set(self._users.add_all(followers)) if followers else set()
+        self._following: Set[int] = set(self._users.add_all(following)) if following else set()
+        self._mutual: Optional[Set[int]] = None
+        self._set_backend = set_backend
         self._statistics_calculator = StatisticsCalculator()
     
+    def add_followers(self, batch: Iterable[Union[UserRecord, str]]):
+        """
+        Agrega un lote de seguidores.
+        
+        Args:
+            batch: Usuarios que te siguen (registros o nombres de usuario).
+        """
+        mutual = self._get_streaming_mutual()
+        for user in self._users.add_all(batch):
+            if user not in self._followers:
+                self._followers.add(user)
+                if user in self._following:
+                    mutual.add(user)
+    
+    def add_following(self, batch: Iterable[Union[UserRecord, str]]):
+        """
+        Agrega un lote de seguidos.
+        
+        Args:
+            batch: Usuarios que sigues (registros o nombres de usuario).
+        """
+        mutual = self._get_streaming_mutual()
+        for user in self._users.add_all(batch):
+            if user not in self._following:
+                self._following.add(user)
+                if user in self._followers:
+                    mutual.add(user)
+    
     def analyze(self) -> FollowerAnalysisResult:
         """
         Realiza el análisis completo de seguidores.
@@ -33,51 +83,37 @@ class FollowerAnalyzer:
         Returns:
             FollowerAnalysisResult: Resultado del análisis.
         """
-        mutual = self._get_mutual_followers()
-        not_following_back = self._get_not_following_back()
-        not_followed_back = self._get_not_followed_back()
+        # Los conteos salen de una pasada sobre los conjuntos: el resumen no necesita las
+        # categorías, que el resultado calcula solo si se piden
+        if self._mutual is not None:
+            mutual_count = len(self._mutual)
+        else:
+            mutual_count = sum(map(self._followers.__contains__, self._following))
         
         # Calcular estadísticas
         statistics = self._statistics_calculator.calculate(
             total_followers=len(self._followers),
             total_following=len(self._following),
-            mutual_followers=len(mutual),
-            not_following_back=len(not_following_back),
-            not_followed_back=len(not_followed_back)
+            mutual_followers=mutual_count,
+            not_following_back=len(self._following) - mutual_count,
+            not_followed_back=len(self._followers) - mutual_count
         )
         
         return FollowerAnalysisResult(
-            followers=self._followers,
-            following=self._following,
-            mutual_followers=mutual,
-            not_following_back=not_following_back,
-            not_followed_back=not_followed_back,
-            statistics=statistics
+            follower_ids=to_id_array(self._followers),
+            following_ids=to_id_array(self._following),
+            users=self._users,
+            statistics=statistics,
+            set_backend=self._set_backend
         )
     
-    def _get_mutual_followers(self) -> Set[str]:
-        """
-        Obtiene usuarios con seguimiento mutuo.
-        
-        Returns:
-            Set[str]: Conjunto de seguidores mutuos.
-        """
-        return self._followers & self._following
-    
-    def _get_not_following_back(self) -> Set[str]:
-        """
-        Obtiene usuarios que sigues pero no te siguen de vuelta.
-        
-        Returns:
-            Set[str]: Conjunto de usuarios que no te siguen.
-        """
-        return self._following - self._followers
-    
-    def _get_not_followed_back(self) -> Set[str]:
+    def _get_streaming_mutual(self) -> Set[int]:
         """
-        Obtiene usuarios que te siguen pero tú no sigues.
+        Obtiene el conjunto de mutuos que se mantiene al agregar lotes.
         
         Returns:
-            Set[str]: Conjunto de usuarios que no sigues de vuelta.
+            Set[int]: Identificadores de los mutuos con los datos recibidos hasta ahora.
         """
-        return self._followers - self._following
+        if self._mutual is None:
+            self._mutual = self._followers & self._following
+        return self._mutual
@@ -0,0 +1,281 @@
+"""
+Analizador incremental de seguidores.
+Actualiza un análisis anterior con altas y bajas en lugar de repetirlo entero.
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Callable, Iterable, Optional, Set, Union
+from .models import FollowerAnalysisResult, FollowerStatistics, UserRecord
+from .set_backends import IdSetBackend, choose_set_backend
+from .statistics_calculator import StatisticsCalculator
+from .user_table import to_id_array
+
+if TYPE_CHECKING:
+    from ..storage.models import SnapshotDiff
+
+# Categoría de un usuario según (te sigue, lo sigues): mutuos, no te siguen, no sigues
+_CATEGORIES = {(True, True): 0, (False, True): 1, (True, False): 2}
+
+
+class _ChangedIds:
+    """
+    Identificadores de una lista o categoría: los del análisis anterior más las altas y bajas.
+    El arreglo anterior no se copia; solo se consulta con búsqueda binaria.
+    """
+    
+    __slots__ = ('_base', '_base_ids', 'added', 'removed', 'size')
+    
+    def __init__(self, base: Callable[[], array], size: int):
+        """
+        Inicializa los cambios vacíos.
+        
+        Args:
+            base: Devuelve los identificadores ordenados del análisis anterior (se pide al usarlos).
+            size: Tamaño en el análisis anterior.
+        """
+        self._base = base
+        self._base_ids: Optional[array] = None
+        self.added: Set[int] = set()
+        self.removed: Set[int] = set()
+        self.size = size
+    
+    def __contains__(self, user_id: int) -> bool:
+        if user_id in self.added:
+            return True
+        if user_id in self.removed:
+            return False
+        ids = self.base_ids()
+        index = bisect_left(ids, user_id)
+        return index < len(ids) and ids[index] == user_id
+    
+    def add(self, user_id: int):
+        """Registra un usuario que entró (no estaba)."""
+        if user_id in self.removed:
+            self.removed.discard(user_id)
+        else:
+            self.added.add(user_id)
+        self.size += 1
+    
+    def discard(self, user_id: int):
+        """Registra un usuario que salió (estaba)."""
+        if user_id in self.added:
+            self.added.discard(user_id)
+        else:
+            self.removed.add(user_id)
+        self.size -= 1
+    
+    def base_ids(self) -> array:
+        """Identificadores del análisis anterior."""
+        if self._base_ids is None:
+            self._base_ids = self._base()
+        return self._base_ids
+    
+    def ids(self, backend: IdSetBackend) -> array:
+        """
+        Arma los identificadores actuales, ordenados.
+        
+        Args:
+            backend: Motor de conjuntos con el que aplicar los cambios.
+            
+        Returns:
+            array: Identificadores actuales.
+        """
+        ids = self.base_ids()
+        if self.removed:
+            ids = backend.subset_difference(ids, to_id_array(self.removed))
+        if self.added:
+            ids = backend.union(ids, to_id_array(self.added))
+        return ids
+
+
+class IncrementalFollowerAnalyzer:
+    """
+    Servicio para mantener al día un análisis de seguidores.
+    Siguiendo Single Responsibility Principle: solo aplica cambios a un análisis existente.
+    
+    Parte de un resultado anterior sin copiar sus listas: para cada lista y cada categoría
+    (mutuos, los que no te siguen de vuelta y los que no sigues de vuelta) guarda solo las
+    altas y bajas respecto de ese resultado, y consulta sus arreglos ordenados con búsqueda
+    binaria. Cada cambio mueve al usuario entre categorías y ajusta los tamaños, así que
+    aplicar cambios y pedir las estadísticas cuesta lo proporcional a los cambios y no al
+    tamaño de las listas. Solo al pedir una categoría o armar el resultado se recorren los
+    arreglos.
+    """
+    
+    def __init__(self, previous: FollowerAnalysisResult, set_backend: Optional[IdSetBackend] = None):
+        """
+        Inicializa el analizador a partir de un análisis anterior.
+        
+        Args:
+            previous: Resultado del que se parte. Su tabla de usuarios se sigue usando.
+            set_backend: Motor de conjuntos de los resultados. Por defecto se elige según el tamaño.
+        """
+        statistics = previous.statistics
+        self._users = previous.users
+        self._followers = _ChangedIds(lambda: previous.follower_ids, len(previous.follower_ids))
+        self._following = _ChangedIds(lambda: previous.following_ids, len(previous.following_ids))
+        self._categories = (
+            _ChangedIds(lambda: previous.mutual_follower_ids, statistics.mutual_followers),
+            _ChangedIds(lambda: previous.not_following_back_ids, statistics.not_following_back),
+            _ChangedIds(lambda: previous.not_followed_back_ids, statistics.not_followed_back)
+        )
+        self._set_backend = set_backend
+        self._statistics_calculator = StatisticsCalculator()
+    
+    def add_followers(self, batch: Iterable[Union[UserRecord, str]]):
+        """
+        Registra usuarios que empezaron a seguirte.
+        
+        Args:
+            batch: Usuarios (registros o nombres de usuario).
+        """
+        self._update(batch, follower=True)
+    
+    def remove_followers(self, batch: Iterable[Union[UserRecord, str]]):
+        """
+        Registra usuarios que te dejaron de seguir.
+        
+        Args:
+            batch: Usuarios (registros o nombres de usuario).
+        """
+        self._update(batch, follower=False)
+    
+    def add_following(self, batch: Iterable[Union[UserRecord, str]]):
+        """
+        Registra usuarios que empezaste a seguir.
+        
+        Args:
+            batch: Usuarios (registros o nombres de usuario).
+        """
+        self._update(batch, following=True)
+    
+    def remove_following(self, batch: Iterable[Union[UserRecord, str]]):
+        """
+        Registra usuarios que dejaste de seguir.
+        
+        Args:
+            batch: Usuarios (registros o nombres de usuario).
+        """
+        self._update(batch, following=False)
+    
+    def apply_diff(self, diff: 'SnapshotDiff'):
+        """
+        Aplica los cambios entre dos análisis, por ejemplo los de RunSnapshotStore.diff.
+        Con un RunDiff, los usuarios con identificador de Instagram se registran por su
+        identificador; el resto se busca por nombre en la tabla de usuarios.
+        
+        Args:
+            diff: Cambios desde el análisis del que partió este analizador.
+        """
+        user_ids = getattr(diff, 'user_ids', {})
+        
+        def records(names: Iterable[str]) -> list:
+            return [
+                UserRecord(user_ids[name], name) if user_ids.get(name, -1) >= 0 else name
+                for name in names
+            ]
+        
+        self.remove_followers(records(diff.lost_followers))
+        self.remove_following(records(diff.lost_following))
+        self.add_followers(records(diff.new_followers))
+        self.add_following(records(diff.new_following))
+    
+    @property
+    def statistics(self) -> FollowerStatistics:
+        """Estadísticas con los cambios aplicados hasta ahora, sin recorrer las listas."""
+        mutual, not_following_back, not_followed_back = self._categories
+        return self._statistics_calculator.calculate(
+            total_followers=self._followers.size,
+            total_following=self._following.size,
+            mutual_followers=mutual.size,
+            not_following_back=not_following_back.size,
+            not_followed_back=not_followed_back.size
+        )
+    
+    @property
+    def mutual_follower_ids(self) -> array:
+        """Identificadores de los seguidores mutuos."""
+        return self._categories[0].ids(self._backend())
+    
+    @property
+    def not_following_back_ids(self) -> array:
+        """Identificadores de los que sigues pero no te siguen."""
+        return self._categories[1].ids(self._backend())
+    
+    @property
+    def not_followed_back_ids(self) -> array:
+        """Identificadores de los que te siguen pero no sigues de vuelta."""
+        return self._categories[2].ids(self._backend())
+    
+    @property
+    def mutual_followers(self) -> Set[str]:
+        """Nombres de usuario de los seguidores mutuos."""
+        return self._users.usernames(self.mutual_follower_ids)
+    
+    @property
+    def not_following_back(self) -> Set[str]:
+        """Nombres de usuario de los que sigues pero no te siguen."""
+        return self._users.usernames(self.not_following_back_ids)
+    
+    @property
+    def not_followed_back(self) -> Set[str]:
+        """Nombres de usuario de los que te siguen pero no sigues de vuelta."""
+        return self._users.usernames(self.not_followed_back_ids)
+    
+    def analyze(self) -> FollowerAnalysisResult:
+        """
+        Arma el resultado con los cambios aplicados hasta ahora.
+        
+        Returns:
+            FollowerAnalysisResult: Resultado del análisis.
+        """
+        backend = self._backend()
+        return FollowerAnalysisResult(
+            follower_ids=self._followers.ids(backend),
+            following_ids=self._following.ids(backend),
+            users=self._users,
+            statistics=self.statistics,
+            set_backend=self._set_backend
+        )
+    
+    def _update(
+        self,
+        batch: Iterable[Union[UserRecord, str]],
+        follower: Optional[bool] = None,
+        following: Optional[bool] = None
+    ):
+        """
+        Cambia la presencia de un lote de usuarios en una lista y los mueve de categoría.
+        
+        Args:
+            batch: Usuarios (registros o nombres de usuario).
+            follower: Si te siguen (None si no cambia).
+            following: Si los sigues (None si no cambia).
+        """
+        for user in self._users.add_all(batch):
+            before = (user in self._followers, user in self._following)
+            after = (
+                before[0] if follower is None else follower,
+                before[1] if following is None else following
+            )
+            if after == before:
+                continue
+            
+            if after[0] != before[0]:
+                (self._followers.add if after[0] else self._followers.discard)(user)
+            if after[1] != before[1]:
+                (self._following.add if after[1] else self._following.discard)(user)
+            
+            old_category = _CATEGORIES.get(before)
+            if old_category is not None:
+                self._categories[old_category].discard(user)
+            new_category = _CATEGORIES.get(after)
+            if new_category is not None:
+                self._categories[new_category].add(user)
+    
+    def _backend(self) -> IdSetBackend:
+        """Motor de conjuntos (elegido por tamaño si no se indicó uno)."""
+        if self._set_backend is None:
+            self._set_backend = choose_set_backend(self._followers.size + self._following.size)
+        return self._set_backend
@@ -2,8 +2,23 @@
 Modelos de datos para el análisis de seguidores.
 """
 
+from array import array
 from dataclasses import dataclass
-from typing import Set
+from datetime import date
+from typing import TYPE_CHECKING, List, NamedTuple, Optional, Set
+
+if TYPE_CHECKING:
+    from .set_backends import IdSetBackend
+    from .user_table import UserTable
+
+
+class UserRecord(NamedTuple):
+    """
+    Usuario de Instagram tal como llega de una descarga.
+    El identificador numérico es estable aunque el usuario cambie de nombre.
+    """
+    user_id: int
+    username: str
 
 
 @dataclass
@@ -33,27 +48,210 @@ class FollowerStatistics:
         return (self.not_following_back / self.total_following) * 100
 
 
-@dataclass
+@dataclass(frozen=True)
+class DailyChurn:
+    """
+    Usuarios que entraron y salieron de una lista en un día.
+    """
+    day: date
+    gained: int
+    lost: int
+    
+    @property
+    def net(self) -> int:
+        """Variación neta del día."""
+        return self.gained - self.lost
+
+
+@dataclass(frozen=True)
+class ChurnStatistics:
+    """
+    Evolución de una lista (seguidores o seguidos) en un periodo: altas y bajas por día,
+    sumas móviles y retención de los usuarios que llegaron en el periodo.
+    """
+    kind: str                    # 'followers' o 'following'
+    days: List[DailyChurn]       # Un elemento por día del periodo, también los días sin cambios
+    rolling_days: int
+    rolling_gained: List[int]    # Altas de los últimos rolling_days días, para cada día
+    rolling_lost: List[int]
+    size_at_start: int           # Tamaño de la lista al empezar el periodo
+    retained: int                # Altas del periodo que siguen en la lista
+    
+    @property
+    def gained(self) -> int:
+        """Altas del periodo."""
+        return sum(day.gained for day in self.days)
+    
+    @property
+    def lost(self) -> int:
+        """Bajas del periodo."""
+        return sum(day.lost for day in self.days)
+    
+    @property
+    def net(self) -> int:
+        """Variación neta del periodo."""
+        return self.gained - self.lost
+    
+    @property
+    def rolling_net(self) -> List[int]:
+        """Variación neta de los últimos rolling_days días, para cada día."""
+        return [gained - lost for gained, lost in zip(self.rolling_gained, self.rolling_lost)]
+    
+    @property
+    def churn_percentage(self) -> float:
+        """Bajas del periodo respecto al tamaño inicial de la lista."""
+        if self.size_at_start == 0:
+            return 0.0
+        return (self.lost / self.size_at_start) * 100
+    
+    @property
+    def retention_percentage(self) -> float:
+        """Altas del periodo que siguen en la lista."""
+        if self.gained == 0:
+            return 0.0
+        return (self.retained / self.gained) * 100
+
+
+@dataclass(frozen=True)
+class AudienceOverlap:
+    """
+    Solapamiento de las audiencias (seguidores) de varias cuentas.
+    shared[i][j] es la cantidad de seguidores en común de las cuentas i y j; en la diagonal,
+    los seguidores de cada cuenta.
+    """
+    accounts: List[str]
+    shared: List[List[int]]
+    exclusive: List[int]         # Seguidores que no siguen a ninguna de las otras cuentas
+    reach: int                   # Usuarios distintos que siguen a alguna de las cuentas
+    seconds: float = 0.0
+    
+    def followers(self, i: int) -> int:
+        """Seguidores de la cuenta i."""
+        return self.shared[i][i]
+    
+    def jaccard(self, i: int, j: int) -> float:
+        """Índice de Jaccard de dos audiencias: en común respecto al total de ambas (0 a 1)."""
+        union = self.shared[i][i] + self.shared[j][j] - self.shared[i][j]
+        if union == 0:
+            return 0.0
+        return self.shared[i][j] / union
+    
+    def also_follow_percentage(self, i: int, j: int) -> float:
+        """Porcentaje de los seguidores de la cuenta i que también siguen a la cuenta j."""
+        if self.shared[i][i] == 0:
+            return 0.0
+        return (self.shared[i][j] / self.shared[i][i]) * 100
+    
+    def exclusive_percentage(self, i: int) -> float:
+        """Porcentaje de los seguidores de la cuenta i que no siguen a ninguna otra."""
+        if self.shared[i][i] == 0:
+            return 0.0
+        return (self.exclusive[i] / self.shared[i][i]) * 100
+
+
 class FollowerAnalysisResult:
     """
     Resultado del análisis de seguidores.
-    Contiene todos los datos del análisis.
+    Solo guarda las dos listas de origen, como arreglos ordenados de identificadores (8 bytes
+    por usuario); las categorías derivadas (mutuos, los que no te siguen de vuelta y los que no
+    sigues de vuelta) se calculan la primera vez que se piden y quedan en caché (las dos
+    últimas a partir de los mutuos). Las
+    estadísticas llegan ya calculadas, así que mostrar el resumen no construye ninguna lista.
+    Los nombres se resuelven con la tabla de usuarios compartida, sin copiarlos.
     """
-    followers: Set[str]
-    following: Set[str]
-    mutual_followers: Set[str]
-    not_following_back: Set[str]  # Te dejaron de seguir
-    not_followed_back: Set[str]   # No los sigues de vuelta
-    statistics: FollowerStatistics
+    
+    __slots__ = (
+        'follower_ids',
+        'following_ids',
+        'users',
+        'statistics',
+        '_set_backend',
+        '_mutual_follower_ids',
+        '_not_following_back_ids',
+        '_not_followed_back_ids'
+    )
+    
+    def __init__(
+        self,
+        follower_ids: array,
+        following_ids: array,
+        users: 'UserTable',
+        statistics: FollowerStatistics,
+        set_backend: Optional['IdSetBackend'] = None
+    ):
+        """
+        Inicializa el resultado.
+        
+        Args:
+            follower_ids: Identificadores de los seguidores, ordenados.
+            following_ids: Identificadores de los seguidos, ordenados.
+            users: Tabla de usuarios con sus nombres.
+            statistics: Estadísticas del análisis.
+            set_backend: Motor con el que calcular las categorías. Por defecto se elige según el tamaño.
+        """
+        self.follower_ids = follower_ids
+        self.following_ids = following_ids
+        self.users = users
+        self.statistics = statistics
+        self._set_backend = set_backend
+        self._mutual_follower_ids: Optional[array] = None
+        self._not_following_back_ids: Optional[array] = None
+        self._not_followed_back_ids: Optional[array] = None
+    
+    @property
+    def mutual_follower_ids(self) -> array:
+        """Identificadores de los seguidores mutuos."""
+        if self._mutual_follower_ids is None:
+            self._mutual_follower_ids = self._backend().intersection(self.follower_ids, self.following_ids)
+        return self._mutual_follower_ids
+    
+    @property
+    def not_following_back_ids(self) -> array:
+        """Identificadores de los que sigues pero no te siguen (te dejaron de seguir)."""
+        if self._not_following_back_ids is None:
+            self._not_following_back_ids = self._backend().subset_difference(self.following_ids, self.mutual_follower_ids)
+        return self._not_following_back_ids
+    
+    @property
+    def not_followed_back_ids(self) -> array:
+        """Identificadores de los que te siguen pero no sigues de vuelta."""
+        if self._not_followed_back_ids is None:
+            self._not_followed_back_ids = self._backend().subset_difference(self.follower_ids, self.mutual_follower_ids)
+        return self._not_followed_back_ids
+    
+    @property
+    def followers(self) -> Set[str]:
+        """Nombres de usuario de los seguidores."""
+        return self.users.usernames(self.follower_ids)
+    
+    @property
+    def following(self) -> Set[str]:
+        """Nombres de usuario de los seguidos."""
+        return self.users.usernames(self.following_ids)
+    
+    @property
+    def mutual_followers(self) -> Set[str]:
+        """Nombres de usuario de los seguidores mutuos."""
+        return self.users.usernames(self.mutual_follower_ids)
+    
+    @property
+    def not_following_back(self) -> Set[str]:
+        """Nombres de usuario que sigues pero no te siguen."""
+        return self.users.usernames(self.not_following_back_ids)
+    
+    @property
+    def not_followed_back(self) -> Set[str]:
+        """Nombres de usuario que te siguen pero no sigues."""
+        return self.users.usernames(self.not_followed_back_ids)
     
     def to_dict(self) -> dict:
         """Convierte el resultado a diccionario."""
         return {
-            'followers': sorted(list(self.followers)),
-            'following': sorted(list(self.following)),
-            'mutual_followers': sorted(list(self.mutual_followers)),
-            'not_following_back': sorted(list(self.not_following_back)),
-            'not_followed_back': sorted(list(self.not_followed_back)),
+            'followers': self.users.sorted_usernames(self.follower_ids),
+            'following': self.users.sorted_usernames(self.following_ids),
+            'mutual_followers': self.users.sorted_usernames(self.mutual_follower_ids),
+            'not_following_back': self.users.sorted_usernames(self.not_following_back_ids),
+            'not_followed_back': self.users.sorted_usernames(self.not_followed_back_ids),
             'statistics': {
                 'total_followers': self.statistics.total_followers,
                 'total_following': self.statistics.total_following,
@@ -64,3 +262,10 @@ class FollowerAnalysisResult:
                 'unfollowers_percentage': self.statistics.unfollowers_percentage
             }
         }
+    
+    def _backend(self) -> 'IdSetBackend':
+        """Motor de conjuntos del resultado (elegido por tamaño si no se indicó uno)."""
+        if self._set_backend is None:
+            from .set_backends import choose_set_backend
+            self._set_backend = choose_set_backend(len(self.follower_ids) + len(self.following_ids))
+        return self._set_backend
@@ -0,0 +1,187 @@
+"""
+Motores de operaciones de conjunto sobre identificadores de usuario.
+
+Las entradas y salidas son arreglos 'q' ordenados y sin repetidos, el formato de
+FollowerAnalysisResult, así que los resultados de distintos análisis se pueden
+combinar directamente con cualquier motor.
+"""
+
+import operator
+from abc import ABC, abstractmethod
+from array import array
+from itertools import chain, compress, islice
+from typing import Dict, Optional, Type
+from .user_table import to_id_array
+
+# Usuarios (seguidores + seguidos) a partir de los que se usan arreglos ordenados.
+# `python benchmark.py --set-backends`, ms del análisis completo (ordenar las dos listas y
+# calcular las tres categorías), mejor de varias ejecuciones:
+#
+#     usuarios      hash    sorted
+#         5000       3.6       4.3
+#        20000      22.1      21.0
+#        50000      65.7      56.5
+#       300000     437.4     374.2
+#      1000000    1703.5    1250.1
+#      2000000    5065.8    3331.2
+#
+# Por debajo de unos 10.000 gana set de Python; desde 20.000 la mezcla es siempre más rápida
+# (un 10-15% al principio, un 25-35% desde un millón). La diferencia general (no la de un
+# subconjunto) es el doble de lenta con la mezcla, pero el análisis no la usa.
+SORTED_ARRAY_THRESHOLD = 20_000
+
+
+class IdSetBackend(ABC):
+    """
+    Interfaz para motores de conjuntos de identificadores.
+    Siguiendo Open/Closed Principle: se pueden agregar motores sin modificar el analizador.
+    """
+    
+    name = ''
+    
+    @abstractmethod
+    def intersection(self, a: array, b: array) -> array:
+        """
+        Calcula los identificadores presentes en ambos arreglos.
+        
+        Args:
+            a: Arreglo ordenado.
+            b: Arreglo ordenado.
+            
+        Returns:
+            array: Intersección ordenada.
+        """
+        pass
+    
+    @abstractmethod
+    def union(self, a: array, b: array) -> array:
+        """
+        Calcula los identificadores presentes en alguno de los arreglos.
+        
+        Args:
+            a: Arreglo ordenado.
+            b: Arreglo ordenado.
+            
+        Returns:
+            array: Unión ordenada.
+        """
+        pass
+    
+    @abstractmethod
+    def difference(self, a: array, b: array) -> array:
+        """
+        Calcula los identificadores de 'a' que no están en 'b'.
+        
+        Args:
+            a: Arreglo ordenado.
+            b: Arreglo ordenado.
+            
+        Returns:
+            array: Diferencia ordenada.
+        """
+        pass
+    
+    def subset_difference(self, a: array, b: array) -> array:
+        """
+        Calcula a - b cuando b está contenido en a (p. ej. seguidores menos mutuos).
+        Los motores pueden aprovecharlo; por defecto es una diferencia normal.
+        
+        Args:
+            a: Arreglo ordenado.
+            b: Arreglo ordenado contenido en 'a'.
+            
+        Returns:
+            array: Diferencia ordenada.
+        """
+        return self.difference(a, b)
+
+
+class HashSetBackend(IdSetBackend):
+    """
+    Motor basado en set de Python: tablas hash y ordenación de cada resultado.
+    Es el más rápido con cuentas pequeñas (menos de unos 10.000 usuarios).
+    """
+    
+    name = 'hash'
+    
+    def intersection(self, a: array, b: array) -> array:
+        return to_id_array(set(a).intersection(b))
+    
+    def union(self, a: array, b: array) -> array:
+        return to_id_array(set(a).union(b))
+    
+    def difference(self, a: array, b: array) -> array:
+        return to_id_array(set(a).difference(b))
+
+
+class SortedArrayBackend(IdSetBackend):
+    """
+    Motor basado en mezcla de arreglos ordenados.
+    Ordenar la concatenación de dos arreglos ordenados es una mezcla lineal (Timsort detecta
+    las dos secuencias), y los repetidos se detectan comparando cada valor con el siguiente
+    con map/compress, todo en C sin crear conjuntos intermedios. Solo se ordenan las dos
+    listas de entrada: las categorías salen ya ordenadas de la mezcla.
+    Sin dependencias nativas no hay una mezcla vectorizada: un bucle de mezcla con dos
+    índices en Python tarda un 45% más que Timsort en la intersección de un millón de usuarios.
+    """
+    
+    name = 'sorted'
+    
+    def intersection(self, a: array, b: array) -> array:
+        merged = sorted(chain(a, b))
+        return array('q', compress(merged, map(operator.eq, merged, islice(merged, 1, None))))
+    
+    def union(self, a: array, b: array) -> array:
+        merged = sorted(chain(a, b))
+        return array('q', compress(merged, map(operator.ne, merged, chain(islice(merged, 1, None), (None,)))))
+    
+    def difference(self, a: array, b: array) -> array:
+        return self.subset_difference(a, self.intersection(a, b))
+    
+    def subset_difference(self, a: array, b: array) -> array:
+        # Al mezclar a con un subconjunto suyo, lo que queda sin pareja es la diferencia
+        if not b:
+            return array('q', a)
+        merged = sorted(chain(a, b))
+        unlike_next = map(operator.ne, merged, chain(islice(merged, 1, None), (None,)))
+        unlike_previous = map(operator.ne, merged, chain((None,), merged))
+        return array('q', compress(merged, map(operator.and_, unlike_next, unlike_previous)))
+
+
+SET_BACKENDS: Dict[str, Type[IdSetBackend]] = {
+    HashSetBackend.name: HashSetBackend,
+    SortedArrayBackend.name: SortedArrayBackend
+}
+
+
+def get_set_backend(name: str) -> Optional[IdSetBackend]:
+    """
+    Crea un motor de conjuntos por nombre.
+    
+    Args:
+        name: 'hash', 'sorted' o 'auto'.
+        
+    Returns:
+        Optional[IdSetBackend]: El motor, o None con 'auto' (se elige según el tamaño).
+        
+    Raises:
+        ValueError: Si el motor no existe.
+    """
+    if name == 'auto':
+        return None
+    if name not in SET_BACKENDS:
+        raise ValueError(f"Motor de conjuntos desconocido: {name}")
+    return SET_BACKENDS[name]()
+
+
+def choose_set_backend(size: int) -> IdSetBackend:
+    """
+    Elige el motor más rápido para un análisis.
+    
+    Args:
+        size: Seguidores más seguidos.
+        
+    Returns:
+        IdSetBackend: Conjuntos de Python por debajo de SORTED_ARRAY_THRESHOLD, arreglos ordenados por encima.
+    """
+    return SortedArrayBackend() if size >= SORTED_ARRAY_THRESHOLD else HashSetBackend()
@@ -2,7 +2,11 @@
 Calculadora de estadísticas.
 """
 
-from .models import FollowerStatistics
+from collections import Counter
+from datetime import date, datetime, timedelta
+from itertools import accumulate
+from typing import Iterable
+from .models import ChurnStatistics, DailyChurn, FollowerStatistics
 
 
 class StatisticsCalculator:
@@ -39,3 +43,54 @@ class StatisticsCalculator:
             not_following_back=not_following_back,
             not_followed_back=not_followed_back
         )
+    
+    def calculate_churn(
+        self,
+        kind: str,
+        start: date,
+        end: date,
+        gained_at: Iterable[float],
+        lost_at: Iterable[float],
+        size_at_start: int,
+        retained: int,
+        rolling_days: int = 7
+    ) -> ChurnStatistics:
+        """
+        Calcula la evolución diaria de una lista a partir de los momentos de cada alta y baja.
+        El costo depende de los cambios del periodo, no del tamaño de la lista.
+        
+        Args:
+            kind: Lista analizada ('followers' o 'following').
+            start: Primer día del periodo.
+            end: Último día del periodo.
+            gained_at: Momento de cada alta (time.time()).
+            lost_at: Momento de cada baja (time.time()).
+            size_at_start: Tamaño de la lista al empezar el periodo.
+            retained: Altas del periodo que siguen en la lista.
+            rolling_days: Días de la ventana de las sumas móviles.
+            
+        Returns:
+            ChurnStatistics: Altas, bajas y sumas móviles por día.
+        """
+        gained = Counter(datetime.fromtimestamp(moment).date() for moment in gained_at)
+        lost = Counter(datetime.fromtimestamp(moment).date() for moment in lost_at)
+        days = [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+        daily_gained = [gained[day] for day in days]
+        daily_lost = [lost[day] for day in days]
+        
+        return ChurnStatistics(
+            kind=kind,
+            days=[DailyChurn(day, day_gained, day_lost)
+                  for day, day_gained, day_lost in zip(days, daily_gained, daily_lost)],
+            rolling_days=rolling_days,
+            rolling_gained=_rolling_sum(daily_gained, rolling_days),
+            rolling_lost=_rolling_sum(daily_lost, rolling_days),
+            size_at_start=size_at_start,
+            retained=retained
+        )
+
+
+def _rolling_sum(values: list, window: int) -> list:
+    """Suma de los últimos 'window' valores para cada posición (con sumas acumuladas)."""
+    totals = list(accumulate(values, initial=0))
+    return [totals[end] - totals[max(0, end - window)] for end in range(1, len(totals))]
@@ -0,0 +1,156 @@
+"""
+Tabla de usuarios: identificador numérico de Instagram → nombre de usuario.
+"""
+
+import hashlib
+from array import array
+from typing import Dict, Iterable, List, Optional, Set, Union
+from .models import UserRecord
+
+
+def to_id_array(user_ids: Iterable[int]) -> array:
+    """
+    Convierte identificadores a un arreglo compacto de enteros de 64 bits ordenado.
+    
+    Args:
+        user_ids: Identificadores de usuario.
+        
+    Returns:
+        array: Arreglo 'q' ordenado (8 bytes por usuario).
+    """
+    return array('q', sorted(user_ids))
+
+
+def _synthetic_id(username: str) -> int:
+    """
+    Calcula el identificador sintético de un nombre de usuario.
+    Depende solo del nombre, así que es el mismo en cualquier ejecución y orden de lectura.
+    
+    Args:
+        username: Nombre de usuario.
+        
+    Returns:
+        int: Identificador negativo de 56 bits.
+    """
+    digest = hashlib.blake2b(username.encode('utf-8'), digest_size=7).digest()
+    return -1 - int.from_bytes(digest, 'little')
+
+
+class UserTable:
+    """
+    Tabla única identificador → nombre de usuario compartida por todo el análisis.
+    Los conjuntos y resultados guardan solo enteros; el nombre se resuelve aquí al mostrar.
+    El identificador de Instagram no cambia cuando alguien se renombra, así que un cambio de
+    nombre solo actualiza la entrada de la tabla.
+    Los usuarios sin identificador conocido (datos antiguos o exportaciones) reciben
+    identificadores sintéticos negativos calculados a partir del nombre: el mismo nombre
+    recibe el mismo identificador en cualquier ejecución, así que las instantáneas y las
+    comparaciones entre cuentas coinciden.
+    """
+    
+    def __init__(self):
+        """Inicializa una tabla vacía."""
+        self._names: Dict[int, str] = {}
+        self._ids_by_name: Optional[Dict[str, int]] = None
+    
+    def add(self, user_id: int, username: str) -> int:
+        """
+        Registra un usuario o actualiza su nombre.
+        
+        Args:
+            user_id: Identificador numérico de Instagram.
+            username: Nombre de usuario actual.
+            
+        Returns:
+            int: El identificador registrado.
+        """
+        self._names[user_id] = username
+        if self._ids_by_name is not None:
+            self._ids_by_name[username] = user_id
+        return user_id
+    
+    def id_for(self, username: str) -> int:
+        """
+        Obtiene el identificador de un nombre de usuario, asignando uno sintético si no se conoce.
+        
+        Args:
+            username: Nombre de usuario.
+            
+        Returns:
+            int: Identificador del usuario.
+        """
+        if self._ids_by_name is None:
+            self._ids_by_name = {name: user_id for user_id, name in self._names.items()}
+        
+        user_id = self._ids_by_name.get(username)
+        if user_id is None:
+            # Colisión con otro nombre (improbable con 56 bits): se prueba el siguiente
+            user_id = _synthetic_id(username)
+            while user_id in self._names:
+                user_id -= 1
+            self.add(user_id, username)
+        return user_id
+    
+    def add_all(self, users: Iterable[Union[UserRecord, str]]) -> List[int]:
+        """
+        Registra un lote de usuarios.
+        
+        Args:
+            users: Registros (identificador, nombre) o nombres de usuario sueltos.
+            
+        Returns:
+            List[int]: Identificadores en el mismo orden.
+        """
+        ids = []
+        for user in users:
+            if isinstance(user, str):
+                ids.append(self.id_for(user))
+            else:
+                ids.append(self.add(user.user_id, user.username))
+        return ids
+    
+    def username(self, user_id: int) -> str:
+        """
+        Obtiene el nombre de usuario de un identificador.
+        
+        Args:
+            user_id: Identificador del usuario.
+            
+        Returns:
+            str: Nombre de usuario.
+        """
+        return self._names[user_id]
+    
+    def usernames(self, user_ids: Iterable[int]) -> Set[str]:
+        """
+        Resuelve un conjunto de identificadores a nombres de usuario.
+        
+        Args:
+            user_ids: Identificadores de usuario.
+            
+        Returns:
+            Set[str]: Nombres de usuario.
+        """
+        names = self._names
+        return {names[user_id] for user_id in user_ids}
+    
+    def sorted_usernames(self, user_ids: Iterable[int]) -> List[str]:
+        """
+        Resuelve identificadores a nombres de usuario en orden alfabético.
+        
+        Cada identificador aparece una sola vez en las listas del análisis, así que
+        se ordenan los nombres directamente, sin pasar por un conjunto intermedio.
+        
+        Args:
+            user_ids: Identificadores de usuario sin repetir.
+            
+        Returns:
+            List[str]: Nombres de usuario ordenados.
+        """
+        return sorted(map(self._names.__getitem__, user_ids))
+    
+    def __len__(self) -> int:
+        return len(self._names)
+    
+    def __contains__(self, user_id: int) -> bool:
+        return user_id in self._names
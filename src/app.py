@@ -3,20 +3,48 @@ Aplicación principal del analizador de Instagram.
 Implementa el patrón de Fachada e inyección de dependencias.
 """
 
-import sys
-import instaloader
+import time
+from array import array
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
 from .auth import (
     IAuthenticationProvider,
     InstaloaderSessionManager,
     CookieAuthProvider,
-    SavedSessionAuthProvider
+    SavedSessionAuthProvider,
+    ProfileCache,
+    SessionPool,
+    PooledAuthProvider,
+    HTTPTransport
+)
+from .data import (
+    IInstagramRepository,
+    InstagramRepository,
+    IncrementalInstagramRepository,
+    ConcurrentRelationsFetcher,
+    CrawlCheckpointStore,
+    RelationSnapshotStore,
+    AdaptiveRateLimiter,
+    GraphQLPageSize,
+    InstagramExportRepository,
+    ProfileMetadataCache,
+    ProfileEnricher
+)
+from .analysis import AudienceOverlapCalculator, FollowerAnalyzer, FollowerAnalysisResult, get_set_backend
+from .batch import BatchJobLoader, BatchRunner, SessionScheduler
+from .storage import RunSnapshotStore, BinarySnapshot
+from .utils import (
+    FileManager,
+    TextReportExporter,
+    JSONReportExporter,
+    UnfollowersListExporter,
+    BinarySnapshotExporter,
+    BatchSummaryExporter,
+    AudienceOverlapExporter,
+    ConfigLoader
 )
-from .data import InstagramRepository
-from .analysis import FollowerAnalyzer
-from .utils import FileManager, TextReportExporter, JSONReportExporter, UnfollowersListExporter
 from .ui import ConsolePrinter, InputValidator, MenuManager, MenuItem
 
 
@@ -27,17 +55,46 @@ class InstagramAnalyzerApp:
     Utiliza inyección de dependencias para cumplir con Dependency Inversion Principle.
     """
     
-    def __init__(self, base_directory: Optional[Path] = None):
+    def __init__(
+        self,
+        base_directory: Optional[Path] = None,
+        config_path: Optional[Path] = None,
+        config: Optional[ConfigLoader] = None
+    ):
         """
         Inicializa la aplicación.
         
         Args:
             base_directory: Directorio base de trabajo.
+            config_path: Ruta a config.yaml. Por defecto la del proyecto.
+            config: Cargador de configuración a usar en lugar de leer config_path.
         """
         self.base_directory = base_directory or Path.cwd()
         
         # Inicializar componentes
-        self._session_manager = InstaloaderSessionManager(self.base_directory)
+        self._config = config or ConfigLoader(config_path)
+        self._instagram_settings = self._config.get_instagram_settings()
+        self._analysis_settings = self._config.get_analysis_settings()
+        self._enrichment_settings = self._config.get_enrichment_settings()
+        self._transport = HTTPTransport(
+            timeout=self._instagram_settings.timeout,
+            pool_size=self._instagram_settings.connection_pool_size,
+            compression=self._instagram_settings.compression
+        )
+        self._session_manager = InstaloaderSessionManager(self.base_directory, transport=self._transport)
+        self._page_size = GraphQLPageSize(self._instagram_settings.page_size)
+        self._profile_cache = ProfileCache()
+        self._checkpoint_store = CrawlCheckpointStore(self.base_directory / ".crawl_checkpoints")
+        self._relation_snapshots = RelationSnapshotStore(self.base_directory / ".snapshots")
+        self._profile_metadata = ProfileMetadataCache(
+            self.base_directory / ".profile_metadata.json",
+            self._enrichment_settings.ttl_seconds
+        )
+        self._run_history = RunSnapshotStore(
+            self.base_directory / ".history.sqlite3",
+            checkpoint_every=self._analysis_settings.history_checkpoint_every
+        )
+        self._set_backend = get_set_backend(self._analysis_settings.set_backend)
         self._file_manager = FileManager(self.base_directory)
         self._printer = ConsolePrinter()
         self._validator = InputValidator()
@@ -53,15 +110,28 @@ class InstagramAnalyzerApp:
             MenuItem("Crear sesión desde cookies del navegador", self._create_session_from_cookies),
             MenuItem("Cargar sesión guardada", self._load_saved_session),
             MenuItem("Analizar seguidores", self._analyze_followers),
+            MenuItem("Analizar exportación de Instagram (sin conexión)", self._analyze_export),
+            MenuItem("Consultar historial de análisis", self._show_history_menu),
             MenuItem("Salir", lambda: None)
         ]
         self._menu_manager.register_menu("main", main_menu_items)
         
+        # Menú del historial
+        history_menu_items = [
+            MenuItem("Ver análisis guardados de una cuenta", self._show_runs),
+            MenuItem("Comparar dos análisis", self._compare_runs),
+            MenuItem("Buscar un usuario en el historial", self._show_user_presence),
+            MenuItem("Ver evolución de seguidores (últimos 90 días)", self._show_churn),
+            MenuItem("Volver", lambda: None)
+        ]
+        self._menu_manager.register_menu("history", history_menu_items)
+        
         # Menú de exportación
         export_menu_items = [
             MenuItem("Exportar reporte completo (TXT)", self._export_text_report),
             MenuItem("Exportar reporte completo (JSON)", self._export_json_report),
             MenuItem("Exportar solo lista de unfollowers", self._export_unfollowers_list),
+            MenuItem("Exportar instantánea binaria (.igsnap)", self._export_binary_snapshot),
             MenuItem("No exportar", lambda: None)
         ]
         self._menu_manager.register_menu("export", export_menu_items)
@@ -75,7 +145,7 @@ class InstagramAnalyzerApp:
             while True:
                 option = self._menu_manager.show_menu("main", "🔐 MENÚ PRINCIPAL")
                 
-                if option is None or option == 4:
+                if option is None or option == 6:
                     self._printer.print_success("¡Hasta pronto!")
                     break
                 
@@ -88,6 +158,187 @@ class InstagramAnalyzerApp:
             import traceback
             traceback.print_exc()
     
+    def run_batch(self, jobs_file: Path, max_workers: Optional[int] = None) -> bool:
+        """
+        Analiza todas las cuentas de un archivo sin menú interactivo.
+        
+        Args:
+            jobs_file: Archivo con una cuenta por línea y, opcionalmente, la sesión a usar.
+            max_workers: Cuentas analizadas a la vez. Por defecto el valor de config.yaml.
+            
+        Returns:
+            bool: True si todas las cuentas se analizaron correctamente.
+        """
+        try:
+            jobs = BatchJobLoader.load(jobs_file)
+        except (OSError, ValueError) as e:
+            self._printer.print_error(f"No se pudo leer {jobs_file}: {e}")
+            return False
+        
+        if not jobs:
+            self._printer.print_warning(f"{jobs_file} no contiene cuentas")
+            return False
+        
+        settings = self._config.get_batch_settings()
+        runner = BatchRunner(
+            self._create_batch_auth_provider,
+            self._create_repository,
+            self._get_data_source,
+            SessionScheduler(
+                max_workers=max_workers or settings.max_workers,
+                jobs_per_session=settings.jobs_per_session
+            ),
+            history=self._run_history if self._analysis_settings.keep_history else None,
+            set_backend=self._set_backend
+        )
+        
+        self._printer.print_header(f"📦 ANÁLISIS POR LOTES: {len(jobs)} CUENTAS")
+        report = runner.run(jobs)
+        
+        self._printer.print_batch_summary(report)
+        self._printer.print_transport_statistics(self._transport.stats)
+        BatchSummaryExporter(self._file_manager).export(report)
+        
+        audiences = {
+            job_result.job.target.lower(): job_result.result.follower_ids
+            for job_result in report.results if job_result.succeeded
+        }
+        if len(audiences) >= 2:
+            self._show_audience_overlap(audiences)
+        return report.failed == 0
+    
+    def compact_history(self) -> bool:
+        """
+        Aplica la política de retención al historial y muestra el espacio liberado (mantenimiento).
+        
+        Returns:
+            bool: True si se compactó correctamente.
+        """
+        settings = self._analysis_settings
+        self._printer.print_info(
+            f"Conservando todos los análisis de los últimos {settings.history_keep_all_days} días, "
+            f"uno por día hasta {settings.history_keep_daily_days} días y uno por semana antes..."
+        )
+        try:
+            report = self._run_history.compact(
+                keep_all_days=settings.history_keep_all_days,
+                keep_daily_days=settings.history_keep_daily_days
+            )
+        except Exception as e:
+            self._printer.print_error(f"No se pudo compactar el historial: {e}")
+            return False
+        
+        self._printer.print_compaction_report(report)
+        return True
+    
+    def compare_snapshots(self, before: Path, after: Path) -> bool:
+        """
+        Compara dos instantáneas binarias (.igsnap) sin menú interactivo ni conexión.
+        
+        Args:
+            before: Instantánea anterior.
+            after: Instantánea posterior.
+            
+        Returns:
+            bool: True si ambas instantáneas se pudieron leer.
+        """
+        try:
+            with BinarySnapshot(before) as old, BinarySnapshot(after) as new:
+                if old.account and new.account and old.account != new.account:
+                    self._printer.print_warning(f"Las instantáneas son de cuentas distintas: "
+                                                f"@{old.account} y @{new.account}")
+                
+                start = time.monotonic()
+                diff = old.diff(new)
+                elapsed = time.monotonic() - start
+                
+                account = f"@{new.account}: " if new.account else ""
+                before_date = datetime.fromtimestamp(old.created_at).strftime('%Y-%m-%d %H:%M')
+                after_date = datetime.fromtimestamp(new.created_at).strftime('%Y-%m-%d %H:%M')
+                self._printer.print_snapshot_diff(f"🔄 {account}{before_date} → {after_date}", diff)
+                self._printer.print_info(f"{old.follower_count} → {new.follower_count} seguidores, "
+                                         f"{old.following_count} → {new.following_count} seguidos "
+                                         f"(comparado en {elapsed * 1000:.0f} ms)")
+        except (OSError, ValueError) as e:
+            self._printer.print_error(f"No se pudo leer la instantánea: {e}")
+            return False
+        
+        return True
+    
+    def audience_overlap(self, sources: List[str]) -> bool:
+        """
+        Compara las audiencias de varias cuentas sin menú interactivo ni conexión.
+        
+        Args:
+            sources: Cuentas con análisis guardados en el historial o instantáneas binarias (.igsnap).
+            
+        Returns:
+            bool: True si se pudieron leer al menos dos audiencias.
+        """
+        audiences: Dict[str, array] = {}
+        for source in sources:
+            path = Path(source)
+            if path.suffix == '.igsnap':
+                try:
+                    with BinarySnapshot(path) as snapshot:
+                        audiences[snapshot.account or path.stem] = snapshot.follower_ids
+                except (OSError, ValueError) as e:
+                    self._printer.print_error(f"No se pudo leer la instantánea {path}: {e}")
+                    return False
+            else:
+                follower_ids = self._run_history.current_member_ids(source)
+                if follower_ids is None:
+                    self._printer.print_error(f"No hay análisis guardados de @{source}")
+                    return False
+                audiences[source.lower()] = follower_ids
+        
+        if len(audiences) < 2:
+            self._printer.print_warning("Se necesitan al menos dos cuentas distintas para comparar audiencias")
+            return False
+        
+        self._show_audience_overlap(audiences)
+        return True
+    
+    def _show_audience_overlap(self, audiences: Dict[str, array]):
+        """
+        Calcula, muestra y exporta el solapamiento de varias audiencias.
+        
+        Args:
+            audiences: Identificadores ordenados de los seguidores de cada cuenta.
+        """
+        overlap = AudienceOverlapCalculator().calculate(audiences)
+        self._printer.print_audience_overlap(overlap)
+        AudienceOverlapExporter(self._file_manager).export(overlap)
+    
+    def _create_batch_auth_provider(self, session: str) -> IAuthenticationProvider:
+        """
+        Crea el proveedor de autenticación de una sesión del modo por lotes.
+        
+        Args:
+            session: Usuario de una sesión guardada o nombre de un grupo de session_pool.
+            
+        Returns:
+            IAuthenticationProvider: Proveedor sin autenticar todavía.
+        """
+        pool_settings = self._config.get_session_pool_settings()
+        usernames = pool_settings.pools.get(session)
+        if not usernames:
+            return SavedSessionAuthProvider(
+                self._session_manager,
+                session,
+                profile_cache=self._profile_cache
+            )
+        
+        pool = SessionPool.from_saved_sessions(
+            self._session_manager,
+            usernames,
+            strategy=pool_settings.strategy,
+            delay=self._instagram_settings.rate_limit_delay,
+            cooldown_seconds=pool_settings.cooldown_seconds
+        )
+        print(f"   Grupo '{session}': {pool.size} sesiones ({pool_settings.strategy})")
+        return PooledAuthProvider(pool)
+    
     def _create_session_from_cookies(self):
         """Crea una sesión desde cookies del navegador."""
         self._printer.print_cookie_instructions()
@@ -103,14 +354,20 @@ class InstagramAnalyzerApp:
         try:
             self._printer.print_section("\n🔐 Autenticando...")
             
-            auth_provider = CookieAuthProvider(self._session_manager, username, sessionid)
+            auth_provider = CookieAuthProvider(
+                self._session_manager,
+                username,
+                sessionid,
+                profile_cache=self._profile_cache,
+                transport=self._transport
+            )
             
             if auth_provider.authenticate():
                 self._auth_provider = auth_provider
                 
                 # Verificar sesión
                 loader = auth_provider.get_loader()
-                profile = instaloader.Profile.from_username(loader.context, username)
+                profile = self._profile_cache.get_profile(loader.context, username)
                 
                 self._printer.print_verification_message(
                     username,
@@ -119,7 +376,7 @@ class InstagramAnalyzerApp:
                 )
                 
                 # Crear repositorio
-                self._repository = InstagramRepository(auth_provider)
+                self._repository = self._create_repository(auth_provider)
                 
                 self._printer.print_success("Sesión creada y guardada exitosamente")
             else:
@@ -139,14 +396,18 @@ class InstagramAnalyzerApp:
         try:
             self._printer.print_section("\n🔐 Cargando sesión...")
             
-            auth_provider = SavedSessionAuthProvider(self._session_manager, username)
+            auth_provider = SavedSessionAuthProvider(
+                self._session_manager,
+                username,
+                profile_cache=self._profile_cache
+            )
             
             if auth_provider.authenticate():
                 self._auth_provider = auth_provider
                 
                 # Verificar sesión
                 loader = auth_provider.get_loader()
-                profile = instaloader.Profile.from_username(loader.context, username)
+                profile = self._profile_cache.get_profile(loader.context, username)
                 
                 self._printer.print_verification_message(
                     username,
@@ -155,7 +416,7 @@ class InstagramAnalyzerApp:
                 )
                 
                 # Crear repositorio
-                self._repository = InstagramRepository(auth_provider)
+                self._repository = self._create_repository(auth_provider)
                 
                 self._printer.print_success("Sesión cargada exitosamente")
             else:
@@ -166,6 +427,60 @@ class InstagramAnalyzerApp:
             self._auth_provider = None
             self._repository = None
     
+    def _create_repository(self, auth_provider: IAuthenticationProvider) -> InstagramRepository:
+        """
+        Crea el repositorio de datos para un proveedor autenticado.
+        
+        Args:
+            auth_provider: Proveedor de autenticación ya autenticado.
+            
+        Returns:
+            InstagramRepository: Repositorio listo para descargar datos.
+        """
+        settings = self._instagram_settings
+        delay = settings.rate_limit_delay
+        if isinstance(auth_provider, PooledAuthProvider):
+            # Cada sesión del grupo ya espera su propio intervalo; el total crece con el grupo
+            delay /= auth_provider.pool.size
+        
+        rate_limiter = AdaptiveRateLimiter(
+            delay=delay,
+            min_delay=settings.min_rate_limit_delay,
+            max_retries=settings.max_retries,
+            adaptive=settings.adaptive_rate_limit
+        )
+        return InstagramRepository(
+            auth_provider,
+            profile_cache=self._profile_cache,
+            checkpoint_store=self._checkpoint_store,
+            rate_limiter=rate_limiter,
+            transport=self._transport,
+            prefetch_depth=settings.prefetch_pages,
+            page_size=self._page_size
+        )
+    
+    def _get_data_source(self, repository: Optional[InstagramRepository] = None) -> IInstagramRepository:
+        """
+        Obtiene la fuente de datos para el análisis según la configuración.
+        
+        Args:
+            repository: Repositorio a envolver. Por defecto el de la sesión actual.
+            
+        Returns:
+            IInstagramRepository: Repositorio incremental o el repositorio directo.
+        """
+        repository = repository or self._repository
+        if not self._analysis_settings.incremental_sync:
+            return repository
+        
+        return IncrementalInstagramRepository(
+            repository,
+            self._relation_snapshots,
+            stop_after_known=self._analysis_settings.incremental_stop_after,
+            full_sync_every=self._analysis_settings.incremental_full_sync_every,
+            full_sync_days=self._analysis_settings.incremental_full_sync_days
+        )
+    
     def _analyze_followers(self):
         """Analiza los seguidores del usuario autenticado."""
         if not self._auth_provider or not self._auth_provider.is_authenticated():
@@ -186,42 +501,263 @@ class InstagramAnalyzerApp:
             username = self._auth_provider.get_username()
             self._printer.print_section(f"\n📊 Analizando cuenta @{username}...")
             
-            # Obtener datos
-            followers = self._repository.get_followers()
-            following = self._repository.get_following()
-            
-            if not followers and not following:
-                self._printer.print_error("No se pudieron obtener los datos")
-                return
+            # Obtener datos (seguidores y seguidos en paralelo); el análisis avanza con cada lote
+            started_at = time.time()
+            start = time.monotonic()
+            analyzer = self._stream_into_analyzer(self._get_data_source())
+            crawl_seconds = time.monotonic() - start
             
             # Realizar análisis
             self._printer.print_section("\n🔍 Analizando datos...")
-            analyzer = FollowerAnalyzer(followers, following)
             result = analyzer.analyze()
+            analysis_seconds = time.monotonic() - start - crawl_seconds
             
-            # Mostrar resumen
-            self._printer.print_analysis_summary(result)
+            users = result.statistics.total_followers + result.statistics.total_following
+            self._printer.print_rate_limit_statistics(self._repository.rate_limiter.stats, users)
+            self._printer.print_transport_statistics(self._transport.stats)
             
-            # Guardar resultado para exportación
-            self._last_analysis_result = result
+            if not result.statistics.total_followers and not result.statistics.total_following:
+                self._printer.print_error("No se pudieron obtener los datos")
+                return
             
-            # Preguntar si desea exportar
-            print("")
-            if self._validator.get_yes_no_confirmation("¿Deseas exportar los resultados?", default=True):
-                self._show_export_menu()
+            self._record_run(username, result, started_at, crawl_seconds, analysis_seconds, 'instagram')
             
-            self._printer.print_success("\nAnálisis completado exitosamente!")
+            # Mostrar resumen
+            self._printer.print_analysis_summary(result)
+            self._printer.print_cache_statistics(self._profile_cache.hits, self._profile_cache.misses)
+            self._offer_enrichment(result)
+            self._offer_export(result, username)
             
         except Exception as e:
             self._printer.print_error(f"Error durante el análisis: {e}")
             import traceback
             traceback.print_exc()
     
+    def _offer_enrichment(self, result: FollowerAnalysisResult):
+        """
+        Ofrece consultar nombre, seguidores y privacidad de quienes no te siguen de vuelta,
+        para que los reportes los incluyan.
+        
+        Args:
+            result: Resultado del análisis.
+        """
+        if not result.statistics.not_following_back:
+            return
+        
+        if not self._validator.get_yes_no_confirmation(
+            f"\n¿Obtener nombre, seguidores y privacidad de los {result.statistics.not_following_back} "
+            "usuarios que no te siguen de vuelta?",
+            default=False
+        ):
+            return
+        
+        enricher = ProfileEnricher(
+            self._repository,
+            self._profile_metadata,
+            max_workers=self._enrichment_settings.max_workers
+        )
+        self._printer.print_enrichment_statistics(enricher.enrich(result.not_following_back))
+    
+    def _analyze_export(self):
+        """Analiza la exportación de datos de Instagram (archivo .zip o carpeta), sin conexión."""
+        self._printer.print_info("En Instagram: Configuración → Tu actividad → Descargar tu información, formato JSON\n")
+        path = self._validator.get_non_empty_string("Ruta del archivo .zip o de la carpeta descomprimida: ")
+        if not path:
+            return
+        
+        try:
+            repository = InstagramExportRepository(Path(path.strip().strip('"\'')).expanduser())
+            owner = repository.owner
+            self._printer.print_section(f"\n📊 Analizando exportación{f' de @{owner}' if owner else ''}...")
+            
+            # Los archivos se leen uno tras otro: sin red, leerlos en paralelo no acorta el tiempo
+            started_at = time.time()
+            start = time.monotonic()
+            analyzer = self._stream_into_analyzer(repository, concurrent=False)
+            crawl_seconds = time.monotonic() - start
+            
+            self._printer.print_section("\n🔍 Analizando datos...")
+            result = analyzer.analyze()
+            analysis_seconds = time.monotonic() - start - crawl_seconds
+            
+            if not result.statistics.total_followers and not result.statistics.total_following:
+                self._printer.print_error("La exportación no contiene seguidores ni seguidos")
+                return
+            
+            if owner:
+                # Sin el dueño no se sabe a qué cuenta pertenece la ejecución
+                self._record_run(owner, result, started_at, crawl_seconds, analysis_seconds, 'export')
+            
+            self._printer.print_analysis_summary(result)
+            self._offer_export(result, owner or '')
+            
+        except (OSError, ValueError) as e:
+            self._printer.print_error(f"No se pudo leer la exportación: {e}")
+    
+    def _record_run(
+        self,
+        account: str,
+        result: FollowerAnalysisResult,
+        started_at: float,
+        crawl_seconds: float,
+        analysis_seconds: float,
+        source: str
+    ):
+        """
+        Guarda el análisis en el historial si está activado en la configuración.
+        
+        Args:
+            account: Cuenta analizada.
+            result: Resultado del análisis.
+            started_at: Momento en que empezó la descarga (time.time()).
+            crawl_seconds: Segundos de descarga.
+            analysis_seconds: Segundos de análisis.
+            source: Origen de los datos ('instagram' o 'export').
+        """
+        if not self._analysis_settings.keep_history:
+            return
+        
+        try:
+            run = self._run_history.record_run(
+                account,
+                result,
+                started_at=started_at,
+                crawl_seconds=crawl_seconds,
+                analysis_seconds=analysis_seconds,
+                source=source
+            )
+            self._printer.print_info(f"Análisis guardado en el historial (#{run.run_id}, {run.store_seconds:.1f}s)")
+            
+            runs = self._run_history.runs(account)
+            if len(runs) > 1:
+                self._printer.print_run_diff(self._run_history.diff(runs[-2].run_id, run.run_id))
+        except Exception as e:
+            self._printer.print_error(f"No se pudo guardar el análisis en el historial: {e}")
+    
+    def _show_history_menu(self):
+        """Muestra el menú del historial de análisis."""
+        option = self._menu_manager.show_menu("history", "\n🗄️  HISTORIAL DE ANÁLISIS")
+        
+        if option and option != 5:
+            self._menu_manager.execute_menu_option("history", option)
+    
+    def _ask_history_account(self) -> Optional[str]:
+        """
+        Pide la cuenta a consultar entre las que tienen análisis guardados.
+        
+        Returns:
+            Optional[str]: Cuenta elegida, o None si no hay historial o se cancela.
+        """
+        accounts = self._run_history.accounts()
+        if not accounts:
+            self._printer.print_warning("Todavía no hay análisis guardados")
+            return None
+        
+        if len(accounts) == 1:
+            return accounts[0]
+        
+        self._printer.print_section("Cuentas con análisis guardados:")
+        self._printer.print_options([f"@{account}" for account in accounts])
+        option = self._validator.get_valid_option("\nSelecciona una cuenta: ", 1, len(accounts))
+        return accounts[option - 1] if option else None
+    
+    def _show_runs(self):
+        """Muestra los análisis guardados de una cuenta."""
+        account = self._ask_history_account()
+        if account:
+            self._printer.print_run_history(account, self._run_history.runs(account))
+    
+    def _compare_runs(self):
+        """Compara dos análisis guardados de una cuenta: seguidores y seguidos ganados y perdidos."""
+        account = self._ask_history_account()
+        if not account:
+            return
+        
+        runs = self._run_history.runs(account)
+        if len(runs) < 2:
+            self._printer.print_warning(f"@{account} necesita al menos dos análisis guardados para compararlos")
+            return
+        
+        self._printer.print_run_history(account, runs)
+        run_ids = [run.run_id for run in runs]
+        before = self._validator.get_valid_option(
+            f"\nAnálisis anterior (Enter para #{run_ids[-2]}): ", min(run_ids), max(run_ids)
+        ) or run_ids[-2]
+        after = self._validator.get_valid_option(
+            f"Análisis posterior (Enter para #{run_ids[-1]}): ", min(run_ids), max(run_ids)
+        ) or run_ids[-1]
+        if before not in run_ids or after not in run_ids:
+            self._printer.print_error(f"Los análisis deben ser de @{account}")
+            return
+        
+        self._printer.print_run_diff(self._run_history.diff(before, after))
+    
+    def _show_user_presence(self):
+        """Muestra la primera y la última vez que un usuario apareció en los análisis de una cuenta."""
+        account = self._ask_history_account()
+        if not account:
+            return
+        
+        username = self._validator.get_non_empty_string("Usuario a buscar: ")
+        if username:
+            username = username.strip().lstrip('@')
+            self._printer.print_user_presence(username, self._run_history.presence(account, username))
+            self._printer.print_follow_history(self._run_history.follow_history(account, username))
+    
+    def _show_churn(self):
+        """Muestra altas, bajas y retención de seguidores y seguidos en los últimos 90 días."""
+        account = self._ask_history_account()
+        if not account:
+            return
+        
+        for kind in ('followers', 'following'):
+            stats = self._run_history.churn(account, kind)
+            if stats:
+                self._printer.print_churn(account, stats)
+    
+    def _stream_into_analyzer(self, data_source: IInstagramRepository, concurrent: bool = True) -> FollowerAnalyzer:
+        """
+        Lee seguidores y seguidos de una fuente entregando cada lote al analizador.
+        
+        Args:
+            data_source: Repositorio del que leer las listas.
+            concurrent: Si es False, las listas se leen una tras otra.
+            
+        Returns:
+            FollowerAnalyzer: Analizador con ambas listas cargadas.
+        """
+        analyzer = FollowerAnalyzer(set_backend=self._set_backend)
+        fetcher = ConcurrentRelationsFetcher(data_source, concurrent=concurrent)
+        fetcher.stream(
+            lambda kind, batch: (analyzer.add_followers(batch) if kind == 'followers'
+                                 else analyzer.add_following(batch))
+        )
+        return analyzer
+    
+    def _offer_export(self, result: FollowerAnalysisResult, account: str = ''):
+        """
+        Guarda el resultado y ofrece exportarlo.
+        
+        Args:
+            result: Resultado del análisis.
+            account: Cuenta analizada, si se conoce.
+        """
+        # Guardar resultado para exportación
+        self._last_analysis_result = result
+        self._last_analysis_account = account
+        
+        # Preguntar si desea exportar
+        print("")
+        if self._validator.get_yes_no_confirmation("¿Deseas exportar los resultados?", default=True):
+            self._show_export_menu()
+        
+        self._printer.print_success("\nAnálisis completado exitosamente!")
+    
     def _show_export_menu(self):
         """Muestra el menú de exportación."""
         option = self._menu_manager.show_menu("export", "\n💾 ¿QUÉ DESEAS EXPORTAR?")
         
-        if option and option != 4:
+        if option and option != 5:
             self._menu_manager.execute_menu_option("export", option)
     
     def _export_text_report(self):
@@ -230,7 +766,7 @@ class InstagramAnalyzerApp:
             self._printer.print_error("No hay análisis disponible para exportar")
             return
         
-        exporter = TextReportExporter(self._file_manager)
+        exporter = TextReportExporter(self._file_manager, metadata=self._profile_metadata)
         exporter.export(self._last_analysis_result)
     
     def _export_json_report(self):
@@ -239,7 +775,7 @@ class InstagramAnalyzerApp:
             self._printer.print_error("No hay análisis disponible para exportar")
             return
         
-        exporter = JSONReportExporter(self._file_manager)
+        exporter = JSONReportExporter(self._file_manager, metadata=self._profile_metadata)
         exporter.export(self._last_analysis_result)
     
     def _export_unfollowers_list(self):
@@ -248,5 +784,14 @@ class InstagramAnalyzerApp:
             self._printer.print_error("No hay análisis disponible para exportar")
             return
         
-        exporter = UnfollowersListExporter(self._file_manager)
+        exporter = UnfollowersListExporter(self._file_manager, metadata=self._profile_metadata)
         exporter.export(self._last_analysis_result.not_following_back)
+    
+    def _export_binary_snapshot(self):
+        """Exporta las listas completas en una instantánea binaria."""
+        if not hasattr(self, '_last_analysis_result'):
+            self._printer.print_error("No hay análisis disponible para exportar")
+            return
+        
+        exporter = BinarySnapshotExporter(self._file_manager, account=self._last_analysis_account)
+        exporter.export(self._last_analysis_result)
@@ -5,7 +5,10 @@ Proporciona interfaces y clases para gestionar sesiones de Instagram.
 
 from .interfaces import IAuthenticationProvider, ISessionManager
 from .session_manager import InstaloaderSessionManager
+from .profile_cache import ProfileCache
 from .cookie_provider import CookieAuthProvider, BrowserCookieExtractor, SavedSessionAuthProvider
+from .http_transport import HTTPTransport, TransportStats, RequestTiming
+from .session_pool import SessionPool, PooledSession, PooledContext, PooledAuthProvider, FailFastRateController
 
 __all__ = [
     'IAuthenticationProvider',
@@ -13,5 +16,14 @@ __all__ = [
     'InstaloaderSessionManager',
     'CookieAuthProvider',
     'BrowserCookieExtractor',
-    'SavedSessionAuthProvider'
+    'SavedSessionAuthProvider',
+    'ProfileCache',
+    'HTTPTransport',
+    'TransportStats',
+    'RequestTiming',
+    'SessionPool',
+    'PooledSession',
+    'PooledContext',
+    'PooledAuthProvider',
+    'FailFastRateController'
 ]
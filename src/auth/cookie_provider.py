@@ -8,6 +8,8 @@ from pathlib import Path
 from typing import Optional, Dict
 from .interfaces import IAuthenticationProvider, ISessionManager
 from .session_manager import InstaloaderSessionManager
+from .profile_cache import ProfileCache
+from .http_transport import HTTPTransport
 
 
 class BrowserCookieExtractor:
@@ -98,7 +100,9 @@ class CookieAuthProvider(IAuthenticationProvider):
         self,
         session_manager: ISessionManager,
         username: Optional[str] = None,
-        sessionid: Optional[str] = None
+        sessionid: Optional[str] = None,
+        profile_cache: Optional[ProfileCache] = None,
+        transport: Optional[HTTPTransport] = None
     ):
         """
         Inicializa el proveedor de autenticación por cookies.
@@ -107,10 +111,14 @@ class CookieAuthProvider(IAuthenticationProvider):
             session_manager: Gestor de sesiones a utilizar.
             username: Nombre de usuario de Instagram.
             sessionid: ID de sesión de Instagram.
+            profile_cache: Caché de perfiles compartida con el resto de la sesión.
+            transport: Transporte HTTP compartido. Si es None, se crea uno propio.
         """
         self._session_manager = session_manager
         self._username = username
         self._sessionid = sessionid
+        self._profile_cache = profile_cache or ProfileCache()
+        self._transport = transport or HTTPTransport()
         self._loader: Optional[instaloader.Instaloader] = None
         self._authenticated = False
     
@@ -137,8 +145,8 @@ class CookieAuthProvider(IAuthenticationProvider):
             raise ValueError("Se requiere username y sessionid para autenticación")
         
         try:
-            # Crear instancia de Instaloader
-            self._loader = instaloader.Instaloader()
+            # Crear instancia de Instaloader sobre el transporte compartido
+            self._loader = self._transport.create_loader()
             
             # Configurar la cookie de sesión
             self._loader.context._session.cookies.set(
@@ -149,10 +157,7 @@ class CookieAuthProvider(IAuthenticationProvider):
             self._loader.context.username = self._username
             
             # Verificar que la sesión funciona
-            profile = instaloader.Profile.from_username(
-                self._loader.context,
-                self._username
-            )
+            self._profile_cache.get_profile(self._loader.context, self._username)
             
             # Si llegamos aquí, la autenticación fue exitosa
             self._authenticated = True
@@ -201,16 +206,23 @@ class SavedSessionAuthProvider(IAuthenticationProvider):
     Proveedor de autenticación basado en sesiones guardadas.
     """
     
-    def __init__(self, session_manager: ISessionManager, username: str):
+    def __init__(
+        self,
+        session_manager: ISessionManager,
+        username: str,
+        profile_cache: Optional[ProfileCache] = None
+    ):
         """
         Inicializa el proveedor de autenticación por sesión guardada.
         
         Args:
             session_manager: Gestor de sesiones.
             username: Nombre de usuario de la sesión.
+            profile_cache: Caché de perfiles compartida con el resto de la sesión.
         """
         self._session_manager = session_manager
         self._username = username
+        self._profile_cache = profile_cache or ProfileCache()
         self._loader: Optional[instaloader.Instaloader] = None
         self._authenticated = False
     
@@ -232,10 +244,7 @@ class SavedSessionAuthProvider(IAuthenticationProvider):
                 return False
             
             # Verificar que la sesión sigue válida
-            profile = instaloader.Profile.from_username(
-                self._loader.context,
-                self._username
-            )
+            self._profile_cache.get_profile(self._loader.context, self._username)
             
             self._authenticated = True
             return True
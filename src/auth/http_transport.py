@@ -0,0 +1,256 @@
+"""
+Transporte HTTP compartido por todos los loaders de Instaloader.
+"""
+
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+import instaloader
+import instaloader.instaloadercontext
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.request import ACCEPT_ENCODING
+
+# Tiempos de la solicitud en curso y de la última completada, por hilo
+_current = threading.local()
+
+
+def _timed_connect(connect: Callable[[Any], None]) -> Callable[[Any], None]:
+    def wrapper(self) -> None:
+        start = time.perf_counter()
+        connect(self)
+        _current.connect_seconds = getattr(_current, 'connect_seconds', 0.0) + time.perf_counter() - start
+    return wrapper
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    connect = _timed_connect(HTTPConnection.connect)
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    connect = _timed_connect(HTTPSConnection.connect)
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+@dataclass
+class TransportStats:
+    """
+    Métricas acumuladas del transporte.
+    La latencia de cada solicitud se divide en el establecimiento de conexión
+    (DNS, TCP y TLS; cero si se reutilizó una conexión abierta) y el resto,
+    que es el tiempo de envío y espera de la respuesta del servidor.
+    """
+    requests: int = 0
+    new_connections: int = 0
+    connect_seconds: float = 0.0
+    server_seconds: float = 0.0
+    
+    @property
+    def reused_connections(self) -> int:
+        """Solicitudes que usaron una conexión ya abierta."""
+        return self.requests - self.new_connections
+    
+    @property
+    def average_connect_ms(self) -> float:
+        """Milisegundos medios por conexión nueva."""
+        if not self.new_connections:
+            return 0.0
+        return 1000 * self.connect_seconds / self.new_connections
+    
+    @property
+    def average_server_ms(self) -> float:
+        """Milisegundos medios de respuesta del servidor por solicitud."""
+        if not self.requests:
+            return 0.0
+        return 1000 * self.server_seconds / self.requests
+
+
+@dataclass(frozen=True)
+class RequestTiming:
+    """
+    Tiempos de una solicitud.
+    """
+    path: str
+    connect_seconds: float
+    server_seconds: float
+    
+    @property
+    def reused_connection(self) -> bool:
+        return self.connect_seconds == 0.0
+
+
+class _SharedAdapter(HTTPAdapter):
+    """
+    Adaptador de requests montado en todas las sesiones del transporte.
+    Instaloader cierra con close() las sesiones temporales de cada consulta;
+    aquí close() no hace nada para que el pool de conexiones sobreviva.
+    """
+    
+    def __init__(self, transport: 'HTTPTransport', pool_size: int):
+        self._transport = transport
+        super().__init__(pool_connections=pool_size, pool_maxsize=pool_size)
+    
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _TimedHTTPConnectionPool,
+            'https': _TimedHTTPSConnectionPool
+        }
+    
+    def add_headers(self, request: requests.PreparedRequest, **kwargs: Any) -> None:
+        if self._transport.compression:
+            request.headers['Accept-Encoding'] = ACCEPT_ENCODING
+    
+    def send(self, request: requests.PreparedRequest, *args: Any, **kwargs: Any) -> requests.Response:
+        _current.connect_seconds = 0.0
+        start = time.perf_counter()
+        response = super().send(request, *args, **kwargs)
+        elapsed = time.perf_counter() - start
+        
+        connect_seconds = _current.connect_seconds
+        timing = RequestTiming(
+            path=request.path_url.split('?', 1)[0],
+            connect_seconds=connect_seconds,
+            server_seconds=max(0.0, elapsed - connect_seconds)
+        )
+        _current.last_timing = timing
+        self._transport.record(timing)
+        return response
+    
+    def close(self) -> None:
+        pass
+    
+    def shutdown(self) -> None:
+        """Cierra de verdad las conexiones del pool."""
+        super().close()
+
+
+# Sesión de Instaloader → transporte, para montar el mismo en sus copias temporales
+_transports: 'weakref.WeakKeyDictionary[requests.Session, HTTPTransport]' = weakref.WeakKeyDictionary()
+_hook_lock = threading.Lock()
+
+
+def _hook_copy_session() -> None:
+    """
+    Hace que las copias de sesión de Instaloader (una por consulta GraphQL) hereden
+    el transporte de la sesión original en lugar de abrir conexiones nuevas.
+    """
+    module = instaloader.instaloadercontext
+    with _hook_lock:
+        if getattr(module.copy_session, 'shares_transport', False):
+            return
+        original = module.copy_session
+        
+        def copy_session(session: requests.Session, request_timeout: Optional[float] = None) -> requests.Session:
+            new = original(session, request_timeout)
+            transport = _transports.get(session)
+            if transport is not None:
+                transport.mount(new)
+            return new
+        
+        copy_session.shares_transport = True
+        module.copy_session = copy_session
+
+
+class HTTPTransport:
+    """
+    Pool de conexiones keep-alive compartido por todas las sesiones de Instaloader.
+    Instaloader crea una sesión de requests por loader y otra temporal por cada consulta
+    GraphQL, así que cada página abría una conexión nueva (TCP + TLS). Con el transporte
+    todas reutilizan las mismas conexiones, piden respuestas comprimidas y usan el
+    timeout de config.yaml. Además mide cada solicitud (conexión frente a servidor).
+    """
+    
+    def __init__(self, timeout: float = 30.0, pool_size: int = 10, compression: bool = True):
+        """
+        Inicializa el transporte.
+        
+        Args:
+            timeout: Segundos de espera máximos por solicitud.
+            pool_size: Conexiones abiertas que se mantienen por host.
+            compression: Si es True, se aceptan todas las compresiones que urllib3 sabe decodificar.
+        """
+        self.timeout = timeout
+        self.compression = compression
+        self._adapter = _SharedAdapter(self, pool_size)
+        self._stats = TransportStats()
+        self._lock = threading.Lock()
+        _hook_copy_session()
+    
+    @property
+    def stats(self) -> TransportStats:
+        """Copia de las métricas acumuladas."""
+        with self._lock:
+            return TransportStats(**vars(self._stats))
+    
+    @property
+    def last_timing(self) -> Optional[RequestTiming]:
+        """Tiempos de la última solicitud completada en el hilo actual."""
+        return getattr(_current, 'last_timing', None)
+    
+    def create_loader(self, **kwargs: Any) -> instaloader.Instaloader:
+        """
+        Crea un loader de Instaloader que usa este transporte.
+        
+        Args:
+            **kwargs: Argumentos de instaloader.Instaloader.
+            
+        Returns:
+            Instaloader: Loader con el timeout y las conexiones del transporte.
+        """
+        kwargs.setdefault('request_timeout', self.timeout)
+        loader = instaloader.Instaloader(**kwargs)
+        self.install(loader)
+        return loader
+    
+    def install(self, loader: instaloader.Instaloader) -> None:
+        """
+        Conecta un loader al transporte. Hay que repetirlo si el loader cambia de sesión
+        (por ejemplo tras load_session_from_file).
+        
+        Args:
+            loader: Loader de Instaloader.
+        """
+        context = loader.context
+        context.request_timeout = self.timeout
+        self.mount(context._session)
+        _transports[context._session] = self
+    
+    def mount(self, session: requests.Session) -> None:
+        """
+        Hace que una sesión de requests use las conexiones del transporte.
+        
+        Args:
+            session: Sesión de requests.
+        """
+        session.mount('https://', self._adapter)
+        session.mount('http://', self._adapter)
+    
+    def record(self, timing: RequestTiming) -> None:
+        """
+        Acumula los tiempos de una solicitud.
+        
+        Args:
+            timing: Tiempos medidos por el adaptador.
+        """
+        with self._lock:
+            self._stats.requests += 1
+            if not timing.reused_connection:
+                self._stats.new_connections += 1
+            self._stats.connect_seconds += timing.connect_seconds
+            self._stats.server_seconds += timing.server_seconds
+    
+    def close(self) -> None:
+        """Cierra las conexiones abiertas."""
+        self._adapter.shutdown()
@@ -0,0 +1,121 @@
+"""
+Caché de perfiles de Instagram por sesión.
+"""
+
+import copy
+import threading
+import time
+from concurrent.futures import Future
+import instaloader
+from typing import Dict, Optional, Tuple
+
+
+class ProfileCache:
+    """
+    Caché de objetos Profile con tiempo de vida (TTL).
+    Evita repetir Profile.from_username para un mismo usuario durante una sesión:
+    cada resolución es una solicitud de red sujeta al límite de velocidad.
+    Es seguro usarla desde varios hilos: la solicitud se hace fuera del bloqueo, así que una
+    consulta lenta no frena las demás, y las consultas simultáneas del mismo usuario esperan
+    a la primera en lugar de repetirla.
+    Los contextos que envuelven a otro (los que exponen 'wrapped', como PagedContext) comparten
+    las entradas del contexto original: el perfil se devuelve ligado al contexto pedido.
+    """
+    
+    def __init__(self, ttl_seconds: float = 600.0):
+        """
+        Inicializa la caché.
+        
+        Args:
+            ttl_seconds: Segundos que un perfil se considera vigente.
+        """
+        self._ttl_seconds = ttl_seconds
+        self._entries: Dict[str, Tuple[instaloader.Profile, object, float]] = {}
+        self._pending: Dict[Tuple[str, object], Future] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+    
+    def get_profile(self, context: instaloader.InstaloaderContext, username: str) -> instaloader.Profile:
+        """
+        Obtiene un perfil, resolviéndolo en Instagram solo si no está en caché.
+        
+        Args:
+            context: Contexto de Instaloader con el que resolver el perfil.
+            username: Nombre de usuario.
+            
+        Returns:
+            Profile: Perfil de Instagram.
+        """
+        key = username.lower()
+        base = self._base_context(context)
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            # Un perfil solo se reutiliza con la misma sesión con la que se obtuvo
+            if entry and entry[1] is base and entry[2] > time.monotonic():
+                self._hits += 1
+                return self._bind(entry[0], context)
+            
+            pending = self._pending.get((key, base))
+            if pending is None:
+                self._misses += 1
+                future = self._pending[(key, base)] = Future()
+            else:
+                self._hits += 1
+        
+        if pending is not None:
+            return self._bind(pending.result(), context)
+        
+        try:
+            profile = instaloader.Profile.from_username(context, username)
+        except BaseException as e:
+            with self._lock:
+                del self._pending[(key, base)]
+            future.set_exception(e)
+            raise
+        
+        with self._lock:
+            self._entries[key] = (profile, base, time.monotonic() + self._ttl_seconds)
+            del self._pending[(key, base)]
+        future.set_result(profile)
+        return profile
+    
+    @staticmethod
+    def _base_context(context: instaloader.InstaloaderContext) -> instaloader.InstaloaderContext:
+        wrapped = getattr(context, 'wrapped', None)
+        while wrapped is not None:
+            context, wrapped = wrapped, getattr(wrapped, 'wrapped', None)
+        return context
+    
+    @staticmethod
+    def _bind(profile: instaloader.Profile, context: instaloader.InstaloaderContext) -> instaloader.Profile:
+        """Devuelve el perfil ligado al contexto pedido, para que sus listas se descarguen con él."""
+        if profile._context is context:
+            return profile
+        bound = copy.copy(profile)
+        bound._context = context
+        return bound
+    
+    def invalidate(self, username: Optional[str] = None) -> None:
+        """
+        Elimina un perfil de la caché, o todos si no se indica usuario.
+        
+        Args:
+            username: Nombre de usuario a eliminar.
+        """
+        with self._lock:
+            if username is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(username.lower(), None)
+    
+    @property
+    def hits(self) -> int:
+        """Cantidad de perfiles servidos desde la caché."""
+        return self._hits
+    
+    @property
+    def misses(self) -> int:
+        """Cantidad de perfiles resueltos en Instagram."""
+        return self._misses
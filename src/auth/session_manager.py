@@ -4,8 +4,9 @@ Implementación del gestor de sesiones usando Instaloader.
 
 import instaloader
 from pathlib import Path
-from typing import Optional, Any
+from typing import Any, Callable, Optional
 from .interfaces import ISessionManager
+from .http_transport import HTTPTransport
 
 
 class InstaloaderSessionManager(ISessionManager):
@@ -14,16 +15,18 @@ class InstaloaderSessionManager(ISessionManager):
     Implementa Single Responsibility Principle: solo maneja la persistencia de sesiones.
     """
     
-    def __init__(self, session_directory: Optional[Path] = None):
+    def __init__(self, session_directory: Optional[Path] = None, transport: Optional[HTTPTransport] = None):
         """
         Inicializa el gestor de sesiones.
         
         Args:
             session_directory: Directorio donde guardar las sesiones.
                               Por defecto usa el directorio actual.
+            transport: Transporte HTTP compartido por los loaders que crea el gestor.
         """
         self.session_directory = session_directory or Path.cwd()
-        self.loader = instaloader.Instaloader()
+        self.transport = transport or HTTPTransport()
+        self.loader = self.transport.create_loader()
     
     def save_session(self, username: str, session_data: Any = None) -> bool:
         """
@@ -49,20 +52,27 @@ class InstaloaderSessionManager(ISessionManager):
             print(f"Error al guardar sesión: {e}")
             return False
     
-    def load_session(self, username: str) -> Optional[instaloader.Instaloader]:
+    def load_session(
+        self,
+        username: str,
+        rate_controller: Optional[Callable[[instaloader.InstaloaderContext], instaloader.RateController]] = None
+    ) -> Optional[instaloader.Instaloader]:
         """
         Carga una sesión guardada de Instaloader.
         
         Args:
             username: Nombre de usuario de la sesión.
+            rate_controller: Fábrica del control de velocidad del loader. Por defecto el de Instaloader.
             
         Returns:
             Optional[Instaloader]: Instancia de Instaloader con la sesión cargada.
         """
         try:
-            loader = instaloader.Instaloader()
+            loader = self.transport.create_loader(rate_controller=rate_controller)
             session_file = self.session_directory / username
             loader.load_session_from_file(username, str(session_file))
+            # Cargar la sesión reemplaza la sesión HTTP del loader
+            self.transport.install(loader)
             return loader
         except FileNotFoundError:
             return None
@@ -0,0 +1,295 @@
+"""
+Grupo de sesiones guardadas que se turnan las solicitudes de lectura.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, List, Optional
+import instaloader
+from .interfaces import IAuthenticationProvider
+from .session_manager import InstaloaderSessionManager
+
+
+class FailFastRateController(instaloader.RateController):
+    """
+    Control de velocidad de Instaloader que no espera tras un 429.
+    Por defecto Instaloader duerme hasta poder repetir la solicitud con la misma sesión;
+    dentro de un grupo conviene lanzar el error para repetirla enseguida con otra.
+    """
+    
+    def handle_429(self, query_type: str) -> None:
+        raise instaloader.exceptions.TooManyRequestsException(
+            f"429 Too Many Requests (consulta {query_type})"
+        )
+
+
+@dataclass
+class PooledSession:
+    """
+    Sesión del grupo y su estado de turnos.
+    """
+    index: int
+    username: str
+    loader: instaloader.Instaloader
+    next_request_at: float = 0.0
+    cooldown_until: float = 0.0
+    last_throttled_at: float = float('-inf')
+    requests: int = 0
+    throttle_events: int = 0
+
+
+class SessionPool:
+    """
+    Reparte las solicitudes entre varias sesiones autenticadas.
+    Cada sesión respeta su propio intervalo entre solicitudes, así que el ritmo total
+    crece con el número de sesiones. Una sesión que recibe un 429 sale de la rotación
+    durante cooldown_seconds y la solicitud se repite con otra.
+    
+    Estrategias:
+        round_robin: las sesiones listas se usan por turno.
+        least_throttled: se prefiere la sesión que hace más tiempo que no recibe un 429.
+    """
+    
+    ROUND_ROBIN = 'round_robin'
+    LEAST_THROTTLED = 'least_throttled'
+    
+    def __init__(
+        self,
+        sessions: List[PooledSession],
+        strategy: str = ROUND_ROBIN,
+        delay: float = 1.0,
+        cooldown_seconds: float = 600.0
+    ):
+        """
+        Inicializa el grupo.
+        
+        Args:
+            sessions: Sesiones ya cargadas.
+            strategy: 'round_robin' o 'least_throttled'.
+            delay: Segundos entre solicitudes de una misma sesión.
+            cooldown_seconds: Tiempo fuera de rotación tras un 429.
+        """
+        if not sessions:
+            raise ValueError("El grupo necesita al menos una sesión")
+        if strategy not in (self.ROUND_ROBIN, self.LEAST_THROTTLED):
+            raise ValueError(f"Estrategia desconocida: {strategy}")
+        
+        self._sessions = sessions
+        self._strategy = strategy
+        self._delay = delay
+        self._cooldown_seconds = cooldown_seconds
+        self._cursor = 0
+        self._lock = threading.Lock()
+        self.context = PooledContext(self)
+    
+    @classmethod
+    def from_saved_sessions(
+        cls,
+        session_manager: InstaloaderSessionManager,
+        usernames: List[str],
+        **options: Any
+    ) -> 'SessionPool':
+        """
+        Crea un grupo cargando sesiones guardadas. Las que no se pueden cargar se omiten.
+        
+        Args:
+            session_manager: Gestor de sesiones guardadas.
+            usernames: Usuarios de las sesiones a cargar.
+            **options: Argumentos de SessionPool (strategy, delay, cooldown_seconds).
+            
+        Returns:
+            SessionPool: Grupo con las sesiones cargadas.
+        """
+        sessions = []
+        for username in usernames:
+            loader = None
+            if session_manager.session_exists(username):
+                loader = session_manager.load_session(username, rate_controller=FailFastRateController)
+            if loader is None:
+                print(f"No se pudo cargar la sesión @{username}, queda fuera del grupo")
+                continue
+            sessions.append(PooledSession(index=len(sessions), username=username, loader=loader))
+        return cls(sessions, **options)
+    
+    @property
+    def size(self) -> int:
+        """Cantidad de sesiones del grupo."""
+        return len(self._sessions)
+    
+    @property
+    def primary(self) -> PooledSession:
+        """Sesión principal: identifica al grupo (checkpoints, usuario por defecto)."""
+        return self._sessions[0]
+    
+    @property
+    def sessions(self) -> List[PooledSession]:
+        """Sesiones del grupo."""
+        return list(self._sessions)
+    
+    def acquire(self) -> PooledSession:
+        """
+        Elige la sesión para la próxima solicitud y espera su turno.
+        Si todas están fuera de rotación, espera a que vuelva la primera.
+        
+        Returns:
+            PooledSession: Sesión con la que hacer la solicitud.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                session = self._select(now)
+                if session is None:
+                    wait = min(s.cooldown_until for s in self._sessions) - now
+                else:
+                    wait = max(0.0, session.next_request_at - now)
+                    session.next_request_at = max(now, session.next_request_at) + self._delay
+                    session.requests += 1
+                    self._cursor = (session.index + 1) % len(self._sessions)
+            
+            if session is None:
+                print(f"   ⏸️  Todas las sesiones están en pausa por 429; se reanuda en {wait:.0f}s\n", end="")
+                time.sleep(wait)
+                continue
+            
+            if wait > 0:
+                time.sleep(wait)
+            return session
+    
+    def report_throttle(self, session: PooledSession) -> None:
+        """
+        Saca una sesión de la rotación tras un 429.
+        
+        Args:
+            session: Sesión que recibió el 429.
+        """
+        with self._lock:
+            now = time.monotonic()
+            session.cooldown_until = now + self._cooldown_seconds
+            session.last_throttled_at = now
+            session.throttle_events += 1
+        print(f"   ⏸️  Sesión @{session.username} fuera de rotación por {self._cooldown_seconds:.0f}s (429)\n",
+              end="")
+    
+    def _select(self, now: float) -> Optional[PooledSession]:
+        """
+        Elige una sesión en rotación según la estrategia (con el lock adquirido).
+        
+        Returns:
+            Optional[PooledSession]: Sesión elegida, o None si todas están en pausa.
+        """
+        candidates = [s for s in self._sessions if s.cooldown_until <= now]
+        if not candidates:
+            return None
+        
+        ready = [s for s in candidates if s.next_request_at <= now]
+        if not ready:
+            return min(candidates, key=lambda s: s.next_request_at)
+        
+        if self._strategy == self.ROUND_ROBIN:
+            size = len(self._sessions)
+            return min(ready, key=lambda s: (s.index - self._cursor) % size)
+        return min(ready, key=lambda s: (s.last_throttled_at, s.requests))
+
+
+class PooledContext:
+    """
+    Sustituto de InstaloaderContext que envía cada solicitud a una sesión del grupo.
+    Los perfiles e iteradores creados con este contexto reparten sus páginas entre las
+    sesiones; el resto de atributos (usuario, estado de login, logs) son los de la
+    sesión principal.
+    """
+    
+    REQUEST_METHODS = ('get_json', 'graphql_query', 'doc_id_graphql_query', 'get_iphone_json')
+    
+    def __init__(self, pool: SessionPool):
+        """
+        Inicializa el contexto.
+        
+        Args:
+            pool: Grupo de sesiones.
+        """
+        self._pool = pool
+    
+    def __getattr__(self, name: str) -> Any:
+        if name in self.REQUEST_METHODS:
+            return lambda *args, **kwargs: self._dispatch(name, *args, **kwargs)
+        return getattr(self._pool.primary.loader.context, name)
+    
+    def _dispatch(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """
+        Hace una solicitud con la sesión que toque, repitiéndola con otra ante un 429.
+        
+        Args:
+            method: Método de InstaloaderContext a llamar.
+            
+        Returns:
+            Any: Respuesta de Instagram.
+        """
+        attempts = 0
+        while True:
+            session = self._pool.acquire()
+            try:
+                return getattr(session.loader.context, method)(*args, **kwargs)
+            except instaloader.exceptions.ConnectionException as e:
+                if not self._is_throttle(e):
+                    raise
+                self._pool.report_throttle(session)
+                attempts += 1
+                # Si ninguna sesión logra responder, el error sigue hacia el limitador del repositorio
+                if attempts >= 2 * self._pool.size:
+                    raise
+    
+    @staticmethod
+    def _is_throttle(error: Exception) -> bool:
+        # Tras sus reintentos, Instaloader lanza un ConnectionException causado por el 429 original
+        while error is not None:
+            if isinstance(error, instaloader.exceptions.TooManyRequestsException):
+                return True
+            error = error.__cause__
+        return False
+
+
+class PooledAuthProvider(IAuthenticationProvider):
+    """
+    Proveedor de autenticación respaldado por un grupo de sesiones.
+    El loader que entrega usa el contexto del grupo, así que el repositorio
+    reparte sus solicitudes sin saber que hay varias sesiones detrás.
+    """
+    
+    def __init__(self, pool: SessionPool):
+        """
+        Inicializa el proveedor.
+        
+        Args:
+            pool: Grupo de sesiones ya cargadas.
+        """
+        self._pool = pool
+        self._loader = instaloader.Instaloader()
+        self._loader.context = pool.context
+    
+    @property
+    def pool(self) -> SessionPool:
+        """Grupo de sesiones del proveedor."""
+        return self._pool
+    
+    def authenticate(self) -> bool:
+        """
+        Verifica que el grupo tiene sesiones iniciadas.
+        
+        Returns:
+            bool: True si todas las sesiones del grupo están iniciadas.
+        """
+        return all(session.loader.context.is_logged_in for session in self._pool.sessions)
+    
+    def get_loader(self) -> Optional[instaloader.Instaloader]:
+        """Obtiene un loader cuyo contexto reparte las solicitudes entre el grupo."""
+        return self._loader
+    
+    def get_username(self) -> Optional[str]:
+        """Obtiene el usuario de la sesión principal."""
+        return self._pool.primary.username
+    
+    def is_authenticated(self) -> bool:
+        """Verifica si el grupo tiene sesiones iniciadas."""
+        return self.authenticate()
@@ -0,0 +1,18 @@
+"""
+Módulo del modo por lotes.
+Permite analizar muchas cuentas en una sola corrida con varias sesiones guardadas.
+"""
+
+from .models import BatchJob, BatchJobResult, BatchReport
+from .job_loader import BatchJobLoader
+from .scheduler import SessionScheduler
+from .batch_runner import BatchRunner
+
+__all__ = [
+    'BatchJob',
+    'BatchJobResult',
+    'BatchReport',
+    'BatchJobLoader',
+    'SessionScheduler',
+    'BatchRunner'
+]
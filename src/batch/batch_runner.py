@@ -0,0 +1,135 @@
+"""
+Ejecución del análisis de varias cuentas en una sola corrida.
+"""
+
+import time
+from typing import Callable, Dict, List, Optional
+from ..auth import IAuthenticationProvider
+from ..data import IInstagramRepository, InstagramRepository, ConcurrentRelationsFetcher
+from ..analysis import FollowerAnalyzer, IdSetBackend
+from ..storage import RunSnapshotStore
+from .models import BatchJob, BatchJobResult, BatchReport
+from .scheduler import SessionScheduler
+
+
+class BatchRunner:
+    """
+    Analiza una lista de cuentas con una o varias sesiones guardadas.
+    Cada sesión se autentica una sola vez y tiene un único repositorio, con su propio
+    limitador de velocidad compartido por todas las cuentas que descarga; así ninguna
+    sesión supera su límite aunque el lote avance con varias sesiones a la vez.
+    """
+    
+    def __init__(
+        self,
+        auth_factory: Callable[[str], IAuthenticationProvider],
+        repository_factory: Callable[[IAuthenticationProvider], InstagramRepository],
+        data_source_factory: Callable[[InstagramRepository], IInstagramRepository],
+        scheduler: SessionScheduler,
+        history: Optional[RunSnapshotStore] = None,
+        set_backend: Optional[IdSetBackend] = None
+    ):
+        """
+        Inicializa el ejecutor.
+        
+        Args:
+            auth_factory: Crea el proveedor de autenticación de una sesión (o grupo de sesiones) por nombre.
+            repository_factory: Crea el repositorio (y su limitador) de una sesión autenticada.
+            data_source_factory: Envuelve el repositorio según la configuración (p. ej. incremental).
+            scheduler: Planificador que reparte las cuentas entre hilos.
+            history: Historial donde guardar cada cuenta analizada, o None para no guardarlas.
+            set_backend: Motor de conjuntos del análisis. Por defecto se elige según el tamaño.
+        """
+        self._auth_factory = auth_factory
+        self._repository_factory = repository_factory
+        self._data_source_factory = data_source_factory
+        self._scheduler = scheduler
+        self._history = history
+        self._set_backend = set_backend
+        self._repositories: Dict[str, InstagramRepository] = {}
+        self._session_errors: Dict[str, str] = {}
+    
+    def run(self, jobs: List[BatchJob]) -> BatchReport:
+        """
+        Analiza todas las cuentas del lote.
+        
+        Args:
+            jobs: Cuentas a analizar.
+            
+        Returns:
+            BatchReport: Resultado por cuenta y métricas por sesión.
+        """
+        start = time.monotonic()
+        
+        for session in dict.fromkeys(job.session for job in jobs):
+            self._open_session(session)
+        
+        results = self._scheduler.run(jobs, self._run_job)
+        
+        return BatchReport(
+            results=results,
+            session_stats={
+                session: repository.rate_limiter.stats
+                for session, repository in self._repositories.items()
+            },
+            elapsed_seconds=time.monotonic() - start
+        )
+    
+    def _open_session(self, session: str) -> None:
+        """
+        Autentica una sesión guardada y crea su repositorio.
+        
+        Args:
+            session: Usuario de la sesión guardada o nombre de un grupo de sesiones.
+        """
+        print(f"\n🔐 Cargando sesión @{session}...")
+        try:
+            auth_provider = self._auth_factory(session)
+            if auth_provider.authenticate():
+                self._repositories[session] = self._repository_factory(auth_provider)
+                return
+        except Exception as e:
+            print(f"Error al cargar sesión @{session}: {e}")
+        
+        self._session_errors[session] = f"No se pudo cargar la sesión @{session}"
+    
+    def _run_job(self, job: BatchJob) -> BatchJobResult:
+        """
+        Analiza una cuenta. Los errores se devuelven en el resultado para no detener el lote.
+        
+        Args:
+            job: Cuenta a analizar.
+            
+        Returns:
+            BatchJobResult: Resultado del análisis de la cuenta.
+        """
+        repository = self._repositories.get(job.session)
+        if repository is None:
+            return BatchJobResult(job=job, error=self._session_errors.get(job.session))
+        
+        started_at = time.time()
+        start = time.monotonic()
+        try:
+            print(f"\n📊 Analizando cuenta @{job.target} (sesión @{job.session})...\n", end="")
+            analyzer = FollowerAnalyzer(set_backend=self._set_backend)
+            fetcher = ConcurrentRelationsFetcher(self._data_source_factory(repository))
+            fetcher.stream(
+                lambda kind, batch: (analyzer.add_followers(batch) if kind == 'followers'
+                                     else analyzer.add_following(batch)),
+                job.target
+            )
+            crawl_seconds = time.monotonic() - start
+            result = analyzer.analyze()
+            if self._history is not None:
+                self._history.record_run(
+                    job.target,
+                    result,
+                    started_at=started_at,
+                    crawl_seconds=crawl_seconds,
+                    analysis_seconds=time.monotonic() - start - crawl_seconds
+                )
+            print(f"✓ @{job.target} analizada\n", end="")
+            return BatchJobResult(job=job, result=result, elapsed_seconds=time.monotonic() - start)
+        except Exception as e:
+            print(f"✗ Error al analizar @{job.target}: {e}\n", end="")
+            return BatchJobResult(job=job, error=str(e), elapsed_seconds=time.monotonic() - start)
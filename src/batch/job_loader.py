@@ -0,0 +1,59 @@
+"""
+Lectura del archivo de cuentas del modo por lotes.
+"""
+
+from pathlib import Path
+from typing import List
+from .models import BatchJob
+
+
+class BatchJobLoader:
+    """
+    Lee la lista de cuentas a analizar.
+    Siguiendo Single Responsibility Principle: solo interpreta el archivo de cuentas.
+    
+    Formato: una cuenta por línea, opcionalmente seguida de la sesión guardada con la
+    que se descarga. Sin sesión se usa la de la propia cuenta. Las líneas vacías y las
+    que empiezan con '#' se ignoran.
+    
+        mi_cuenta
+        cliente_1    mi_cuenta
+        cliente_2    otra_sesion
+    """
+    
+    @staticmethod
+    def load(path: Path) -> List[BatchJob]:
+        """
+        Carga los trabajos del archivo.
+        
+        Args:
+            path: Ruta al archivo de cuentas.
+            
+        Returns:
+            List[BatchJob]: Trabajos en el orden del archivo, sin cuentas repetidas.
+            
+        Raises:
+            ValueError: Si una línea tiene más de dos columnas.
+        """
+        jobs: List[BatchJob] = []
+        seen = set()
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                fields = line.split('#', 1)[0].split()
+                if not fields:
+                    continue
+                if len(fields) > 2:
+                    raise ValueError(f"{path.name}:{line_number}: se esperaba 'cuenta [sesion]'")
+                
+                target = fields[0].lstrip('@')
+                session = fields[1].lstrip('@') if len(fields) == 2 else target
+                
+                # Dos análisis de la misma cuenta compartirían checkpoints y listas guardadas
+                if target.lower() in seen:
+                    print(f"Cuenta @{target} repetida en {path.name}:{line_number}, se ignora")
+                    continue
+                seen.add(target.lower())
+                jobs.append(BatchJob(target=target, session=session))
+        
+        return jobs
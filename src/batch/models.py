@@ -0,0 +1,53 @@
+"""
+Modelos del modo por lotes.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from ..analysis.models import FollowerAnalysisResult
+from ..data.rate_limiter import RateLimiterStats
+
+
+@dataclass(frozen=True)
+class BatchJob:
+    """
+    Cuenta a analizar y sesión guardada con la que se descarga.
+    """
+    target: str
+    session: str
+
+
+@dataclass
+class BatchJobResult:
+    """
+    Resultado del análisis de una cuenta dentro de un lote.
+    """
+    job: BatchJob
+    result: Optional[FollowerAnalysisResult] = None
+    error: Optional[str] = None
+    elapsed_seconds: float = 0.0
+    
+    @property
+    def succeeded(self) -> bool:
+        """Indica si la cuenta se analizó correctamente."""
+        return self.result is not None and self.error is None
+
+
+@dataclass
+class BatchReport:
+    """
+    Resultado completo de un lote: una entrada por cuenta y las métricas de cada sesión.
+    """
+    results: List[BatchJobResult]
+    session_stats: Dict[str, RateLimiterStats] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+    
+    @property
+    def succeeded(self) -> int:
+        """Cantidad de cuentas analizadas correctamente."""
+        return sum(1 for job_result in self.results if job_result.succeeded)
+    
+    @property
+    def failed(self) -> int:
+        """Cantidad de cuentas que no se pudieron analizar."""
+        return len(self.results) - self.succeeded
@@ -0,0 +1,94 @@
+"""
+Planificador de trabajos por sesión.
+"""
+
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+from .models import BatchJob, BatchJobResult
+
+
+class SessionScheduler:
+    """
+    Reparte los trabajos de un lote entre un número acotado de hilos.
+    Cada sesión tiene su propio límite de velocidad, así que dos trabajos de la misma
+    sesión solo se reparten ese límite; en cambio, trabajos de sesiones distintas suman
+    capacidad. Por eso un hilo libre toma siempre un trabajo de la sesión con menos
+    trabajos en curso (y, a igualdad, con más pendientes), sin superar jobs_per_session.
+    """
+    
+    def __init__(self, max_workers: int = 4, jobs_per_session: int = 1):
+        """
+        Inicializa el planificador.
+        
+        Args:
+            max_workers: Trabajos en curso como máximo en total.
+            jobs_per_session: Trabajos en curso como máximo por sesión.
+        """
+        self._max_workers = max(1, max_workers)
+        self._jobs_per_session = max(1, jobs_per_session)
+    
+    def run(
+        self,
+        jobs: List[BatchJob],
+        run_job: Callable[[BatchJob], BatchJobResult]
+    ) -> List[BatchJobResult]:
+        """
+        Ejecuta todos los trabajos.
+        
+        Args:
+            jobs: Trabajos a ejecutar.
+            run_job: Función que ejecuta un trabajo; no debe lanzar excepciones.
+            
+        Returns:
+            List[BatchJobResult]: Resultados en el mismo orden que jobs.
+        """
+        pending: Dict[str, Deque[Tuple[int, BatchJob]]] = {}
+        for index, job in enumerate(jobs):
+            pending.setdefault(job.session, deque()).append((index, job))
+        
+        running: Dict[str, int] = {session: 0 for session in pending}
+        results: List[Optional[BatchJobResult]] = [None] * len(jobs)
+        condition = threading.Condition()
+        
+        def next_job() -> Optional[Tuple[int, BatchJob]]:
+            # Se llama con condition adquirido
+            while True:
+                available = [
+                    session for session, queue in pending.items()
+                    if queue and running[session] < self._jobs_per_session
+                ]
+                if available:
+                    session = min(available, key=lambda s: (running[s], -len(pending[s])))
+                    running[session] += 1
+                    return pending[session].popleft()
+                if not any(pending.values()):
+                    return None
+                condition.wait()
+        
+        def worker() -> None:
+            while True:
+                with condition:
+                    item = next_job()
+                if item is None:
+                    return
+                
+                index, job = item
+                try:
+                    results[index] = run_job(job)
+                finally:
+                    with condition:
+                        running[job.session] -= 1
+                        condition.notify_all()
+        
+        workers = min(self._max_workers, len(jobs))
+        if workers == 0:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch") as executor:
+            futures = [executor.submit(worker) for _ in range(workers)]
+            for future in futures:
+                future.result()
+        
+        return results
@@ -5,8 +5,33 @@ Proporciona repositorios y servicios para obtener datos de Instagram.
 
 from .interfaces import IInstagramRepository
 from .instagram_repository import InstagramRepository
+from .concurrent_fetcher import ConcurrentRelationsFetcher
+from .crawl_checkpoint import CrawlCheckpoint, CrawlCheckpointStore
+from .rate_limiter import AdaptiveRateLimiter, RateLimiterStats
+from .page_size import GraphQLPageSize, PagedContext
+from .relation_snapshot import RelationSnapshot, RelationSnapshotStore
+from .incremental_repository import IncrementalInstagramRepository
+from .export_repository import InstagramExportRepository
+from .profile_metadata import ProfileMetadata, ProfileMetadataCache, ProfileEnricher, EnrichmentStats
+from .json_stream import iter_json_array
 
 __all__ = [
     'IInstagramRepository',
-    'InstagramRepository'
+    'InstagramRepository',
+    'ConcurrentRelationsFetcher',
+    'CrawlCheckpoint',
+    'CrawlCheckpointStore',
+    'AdaptiveRateLimiter',
+    'RateLimiterStats',
+    'GraphQLPageSize',
+    'PagedContext',
+    'RelationSnapshot',
+    'RelationSnapshotStore',
+    'IncrementalInstagramRepository',
+    'InstagramExportRepository',
+    'ProfileMetadata',
+    'ProfileMetadataCache',
+    'ProfileEnricher',
+    'EnrichmentStats',
+    'iter_json_array'
 ]
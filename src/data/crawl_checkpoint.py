@@ -0,0 +1,145 @@
+"""
+Checkpoints en disco para descargas paginadas reanudables.
+"""
+
+import json
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+from ..analysis.models import UserRecord
+
+
+@dataclass
+class CrawlCheckpoint:
+    """
+    Estado guardado de una descarga a medio terminar.
+    """
+    target: str
+    kind: str                       # 'followers' o 'following'
+    iterator_state: Dict[str, Any]  # FrozenNodeIterator serializado
+    pages: int = 0
+    users_offset: int = 0           # Bytes válidos del archivo de usuarios
+    saved_at: float = 0.0
+    users: List[UserRecord] = field(default_factory=list, repr=False)
+    
+    @property
+    def is_expired(self) -> bool:
+        """Indica si el cursor de paginación ya no es válido para Instagram."""
+        best_before = self.iterator_state.get('best_before')
+        return not best_before or best_before < time.time()
+
+
+class CrawlCheckpointStore:
+    """
+    Almacén de checkpoints de descarga.
+    Cada descarga usa dos archivos: un JSON pequeño con el cursor de paginación,
+    reescrito de forma atómica, y un archivo de usuarios al que solo se agregan líneas.
+    Así cada checkpoint cuesta lo mismo sin importar cuántos usuarios se llevan descargados.
+    """
+    
+    def __init__(self, directory: Path):
+        """
+        Inicializa el almacén.
+        
+        Args:
+            directory: Directorio donde guardar los checkpoints.
+        """
+        self.directory = directory
+    
+    def _state_path(self, target: str, kind: str) -> Path:
+        return self.directory / f"{target.lower()}_{kind}.json"
+    
+    def _users_path(self, target: str, kind: str) -> Path:
+        return self.directory / f"{target.lower()}_{kind}.users"
+    
+    def load(self, target: str, kind: str) -> Optional[CrawlCheckpoint]:
+        """
+        Carga el checkpoint de una descarga junto con los usuarios ya obtenidos.
+        
+        Args:
+            target: Cuenta cuya lista se descarga.
+            kind: Tipo de lista ('followers' o 'following').
+            
+        Returns:
+            Optional[CrawlCheckpoint]: Checkpoint guardado o None si no existe o está dañado.
+        """
+        state_path = self._state_path(target, kind)
+        try:
+            with open(state_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            data.pop('users', None)
+            checkpoint = CrawlCheckpoint(**data)
+            
+            users_path = self._users_path(target, kind)
+            with open(users_path, 'r+b') as f:
+                content = f.read(checkpoint.users_offset)
+                # Descartar líneas escritas después del último checkpoint confirmado
+                f.truncate(checkpoint.users_offset)
+            checkpoint.users = [
+                UserRecord(int(user_id), username)
+                for user_id, username in (line.split('\t', 1) for line in content.decode('utf-8').splitlines())
+            ]
+            return checkpoint
+        except FileNotFoundError:
+            return None
+        except (ValueError, TypeError) as e:
+            print(f"Checkpoint inválido en {state_path.name}, se ignora: {e}")
+            return None
+    
+    def save(self, checkpoint: CrawlCheckpoint, new_users: Iterable[UserRecord]) -> bool:
+        """
+        Guarda un checkpoint agregando los usuarios obtenidos desde el anterior.
+        
+        Args:
+            checkpoint: Estado de la descarga. Se actualizan users_offset y saved_at.
+            new_users: Usuarios obtenidos desde el último checkpoint.
+            
+        Returns:
+            bool: True si se guardó exitosamente.
+        """
+        state_path = self._state_path(checkpoint.target, checkpoint.kind)
+        users_path = self._users_path(checkpoint.target, checkpoint.kind)
+        tmp_path = state_path.with_suffix('.tmp')
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            
+            with open(users_path, 'ab') as f:
+                f.seek(checkpoint.users_offset)
+                f.truncate()
+                f.write(''.join(f"{user.user_id}\t{user.username}\n" for user in new_users).encode('utf-8'))
+                f.flush()
+                os.fsync(f.fileno())
+                checkpoint.users_offset = f.tell()
+            
+            checkpoint.saved_at = time.time()
+            state = asdict(checkpoint)
+            del state['users']
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f, ensure_ascii=False)
+            os.replace(tmp_path, state_path)
+            return True
+        except Exception as e:
+            print(f"Error al guardar checkpoint {state_path.name}: {e}")
+            return False
+    
+    def delete(self, target: str, kind: str) -> bool:
+        """
+        Elimina el checkpoint de una descarga.
+        
+        Args:
+            target: Cuenta cuya lista se descargó.
+            kind: Tipo de lista.
+            
+        Returns:
+            bool: True si existía y se eliminó.
+        """
+        deleted = False
+        for path in (self._state_path(target, kind), self._users_path(target, kind)):
+            try:
+                path.unlink()
+                deleted = True
+            except FileNotFoundError:
+                pass
+        return deleted
@@ -0,0 +1,260 @@
+"""
+Repositorio que lee la exportación oficial de datos de Instagram.
+"""
+
+import io
+import re
+import zipfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, TextIO
+from urllib.parse import urlsplit
+from .interfaces import IInstagramRepository
+from .json_stream import iter_json_array
+from ..analysis.models import UserRecord
+from ..analysis.user_table import UserTable
+
+
+class InstagramExportRepository(IInstagramRepository):
+    """
+    Repositorio sin conexión sobre el archivo de "Descargar tu información" de Instagram
+    (formato JSON), comprimido en .zip o ya descomprimido en una carpeta.
+    Lee followers_1.json, followers_2.json, ... y following.json con un parser
+    incremental, así que la memoria no depende del tamaño de la exportación.
+    
+    La exportación no incluye identificadores numéricos: cada usuario recibe un
+    identificador sintético estable dentro del repositorio.
+    """
+    
+    FOLLOWERS_FILE = re.compile(r'^followers(_\d+)?\.json$')
+    FOLLOWING_FILE = re.compile(r'^following\.json$')
+    BATCH_SIZE = 1000
+    
+    def __init__(self, path: Path, owner: Optional[str] = None):
+        """
+        Inicializa el repositorio.
+        
+        Args:
+            path: Archivo .zip de la exportación o carpeta donde se descomprimió.
+            owner: Usuario dueño de la exportación. Por defecto se lee de la propia exportación.
+            
+        Raises:
+            FileNotFoundError: Si la ruta no existe.
+            ValueError: Si la exportación no contiene listas de seguidores en JSON.
+        """
+        if not path.exists():
+            raise FileNotFoundError(f"No existe {path}")
+        
+        self._path = path
+        self._is_zip = path.is_file()
+        self._users = UserTable()
+        self._counts: Dict[str, int] = {}
+        
+        names = self._list_files()
+        self._files = {
+            'followers': sorted(
+                (name for name in names if self.FOLLOWERS_FILE.match(self._basename(name))),
+                key=self._file_order
+            ),
+            'following': [name for name in names if self.FOLLOWING_FILE.match(self._basename(name))]
+        }
+        if not self._files['followers'] and not self._files['following']:
+            raise ValueError("La exportación no contiene followers_*.json ni following.json "
+                             "(¿se descargó en formato HTML?)")
+        
+        self._owner = owner or self._read_owner(names)
+    
+    @property
+    def owner(self) -> Optional[str]:
+        """Usuario dueño de la exportación, si se conoce."""
+        return self._owner
+    
+    def get_followers(self, username: Optional[str] = None) -> Set[str]:
+        """
+        Obtiene la lista de seguidores de la exportación.
+        
+        Args:
+            username: Debe ser el dueño de la exportación o None.
+            
+        Returns:
+            Set[str]: Conjunto de nombres de usuario de los seguidores.
+        """
+        followers = set()
+        for batch in self.iter_followers(username):
+            followers.update(user.username for user in batch)
+        return followers
+    
+    def get_following(self, username: Optional[str] = None) -> Set[str]:
+        """
+        Obtiene la lista de seguidos de la exportación.
+        
+        Args:
+            username: Debe ser el dueño de la exportación o None.
+            
+        Returns:
+            Set[str]: Conjunto de nombres de usuario seguidos.
+        """
+        following = set()
+        for batch in self.iter_following(username):
+            following.update(user.username for user in batch)
+        return following
+    
+    def iter_followers(self, username: Optional[str] = None) -> Iterator[List[UserRecord]]:
+        """
+        Lee los seguidores por lotes.
+        
+        Args:
+            username: Debe ser el dueño de la exportación o None.
+            
+        Returns:
+            Iterator[List[UserRecord]]: Lotes de seguidores.
+        """
+        self._check_owner(username)
+        print(f"\n📥 Leyendo seguidores de la exportación ({len(self._files['followers'])} archivos)...")
+        return self._iter_relation('followers')
+    
+    def iter_following(self, username: Optional[str] = None) -> Iterator[List[UserRecord]]:
+        """
+        Lee los seguidos por lotes.
+        
+        Args:
+            username: Debe ser el dueño de la exportación o None.
+            
+        Returns:
+            Iterator[List[UserRecord]]: Lotes de seguidos.
+        """
+        self._check_owner(username)
+        print("\n📤 Leyendo seguidos de la exportación...")
+        return self._iter_relation('following')
+    
+    def get_profile_info(self, username: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Obtiene la información disponible en la exportación.
+        Los totales se cuentan recorriendo los archivos la primera vez que se piden.
+        
+        Args:
+            username: Debe ser el dueño de la exportación o None.
+            
+        Returns:
+            Dict[str, Any]: Información del perfil.
+        """
+        self._check_owner(username)
+        for kind in ('followers', 'following'):
+            if kind not in self._counts:
+                self._counts[kind] = sum(len(batch) for batch in self._iter_relation(kind))
+        
+        return {
+            'username': self._owner,
+            'full_name': None,
+            'followers': self._counts['followers'],
+            'following': self._counts['following'],
+            'posts': None,
+            'is_private': None,
+            'biography': None
+        }
+    
+    def _check_owner(self, username: Optional[str]) -> None:
+        if username and self._owner and username.lower() != self._owner.lower():
+            raise ValueError(f"La exportación solo contiene datos de @{self._owner}")
+    
+    def _iter_relation(self, kind: str) -> Iterator[List[UserRecord]]:
+        """
+        Recorre los archivos de una lista en lotes, sin duplicados.
+        
+        Args:
+            kind: Tipo de lista ('followers' o 'following').
+            
+        Yields:
+            List[UserRecord]: Lotes de usuarios.
+        """
+        seen: Set[int] = set()
+        batch: List[UserRecord] = []
+        count = 0
+        
+        for name in self._files[kind]:
+            with self._open(name) as stream:
+                for entry in iter_json_array(stream):
+                    username = self._entry_username(entry)
+                    if not username:
+                        continue
+                    user = UserRecord(self._users.id_for(username), username)
+                    if user.user_id in seen:
+                        continue
+                    seen.add(user.user_id)
+                    batch.append(user)
+                    if len(batch) >= self.BATCH_SIZE:
+                        count += len(batch)
+                        yield batch
+                        batch = []
+        
+        if batch:
+            count += len(batch)
+            yield batch
+        self._counts[kind] = count
+    
+    @staticmethod
+    def _entry_username(entry: Dict[str, Any]) -> Optional[str]:
+        """
+        Extrae el nombre de usuario de una entrada de la exportación.
+        Según la versión, está en string_list_data[0].value, en title o solo en el enlace.
+        
+        Args:
+            entry: Entrada de followers_*.json o following.json.
+            
+        Returns:
+            Optional[str]: Nombre de usuario, o None si la entrada no lo tiene.
+        """
+        data = (entry.get('string_list_data') or [{}])[0]
+        username = data.get('value') or entry.get('title')
+        if not username and data.get('href'):
+            path = urlsplit(data['href']).path.strip('/')
+            username = path.rsplit('/', 1)[-1] if path else None
+        return username or None
+    
+    def _list_files(self) -> List[str]:
+        if self._is_zip:
+            with zipfile.ZipFile(self._path) as archive:
+                return [name for name in archive.namelist() if not name.endswith('/')]
+        return [str(p.relative_to(self._path)) for p in self._path.rglob('*.json')]
+    
+    @contextmanager
+    def _open(self, name: str) -> Iterator[TextIO]:
+        """
+        Abre un archivo de la exportación como texto, dentro del zip o de la carpeta.
+        
+        Args:
+            name: Ruta relativa dentro de la exportación.
+        """
+        if self._is_zip:
+            with zipfile.ZipFile(self._path) as archive, archive.open(name) as raw:
+                yield io.TextIOWrapper(raw, encoding='utf-8')
+        else:
+            with open(self._path / name, 'r', encoding='utf-8') as f:
+                yield f
+    
+    def _read_owner(self, names: List[str]) -> Optional[str]:
+        """
+        Lee el usuario dueño desde personal_information.json, si está en la exportación.
+        
+        Returns:
+            Optional[str]: Usuario, o None si no se encuentra.
+        """
+        for name in names:
+            if self._basename(name) != 'personal_information.json':
+                continue
+            try:
+                with self._open(name) as stream:
+                    for entry in iter_json_array(stream):
+                        return entry['string_map_data']['Username']['value']
+            except (ValueError, KeyError, TypeError):
+                return None
+        return None
+    
+    @staticmethod
+    def _basename(name: str) -> str:
+        return name.replace('\\', '/').rsplit('/', 1)[-1]
+    
+    @classmethod
+    def _file_order(cls, name: str) -> int:
+        match = re.search(r'_(\d+)\.json$', cls._basename(name))
+        return int(match.group(1)) if match else 0
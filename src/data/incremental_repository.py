@@ -0,0 +1,254 @@
+"""
+Repositorio con sincronización incremental de seguidores y seguidos.
+"""
+
+import time
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from .interfaces import IInstagramRepository
+from .instagram_repository import InstagramRepository
+from .relation_snapshot import RelationSnapshot, RelationSnapshotStore
+from ..analysis.models import UserRecord
+
+
+class IncrementalInstagramRepository(IInstagramRepository):
+    """
+    Decorador de InstagramRepository que evita volver a descargar listas completas.
+    Instagram devuelve las listas de más reciente a más antiguo, así que basta con leer
+    páginas hasta encontrar una racha de usuarios ya conocidos en la última lista guardada.
+    La unión de los nuevos con la lista anterior solo es correcta si nadie se fue; eso se
+    comprueba contra el total del perfil y, si no coincide, se hace una descarga completa.
+    El total no detecta que alguien se vaya y otro llegue entre dos análisis, así que además
+    los usuarios conocidos leídos deben ser, en orden, el principio de la lista guardada, y
+    cada cierto número de sincronizaciones o de días la lista se vuelve a descargar entera.
+    Los usuarios se comparan por identificador numérico, así que un cambio de nombre no
+    cuenta como usuario nuevo: se conserva el nombre más reciente.
+    """
+    
+    def __init__(
+        self,
+        repository: InstagramRepository,
+        snapshot_store: RelationSnapshotStore,
+        stop_after_known: int = 50,
+        full_sync_every: int = 10,
+        full_sync_days: float = 7.0
+    ):
+        """
+        Inicializa el repositorio incremental.
+        
+        Args:
+            repository: Repositorio que descarga de Instagram.
+            snapshot_store: Almacén de las últimas listas completas.
+            stop_after_known: Usuarios conocidos seguidos tras los que se deja de paginar.
+            full_sync_every: Sincronizaciones incrementales seguidas antes de forzar una completa.
+            full_sync_days: Días desde la última descarga completa tras los que se fuerza otra.
+        """
+        self._repository = repository
+        self._snapshot_store = snapshot_store
+        self._stop_after_known = max(1, stop_after_known)
+        self._full_sync_every = max(1, full_sync_every)
+        self._full_sync_seconds = full_sync_days * 86400
+    
+    def get_followers(self, username: Optional[str] = None) -> Set[str]:
+        """
+        Obtiene la lista de seguidores de un usuario.
+        
+        Args:
+            username: Nombre de usuario. Si es None, usa el usuario autenticado.
+            
+        Returns:
+            Set[str]: Conjunto de nombres de usuario de los seguidores.
+        """
+        return {user.username for batch in self._sync(username, 'followers') for user in batch}
+    
+    def get_following(self, username: Optional[str] = None) -> Set[str]:
+        """
+        Obtiene la lista de usuarios seguidos por un usuario.
+        
+        Args:
+            username: Nombre de usuario. Si es None, usa el usuario autenticado.
+            
+        Returns:
+            Set[str]: Conjunto de nombres de usuario seguidos.
+        """
+        return {user.username for batch in self._sync(username, 'following') for user in batch}
+    
+    def iter_followers(self, username: Optional[str] = None) -> Iterator[List[UserRecord]]:
+        """
+        Obtiene los seguidores por lotes.
+        La sincronización empieza al pedir el primer lote, en el hilo que los consume.
+        
+        Args:
+            username: Nombre de usuario. Si es None, usa el usuario autenticado.
+            
+        Yields:
+            List[UserRecord]: Lotes de seguidores (identificador y nombre de usuario).
+        """
+        yield from self._sync(username, 'followers')
+    
+    def iter_following(self, username: Optional[str] = None) -> Iterator[List[UserRecord]]:
+        """
+        Obtiene los seguidos por lotes.
+        La sincronización empieza al pedir el primer lote, en el hilo que los consume.
+        
+        Args:
+            username: Nombre de usuario. Si es None, usa el usuario autenticado.
+            
+        Yields:
+            List[UserRecord]: Lotes de seguidos (identificador y nombre de usuario).
+        """
+        yield from self._sync(username, 'following')
+    
+    def get_profile_info(self, username: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Obtiene información del perfil de un usuario.
+        
+        Args:
+            username: Nombre de usuario. Si es None, usa el usuario autenticado.
+            
+        Returns:
+            Dict[str, Any]: Información del perfil.
+        """
+        return self._repository.get_profile_info(username)
+    
+    @staticmethod
+    def _iter_batches(members: List[UserRecord], batch_size: int = 500) -> Iterator[List[UserRecord]]:
+        for start in range(0, len(members), batch_size):
+            yield members[start:start + batch_size]
+    
+    def _sync(self, username: Optional[str], kind: str) -> Iterator[List[UserRecord]]:
+        """
+        Sincroniza una lista y guarda el resultado como nueva referencia.
+        Una descarga completa entrega cada lote en cuanto llega; la incremental, al terminar.
+        
+        Args:
+            username: Nombre de usuario. Si es None, usa el usuario autenticado.
+            kind: Tipo de lista ('followers' o 'following').
+            
+        Yields:
+            List[UserRecord]: Lotes de la lista completa en orden de Instagram.
+        """
+        target = username or self._repository.get_profile_info()['username']
+        previous = self._snapshot_store.load(target, kind)
+        
+        delta = None
+        if previous is not None and not self._full_sync_due(previous):
+            delta = self._try_delta(target, kind, previous.members)
+        
+        if delta is None:
+            members: List[UserRecord] = []
+            for batch in self._full_crawl(target, kind):
+                members.extend(batch)
+                yield batch
+            self._snapshot_store.save(target, kind, members)
+            return
+        
+        members, complete = delta
+        yield from self._iter_batches(members)
+        self._snapshot_store.save(target, kind, members, previous=None if complete else previous)
+    
+    def _full_sync_due(self, previous: RelationSnapshot) -> bool:
+        """
+        Indica si toca volver a descargar la lista entera para corregir bajas no detectadas.
+        
+        Args:
+            previous: Última lista guardada.
+            
+        Returns:
+            bool: True si se superó el número de sincronizaciones o los días configurados.
+        """
+        if previous.delta_syncs >= self._full_sync_every:
+            print(f"   ↻ {previous.delta_syncs} sincronizaciones incrementales seguidas: "
+                  f"se descarga la lista completa")
+            return True
+        if time.time() - previous.full_sync_at >= self._full_sync_seconds:
+            print("   ↻ La última descarga completa es antigua: se descarga la lista completa")
+            return True
+        return False
+    
+    def _iter_source(self, target: str, kind: str, resumable: bool) -> Iterator[List[UserRecord]]:
+        if kind == 'followers':
+            return self._repository.iter_followers(target, resumable=resumable)
+        return self._repository.iter_following(target, resumable=resumable)
+    
+    def _full_crawl(self, target: str, kind: str) -> Iterator[List[UserRecord]]:
+        """
+        Descarga la lista completa, conservando el orden y sin duplicados.
+        
+        Yields:
+            List[UserRecord]: Lotes en orden de Instagram, sin usuarios ya entregados.
+        """
+        seen: Set[int] = set()
+        for batch in self._iter_source(target, kind, resumable=True):
+            fresh = [user for user in batch if user.user_id not in seen]
+            seen.update(user.user_id for user in fresh)
+            if fresh:
+                yield fresh
+    
+    def _try_delta(
+        self,
+        target: str,
+        kind: str,
+        previous: List[UserRecord]
+    ) -> Optional[Tuple[List[UserRecord], bool]]:
+        """
+        Lee solo las páginas nuevas y las combina con la lista anterior.
+        
+        Args:
+            target: Cuenta de la lista.
+            kind: Tipo de lista.
+            previous: Última lista guardada.
+            
+        Returns:
+            Optional[Tuple[List[UserRecord], bool]]: Lista actualizada y si se leyó entera,
+            o None si hace falta una descarga completa.
+        """
+        known = {user.user_id for user in previous}
+        expected = self._repository.get_profile_info(target)[kind]
+        
+        seen: Set[int] = set()
+        crawled: List[UserRecord] = []
+        fresh: List[UserRecord] = []
+        known_run = 0
+        stopped_early = False
+        
+        batches = self._iter_source(target, kind, resumable=False)
+        try:
+            for batch in batches:
+                for user in batch:
+                    if user.user_id in seen:
+                        continue
+                    seen.add(user.user_id)
+                    crawled.append(user)
+                    if user.user_id in known:
+                        known_run += 1
+                    else:
+                        known_run = 0
+                        fresh.append(user)
+                if known_run >= self._stop_after_known:
+                    stopped_early = True
+                    break
+        finally:
+            batches.close()
+        
+        if not stopped_early:
+            # Se recorrió la lista entera: ya es una descarga completa
+            return crawled, True
+        
+        # Si alguien de la cabecera guardada se fue, los conocidos leídos no coinciden con ella
+        known_read = [user.user_id for user in crawled if user.user_id in known]
+        head = [user.user_id for user in previous[:len(known_read)]]
+        if known_read != head:
+            print("   ↻ Las primeras páginas no coinciden con la lista guardada: se descarga la lista completa")
+            return None
+        
+        # Lo leído en esta pasada manda: incluye los nombres actualizados de quienes se renombraron
+        members = crawled + [user for user in previous if user.user_id not in seen]
+        
+        if len(members) != expected:
+            print(f"   ↻ {len(members)} usuarios tras la sincronización incremental, el perfil indica "
+                  f"{expected}: se descarga la lista completa")
+            return None
+        
+        print(f"   ⚡ Sincronización incremental: {len(fresh)} nuevos, {len(crawled)} usuarios leídos "
+              f"de {expected}")
+        return members, False
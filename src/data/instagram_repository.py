@@ -3,9 +3,17 @@ Implementación del repositorio de Instagram usando Instaloader.
 """
 
 import instaloader
-from typing import Set, Dict, Any, Optional
+from instaloader import FrozenNodeIterator, NodeIterator
+from typing import Set, Dict, Any, Iterator, List, Optional, Tuple
 from .interfaces import IInstagramRepository
+from .crawl_checkpoint import CrawlCheckpoint, CrawlCheckpointStore
+from .pagination import CrawlPage, freeze_page_boundary, iter_pages, prefetch
+from .page_size import GraphQLPageSize, PagedContext
+from .rate_limiter import AdaptiveRateLimiter
 from ..auth.interfaces import IAuthenticationProvider
+from ..auth.http_transport import HTTPTransport
+from ..auth.profile_cache import ProfileCache
+from ..analysis.models import UserRecord
 
 
 class InstagramRepository(IInstagramRepository):
@@ -15,19 +23,45 @@ class InstagramRepository(IInstagramRepository):
     Siguiendo Dependency Inversion Principle: depende de IAuthenticationProvider.
     """
     
-    def __init__(self, auth_provider: IAuthenticationProvider):
+    RESTORED_BATCH_SIZE = 500
+    
+    def __init__(
+        self,
+        auth_provider: IAuthenticationProvider,
+        profile_cache: Optional[ProfileCache] = None,
+        checkpoint_store: Optional[CrawlCheckpointStore] = None,
+        checkpoint_interval: int = 10,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        transport: Optional[HTTPTransport] = None,
+        prefetch_depth: int = 1,
+        page_size: Optional[GraphQLPageSize] = None
+    ):
         """
         Inicializa el repositorio con un proveedor de autenticación.
         
         Args:
             auth_provider: Proveedor de autenticación que proporciona el loader.
+            profile_cache: Caché de perfiles compartida con el resto de la sesión.
+            checkpoint_store: Almacén de checkpoints. Si es None, las descargas no se pueden reanudar.
+            checkpoint_interval: Páginas descargadas entre checkpoints.
+            rate_limiter: Limitador compartido por todas las solicitudes del repositorio.
+            transport: Transporte HTTP del loader, para mostrar los tiempos de cada página.
+            prefetch_depth: Páginas pedidas por adelantado mientras se procesa la actual (0 lo desactiva).
+            page_size: Tamaño de página de seguidores y seguidos. Si es None, el de Instaloader.
         """
         if not auth_provider.is_authenticated():
             raise ValueError("El proveedor de autenticación debe estar autenticado")
         
         self._auth_provider = auth_provider
         self._loader = auth_provider.get_loader()
+        self._context = PagedContext(self._loader.context, page_size) if page_size else self._loader.context
         self._username = auth_provider.get_username()
+        self._profile_cache = profile_cache or ProfileCache()
+        self._checkpoint_store = checkpoint_store
+        self._checkpoint_interval = max(1, checkpoint_interval)
+        self._rate_limiter = rate_limiter or AdaptiveRateLimiter()
+        self._transport = transport
+        self._prefetch_depth = max(0, prefetch_depth)
     
     def get_followers(self, username: Optional[str] = None) -> Set[str]:
         """
@@ -39,77 +73,286 @@ class InstagramRepository(IInstagramRepository):
         Returns:
             Set[str]: Conjunto de nombres de usuario de los seguidores.
         """
-        target_username = username or self._username
+        followers = set()
+        for batch in self.iter_followers(username):
+            followers.update(user.username for user in batch)
         
-        if not target_username:
-            raise ValueError("No hay usuario especificado")
+        print(f"✓ Total de seguidores: {len(followers)}")
+        return followers
+    
+    def get_following(self, username: Optional[str] = None) -> Set[str]:
+        """
+        Obtiene la lista de usuarios seguidos por un usuario.
         
-        try:
-            print(f"\n📥 Obteniendo seguidores de @{target_username}...")
-            profile = instaloader.Profile.from_username(
-                self._loader.context,
-                target_username
-            )
-            
-            followers = set()
-            count = 0
+        Args:
+            username: Nombre de usuario. Si es None, usa el usuario autenticado.
             
-            for follower in profile.get_followers():
-                followers.add(follower.username)
-                count += 1
-                if count % 50 == 0:
-                    print(f"   Procesados {count} seguidores...")
+        Returns:
+            Set[str]: Conjunto de nombres de usuario seguidos.
+        """
+        following = set()
+        for batch in self.iter_following(username):
+            following.update(user.username for user in batch)
+        
+        print(f"✓ Total de seguidos: {len(following)}")
+        return following
+    
+    def iter_followers(self, username: Optional[str] = None, resumable: bool = True) -> Iterator[List[UserRecord]]:
+        """
+        Obtiene los seguidores de un usuario por lotes, a medida que llegan las páginas.
+        
+        Args:
+            username: Nombre de usuario. Si es None, usa el usuario autenticado.
+            resumable: Si es False, no se usan ni se guardan checkpoints (recorridos parciales a propósito).
             
-            print(f"✓ Total de seguidores: {len(followers)}")
-            return followers
+        Returns:
+            Iterator[List[UserRecord]]: Lotes de seguidores (identificador y nombre de usuario).
+        """
+        target_username = self._resolve_target(username)
+        print(f"\n📥 Obteniendo seguidores de @{target_username}...")
+        return self._iter_relation(target_username, 'followers', "seguidores", resumable)
+    
+    def iter_following(self, username: Optional[str] = None, resumable: bool = True) -> Iterator[List[UserRecord]]:
+        """
+        Obtiene los usuarios seguidos por un usuario por lotes, a medida que llegan las páginas.
+        
+        Args:
+            username: Nombre de usuario. Si es None, usa el usuario autenticado.
+            resumable: Si es False, no se usan ni se guardan checkpoints (recorridos parciales a propósito).
             
-        except instaloader.exceptions.ProfileNotExistsException:
-            raise ValueError(f"El perfil @{target_username} no existe")
-        except instaloader.exceptions.LoginRequiredException:
-            raise PermissionError("Se requiere autenticación para acceder a esta información")
-        except Exception as e:
-            raise Exception(f"Error al obtener seguidores: {e}")
+        Returns:
+            Iterator[List[UserRecord]]: Lotes de seguidos (identificador y nombre de usuario).
+        """
+        target_username = self._resolve_target(username)
+        print(f"\n📤 Obteniendo seguidos de @{target_username}...")
+        return self._iter_relation(target_username, 'following', "seguidos", resumable)
     
-    def get_following(self, username: Optional[str] = None) -> Set[str]:
+    @property
+    def rate_limiter(self) -> AdaptiveRateLimiter:
+        """Limitador de velocidad del repositorio."""
+        return self._rate_limiter
+    
+    def _resolve_target(self, username: Optional[str]) -> str:
         """
-        Obtiene la lista de usuarios seguidos por un usuario.
+        Determina la cuenta a consultar.
         
         Args:
             username: Nombre de usuario. Si es None, usa el usuario autenticado.
             
         Returns:
-            Set[str]: Conjunto de nombres de usuario seguidos.
+            str: Nombre de usuario a consultar.
         """
         target_username = username or self._username
         
         if not target_username:
             raise ValueError("No hay usuario especificado")
         
-        try:
-            print(f"\n📤 Obteniendo seguidos de @{target_username}...")
-            profile = instaloader.Profile.from_username(
-                self._loader.context,
-                target_username
-            )
+        return target_username
+    
+    def _get_profile(self, username: str) -> instaloader.Profile:
+        """
+        Obtiene un perfil desde la caché o, si no está, a través del limitador.
+        
+        Args:
+            username: Nombre de usuario.
             
-            following = set()
-            count = 0
+        Returns:
+            Profile: Perfil de Instagram.
+        """
+        return self._rate_limiter.call(self._profile_cache.get_profile, self._context, username)
+    
+    def _iter_relation(self, target: str, kind: str, label: str, resumable: bool) -> Iterator[List[UserRecord]]:
+        """
+        Descarga una lista de relaciones traduciendo los errores de Instaloader.
+        
+        Args:
+            target: Cuenta cuya lista se descarga.
+            kind: Tipo de lista ('followers' o 'following').
+            label: Nombre de la lista para los mensajes.
+            resumable: Si se usan checkpoints.
+            
+        Yields:
+            List[UserRecord]: Lotes de usuarios.
+        """
+        try:
+            profile = self._get_profile(target)
             
-            for followee in profile.get_followees():
-                following.add(followee.username)
-                count += 1
-                if count % 50 == 0:
-                    print(f"   Procesados {count} seguidos...")
+            if kind == 'followers':
+                iterator = self._rate_limiter.call(profile.get_followers)
+            else:
+                iterator = self._rate_limiter.call(profile.get_followees)
             
-            print(f"✓ Total de seguidos: {len(following)}")
-            return following
+            yield from self._crawl(target, kind, iterator, label, resumable)
             
         except instaloader.exceptions.ProfileNotExistsException:
-            raise ValueError(f"El perfil @{target_username} no existe")
+            raise ValueError(f"El perfil @{target} no existe")
         except instaloader.exceptions.LoginRequiredException:
             raise PermissionError("Se requiere autenticación para acceder a esta información")
         except Exception as e:
-            raise Exception(f"Error al obtener seguidos: {e}")
+            raise Exception(f"Error al obtener {label}: {e}")
+    
+    def _crawl(
+        self,
+        target: str,
+        kind: str,
+        iterator: NodeIterator,
+        label: str,
+        resumable: bool = True
+    ) -> Iterator[List[UserRecord]]:
+        """
+        Recorre un iterador paginado guardando checkpoints cada N páginas.
+        Si la descarga se interrumpe, el próximo intento continúa desde el último checkpoint
+        y vuelve a entregar primero los usuarios que ya se habían obtenido.
+        Las páginas siguientes se piden en segundo plano mientras se procesa la actual;
+        los recorridos no reanudables suelen cortarse pronto y no se adelantan.
+        
+        Args:
+            target: Cuenta cuya lista se descarga.
+            kind: Tipo de lista ('followers' o 'following').
+            iterator: Iterador de Instaloader sin usar.
+            label: Nombre de la lista para los mensajes de progreso.
+            resumable: Si es False, el recorrido no lee ni escribe checkpoints.
+            
+        Yields:
+            List[UserRecord]: Usuarios de cada página.
+        """
+        checkpoints = resumable and self._checkpoint_store is not None
+        checkpoint = self._resume_checkpoint(target, kind, iterator, label) if checkpoints else None
+        pages = checkpoint.pages if checkpoint else 0
+        state = checkpoint.iterator_state if checkpoint else None
+        pending = []
+        count = 0
+        
+        if checkpoint:
+            restored, checkpoint.users = checkpoint.users, []
+            count = len(restored)
+            for start in range(0, len(restored), self.RESTORED_BATCH_SIZE):
+                yield restored[start:start + self.RESTORED_BATCH_SIZE]
+        
+        try:
+            depth = self._prefetch_depth if resumable else 0
+            for page, page_state, timing in prefetch(self._fetch_pages(iterator, checkpoints), depth):
+                batch = [UserRecord(user.userid, user.username) for user in page.items]
+                pending.extend(batch)
+                
+                previous = count
+                count += len(batch)
+                if count // 50 > previous // 50:
+                    # Una sola escritura por línea: las dos descargas imprimen en paralelo
+                    print(f"   Procesados {count} {label}...{timing}\n", end="")
+                
+                pages += 1
+                state = page_state
+                if checkpoints and pages % self._checkpoint_interval == 0:
+                    checkpoint = self._save_checkpoint(checkpoint, target, kind, state, pages, pending)
+                    pending = []
+                
+                yield batch
+        except BaseException:
+            if checkpoints and (pending or checkpoint):
+                self._save_checkpoint(checkpoint, target, kind, state, pages, pending)
+                print(f"   💾 Progreso guardado: {count} {label} (se reanudará en el próximo intento)")
+            raise
+        
+        if checkpoints:
+            self._checkpoint_store.delete(target, kind)
+    
+    def _fetch_pages(
+        self,
+        iterator: NodeIterator,
+        freeze: bool
+    ) -> Iterator[Tuple[CrawlPage, Optional[Dict[str, Any]], str]]:
+        """
+        Pide las páginas de un iterador. Con prefetch corre en otro hilo, así que el estado
+        del iterador y los tiempos de cada página se toman aquí, justo después de recibirla:
+        cuando el consumidor la procesa, el iterador ya puede ir por la siguiente.
+        
+        Args:
+            iterator: Iterador de Instaloader.
+            freeze: Si es True, se congela el iterador al final de cada página.
+            
+        Yields:
+            Tuple[CrawlPage, Optional[Dict[str, Any]], str]: Página, estado del iterador en
+            el límite tras ella (o None) y descripción de sus tiempos.
+        """
+        for page in iter_pages(iterator, self._rate_limiter):
+            state = freeze_page_boundary(iterator) if freeze else None
+            yield page, state, self._page_timing()
+    
+    def _page_timing(self) -> str:
+        """
+        Describe los tiempos de la última solicitud de este hilo.
+        
+        Returns:
+            str: Conexión y servidor en milisegundos, o vacío si no hay transporte.
+        """
+        timing = self._transport.last_timing if self._transport else None
+        if timing is None:
+            return ""
+        return (f" (última página: conexión {1000 * timing.connect_seconds:.0f} ms, "
+                f"servidor {1000 * timing.server_seconds:.0f} ms)")
+    
+    def _resume_checkpoint(
+        self,
+        target: str,
+        kind: str,
+        iterator: NodeIterator,
+        label: str
+    ) -> Optional[CrawlCheckpoint]:
+        """
+        Restaura el estado de un iterador desde su último checkpoint, si existe.
+        
+        Returns:
+            Optional[CrawlCheckpoint]: Checkpoint aplicado o None si se empieza desde cero.
+        """
+        if not self._checkpoint_store:
+            return None
+        
+        checkpoint = self._checkpoint_store.load(target, kind)
+        if not checkpoint:
+            return None
+        
+        if checkpoint.is_expired:
+            print(f"   Checkpoint de {label} vencido, se descarga desde el inicio")
+            self._checkpoint_store.delete(target, kind)
+            return None
+        
+        try:
+            iterator.thaw(FrozenNodeIterator(**checkpoint.iterator_state))
+        except (instaloader.exceptions.InvalidArgumentException, TypeError) as e:
+            print(f"   Checkpoint de {label} incompatible ({e}), se descarga desde el inicio")
+            self._checkpoint_store.delete(target, kind)
+            return None
+        
+        print(f"   ↻ Reanudando desde la página {checkpoint.pages} "
+              f"({len(checkpoint.users)} {label} ya obtenidos)")
+        return checkpoint
+    
+    def _save_checkpoint(
+        self,
+        checkpoint: Optional[CrawlCheckpoint],
+        target: str,
+        kind: str,
+        iterator_state: Dict[str, Any],
+        pages: int,
+        pending: List[UserRecord]
+    ) -> CrawlCheckpoint:
+        """
+        Guarda el progreso en disco.
+        
+        Args:
+            iterator_state: Iterador congelado en el límite de la última página procesada.
+            
+        Returns:
+            CrawlCheckpoint: Checkpoint actualizado.
+        """
+        if checkpoint is None:
+            checkpoint = CrawlCheckpoint(target=target, kind=kind, iterator_state={})
+        
+        checkpoint.iterator_state = iterator_state
+        checkpoint.pages = pages
+        self._checkpoint_store.save(checkpoint, pending)
+        return checkpoint
     
     def get_profile_info(self, username: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -127,10 +370,7 @@ class InstagramRepository(IInstagramRepository):
             raise ValueError("No hay usuario especificado")
         
         try:
-            profile = instaloader.Profile.from_username(
-                self._loader.context,
-                target_username
-            )
+            profile = self._get_profile(target_username)
             
             return {
                 'username': profile.username,
@@ -3,7 +3,8 @@ Interfaces para el módulo de datos.
 """
 
 from abc import ABC, abstractmethod
-from typing import Set, Dict, Any, Optional
+from typing import Set, Dict, Any, Iterator, List, Optional
+from ..analysis.models import UserRecord
 
 
 class IInstagramRepository(ABC):
@@ -39,6 +40,33 @@ class IInstagramRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def iter_followers(self, username: Optional[str] = None) -> Iterator[List[UserRecord]]:
+        """
+        Obtiene los seguidores de un usuario por lotes, a medida que se descargan.
+        Permite procesar los datos sin esperar a que termine la descarga completa.
+        
+        Args:
+            username: Nombre de usuario. Si es None, usa el usuario autenticado.
+            
+        Returns:
+            Iterator[List[UserRecord]]: Lotes de seguidores (identificador y nombre de usuario).
+        """
+        pass
+    
+    @abstractmethod
+    def iter_following(self, username: Optional[str] = None) -> Iterator[List[UserRecord]]:
+        """
+        Obtiene los usuarios seguidos por un usuario por lotes, a medida que se descargan.
+        
+        Args:
+            username: Nombre de usuario. Si es None, usa el usuario autenticado.
+            
+        Returns:
+            Iterator[List[UserRecord]]: Lotes de seguidos (identificador y nombre de usuario).
+        """
+        pass
+    
     @abstractmethod
     def get_profile_info(self, username: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -0,0 +1,108 @@
+"""
+Lectura incremental de arreglos JSON grandes.
+"""
+
+import json
+import re
+from typing import Any, Iterator, TextIO
+
+_WHITESPACE = ' \t\n\r'
+# Lo que queda de un bloque que termina a mitad de un número ("-4." de "-4.5e3")
+_NUMBER_TAIL = re.compile(r'[0-9+\-.eE]*\Z')
+
+
+class _Buffer:
+    """Ventana deslizante sobre un archivo de texto que se lee por bloques."""
+    
+    def __init__(self, stream: TextIO, chunk_size: int):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self.text = ''
+        self.pos = 0
+        self.eof = False
+    
+    def fill(self) -> bool:
+        """Lee un bloque más; devuelve False si el archivo terminó."""
+        if self.eof:
+            return False
+        chunk = self._stream.read(self._chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        # Se descarta lo ya consumido para que la memoria no crezca con el archivo
+        self.text = self.text[self.pos:] + chunk
+        self.pos = 0
+        return True
+    
+    def skip_whitespace(self) -> bool:
+        """Avanza hasta el próximo carácter significativo; False si el archivo terminó."""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return True
+            if not self.fill():
+                return False
+    
+    def expect(self, chars: str) -> str:
+        """Consume un carácter que debe ser uno de chars."""
+        if not self.skip_whitespace():
+            raise ValueError("JSON incompleto")
+        char = self.text[self.pos]
+        if char not in chars:
+            raise ValueError(f"Se esperaba uno de {chars!r} y se encontró {char!r}")
+        self.pos += 1
+        return char
+    
+    def decode(self, decoder: json.JSONDecoder) -> Any:
+        """Decodifica el próximo valor completo, leyendo más bloques si hace falta."""
+        self.skip_whitespace()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # Un número al final del bloque puede estar cortado: se confirma con más texto
+            if (type(value) in (int, float) and not self.eof and _NUMBER_TAIL.match(self.text, end)
+                    and self.fill()):
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_array(stream: TextIO, chunk_size: int = 64 * 1024) -> Iterator[Any]:
+    """
+    Recorre los elementos de un arreglo JSON sin cargar el archivo entero.
+    Acepta un arreglo en la raíz ([...]) o un objeto cuyo primer valor es el arreglo
+    ({"relationships_following": [...]}), que son los dos formatos de la exportación
+    de Instagram. Solo hay en memoria el bloque actual y el elemento que se decodifica.
+    
+    Args:
+        stream: Archivo de texto abierto.
+        chunk_size: Caracteres leídos por bloque.
+        
+    Yields:
+        Any: Cada elemento del arreglo, ya decodificado.
+        
+    Raises:
+        ValueError: Si el contenido no tiene ninguno de los dos formatos.
+    """
+    buffer = _Buffer(stream, chunk_size)
+    decoder = json.JSONDecoder()
+    
+    if buffer.expect('[{') == '{':
+        buffer.decode(decoder)  # Clave del objeto
+        buffer.expect(':')
+        buffer.expect('[')
+    
+    if not buffer.skip_whitespace():
+        raise ValueError("JSON incompleto")
+    if buffer.text[buffer.pos] == ']':
+        return
+    
+    while True:
+        yield buffer.decode(decoder)
+        if buffer.expect(',]') == ']':
+            return
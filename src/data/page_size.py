@@ -0,0 +1,124 @@
+"""
+Tamaño de página de las consultas GraphQL de seguidores y seguidos.
+"""
+
+import threading
+from typing import Any, Dict, Optional
+import instaloader
+
+
+class GraphQLPageSize:
+    """
+    Tamaño de página negociado con Instagram para cada tipo de consulta.
+    Se empieza por el tamaño configurado (el mayor que se quiere probar); si Instagram
+    responde 400 se reduce a la mitad, igual que hacía Instaloader en graphql_node_list,
+    hasta dar con uno que acepte o llegar al mínimo de Instaloader.
+    El tamaño aceptado se recuerda, así que el sondeo solo cuesta solicitudes la primera vez.
+    Es seguro compartirlo entre hilos y repositorios.
+    """
+    
+    MIN_PAGE_SIZE = 12  # El tamaño por defecto de Instaloader
+    
+    def __init__(self, page_size: int = 50):
+        """
+        Inicializa el tamaño de página.
+        
+        Args:
+            page_size: Tamaño máximo a probar.
+        """
+        self._initial = max(self.MIN_PAGE_SIZE, page_size)
+        self._sizes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+    
+    def size_for(self, query_hash: str) -> int:
+        """
+        Obtiene el tamaño de página a pedir para un tipo de consulta.
+        
+        Args:
+            query_hash: Identificador de la consulta GraphQL.
+            
+        Returns:
+            int: Tamaño de página.
+        """
+        with self._lock:
+            return self._sizes.get(query_hash, self._initial)
+    
+    def reject(self, query_hash: str, size: int) -> bool:
+        """
+        Registra que Instagram rechazó un tamaño de página.
+        
+        Args:
+            query_hash: Identificador de la consulta GraphQL.
+            size: Tamaño rechazado.
+            
+        Returns:
+            bool: True si hay un tamaño menor que probar.
+        """
+        with self._lock:
+            current = self._sizes.get(query_hash, self._initial)
+            if size < current:
+                # Otro hilo ya lo redujo mientras esta solicitud estaba en curso
+                return True
+            if current <= self.MIN_PAGE_SIZE:
+                return False
+            self._sizes[query_hash] = max(self.MIN_PAGE_SIZE, current // 2)
+            print(f"   ↓ Instagram rechazó páginas de {current}; se usan de {self._sizes[query_hash]}\n", end="")
+            return True
+
+
+class PagedContext:
+    """
+    Sustituto de InstaloaderContext que pide las páginas de GraphQL con el tamaño negociado.
+    Los NodeIterator de Instaloader siempre piden 12 elementos por página; este contexto
+    reescribe la variable 'first' de cada consulta paginada. El resto de atributos y
+    métodos son los del contexto original.
+    """
+    
+    def __init__(self, context: instaloader.InstaloaderContext, page_size: GraphQLPageSize):
+        """
+        Inicializa el contexto.
+        
+        Args:
+            context: Contexto original (el de un loader o el de un grupo de sesiones).
+            page_size: Tamaño de página compartido.
+        """
+        self._context = context
+        self._page_size = page_size
+    
+    @property
+    def wrapped(self) -> instaloader.InstaloaderContext:
+        """Contexto original al que se delega todo lo demás."""
+        return self._context
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._context, name)
+    
+    def graphql_query(
+        self,
+        query_hash: str,
+        variables: Dict[str, Any],
+        referer: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Hace una consulta GraphQL; si es paginada, con el tamaño de página negociado.
+        
+        Args:
+            query_hash: Identificador de la consulta.
+            variables: Variables de la consulta.
+            referer: Cabecera Referer, o None.
+            
+        Returns:
+            Dict[str, Any]: Respuesta de Instagram.
+        """
+        if 'first' not in variables:
+            return self._context.graphql_query(query_hash, variables, referer)
+        
+        while True:
+            size = self._page_size.size_for(query_hash)
+            try:
+                response = self._context.graphql_query(query_hash, {**variables, 'first': size}, referer)
+            except instaloader.exceptions.QueryReturnedBadRequestException:
+                if not self._page_size.reject(query_hash, size):
+                    raise
+                continue
+            return response
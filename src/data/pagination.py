@@ -0,0 +1,144 @@
+"""
+Utilidades de paginación sobre los iteradores de Instaloader.
+"""
+
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, TypeVar
+from instaloader import NodeIterator
+from .rate_limiter import AdaptiveRateLimiter
+
+T = TypeVar('T')
+
+
+@dataclass
+class CrawlPage:
+    """
+    Página de resultados tal como la devolvió Instagram.
+    """
+    number: int
+    items: List[Any]
+
+
+def iter_pages(
+    iterator: NodeIterator,
+    rate_limiter: Optional[AdaptiveRateLimiter] = None
+) -> Iterator[CrawlPage]:
+    """
+    Agrupa los elementos de un NodeIterator en las páginas que los trajeron.
+    Al terminar cada página el iterador queda justo en el límite entre páginas,
+    que es el punto seguro para congelarlo (freeze) y guardar un checkpoint.
+    
+    Args:
+        iterator: Iterador de Instaloader (por ejemplo, profile.get_followers()).
+        rate_limiter: Limitador por el que pasa la solicitud de cada página.
+                      Un fallo al pedir una página deja el iterador intacto, así que se puede reintentar.
+                      
+    Yields:
+        CrawlPage: Cada página completa, en orden.
+    """
+    number = 0
+    while True:
+        # El primer next() de cada página es el que dispara la solicitud
+        try:
+            if rate_limiter:
+                first = rate_limiter.call(next, iterator)
+            else:
+                first = next(iterator)
+        except StopIteration:
+            return
+        
+        # La página puede no tener el tamaño predeterminado de Instaloader (PagedContext, o
+        # lo que quede tras reanudar un checkpoint): se mide sobre los datos que trajo
+        remaining = iterator.freeze().remaining_data
+        length = len(remaining['edges']) if remaining else iterator.page_length()
+        
+        items = [first]
+        for _ in range(length - 1):
+            try:
+                items.append(next(iterator))
+            except StopIteration:
+                break
+        
+        number += 1
+        yield CrawlPage(number=number, items=items)
+
+
+def freeze_page_boundary(iterator: NodeIterator) -> Dict[str, Any]:
+    """
+    Congela un iterador que acaba de terminar una página.
+    NodeIterator.freeze() conserva el último elemento entregado (y descuenta uno de
+    total_index), así que al reanudar se repetiría el último usuario de la página. En el
+    límite entre páginas no queda nada pendiente: se descartan esos elementos y el
+    iterador reanudado pide directamente la página siguiente.
+    
+    Args:
+        iterator: Iterador en el límite entre páginas (tras una página de iter_pages).
+        
+    Returns:
+        Dict[str, Any]: Estado para FrozenNodeIterator(**estado).
+    """
+    state = iterator.freeze()._asdict()
+    remaining = state['remaining_data']
+    if remaining and remaining['edges']:
+        state['total_index'] += len(remaining['edges'])
+        state['remaining_data'] = {**remaining, 'edges': []}
+    return state
+
+
+def prefetch(items: Iterator[T], depth: int = 1) -> Iterator[T]:
+    """
+    Pide los elementos de un iterador en un hilo aparte, adelantándose al consumidor.
+    Mientras el consumidor procesa el elemento N, el hilo ya está pidiendo el N+1
+    (con depth=1, doble buffer). Nunca hay más de depth elementos pedidos por delante
+    del que se está procesando, así que las solicitudes siguen pasando una a una
+    por el limitador de velocidad y, si el consumidor se detiene, se desperdician
+    como mucho depth solicitudes.
+    
+    Args:
+        items: Iterador a recorrer. Se avanza siempre desde el mismo hilo.
+        depth: Elementos que se piden por adelantado. Con 0 no se usa ningún hilo.
+        
+    Yields:
+        T: Los elementos de items, en orden. Un error del iterador se relanza aquí.
+    """
+    if depth <= 0:
+        yield from items
+        return
+    
+    ready: queue.Queue = queue.Queue()
+    slots = threading.Semaphore(depth)
+    stop = threading.Event()
+    done = object()
+    
+    def produce() -> None:
+        try:
+            while True:
+                slots.acquire()
+                if stop.is_set():
+                    return
+                try:
+                    item = next(items)
+                except StopIteration:
+                    ready.put((done, None))
+                    return
+                ready.put((item, None))
+        except BaseException as e:
+            ready.put((done, e))
+    
+    producer = threading.Thread(target=produce, name="prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item, error = ready.get()
+            if error is not None:
+                raise error
+            if item is done:
+                return
+            # Al recibir un elemento se libera su lugar: el hilo pide el siguiente mientras se procesa
+            slots.release()
+            yield item
+    finally:
+        stop.set()
+        slots.release()
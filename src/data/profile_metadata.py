@@ -0,0 +1,238 @@
+"""
+Metadatos de perfiles (nombre, seguidores, privacidad) con caché en disco.
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+from .interfaces import IInstagramRepository
+
+
+@dataclass(frozen=True)
+class ProfileMetadata:
+    """
+    Datos de un perfil guardados en la caché. Un campo es None si nunca se obtuvo.
+    """
+    username: str
+    full_name: Optional[str] = None
+    followers: Optional[int] = None
+    is_private: Optional[bool] = None
+
+
+@dataclass
+class EnrichmentStats:
+    """
+    Resultado de un enriquecimiento por lotes.
+    """
+    requested: int = 0
+    cached: int = 0       # Ya estaban vigentes en la caché
+    resolved: int = 0     # Consultados en Instagram
+    failed: int = 0       # No existen o no se pudieron consultar
+    elapsed_seconds: float = 0.0
+
+
+class ProfileMetadataCache:
+    """
+    Caché en disco de metadatos de perfiles con vigencia por campo.
+    Cada campo guarda el momento en que se obtuvo: el número de seguidores cambia a diario,
+    el nombre casi nunca, así que cada uno vence por separado. Leer de la caché nunca hace
+    solicitudes; solo ProfileEnricher la actualiza. Es segura para usar desde varios hilos.
+    """
+    
+    FIELDS = ('full_name', 'followers', 'is_private')
+    DEFAULT_TTL_SECONDS = {
+        'full_name': 30 * 86400.0,
+        'followers': 86400.0,
+        'is_private': 7 * 86400.0
+    }
+    
+    def __init__(self, path: Path, ttl_seconds: Optional[Dict[str, float]] = None):
+        """
+        Inicializa la caché.
+        
+        Args:
+            path: Archivo JSON de la caché.
+            ttl_seconds: Vigencia de cada campo en segundos. Los campos ausentes usan DEFAULT_TTL_SECONDS.
+        """
+        self.path = path
+        self._ttl_seconds = {**self.DEFAULT_TTL_SECONDS, **(ttl_seconds or {})}
+        self._entries: Optional[Dict[str, Dict[str, list]]] = None
+        self._dirty = False
+        self._lock = threading.RLock()
+    
+    def _load(self) -> Dict[str, Dict[str, list]]:
+        """Lee el archivo la primera vez que se necesita (con el lock adquirido)."""
+        if self._entries is None:
+            self._entries = {}
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as e:
+                print(f"Caché de perfiles ilegible ({e}), se empieza vacía")
+        return self._entries
+    
+    def get(self, username: str) -> Optional[ProfileMetadata]:
+        """
+        Obtiene los datos guardados de un perfil, aunque alguno esté vencido.
+        
+        Args:
+            username: Nombre de usuario.
+            
+        Returns:
+            Optional[ProfileMetadata]: Datos del perfil, o None si nunca se obtuvo.
+        """
+        with self._lock:
+            entry = self._load().get(username.lower())
+        if not entry:
+            return None
+        return ProfileMetadata(
+            username=username,
+            **{name: entry[name][0] for name in self.FIELDS if name in entry}
+        )
+    
+    def needs_refresh(self, username: str, now: Optional[float] = None) -> bool:
+        """
+        Indica si algún campo del perfil falta o está vencido.
+        
+        Args:
+            username: Nombre de usuario.
+            now: Momento de referencia (time.time()).
+            
+        Returns:
+            bool: True si hay que consultar el perfil en Instagram.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._load().get(username.lower())
+        if not entry:
+            return True
+        return any(
+            name not in entry or entry[name][1] + self._ttl_seconds[name] < now
+            for name in self.FIELDS
+        )
+    
+    def update(self, username: str, values: Dict[str, Any]) -> None:
+        """
+        Guarda en memoria los campos obtenidos de un perfil.
+        
+        Args:
+            username: Nombre de usuario.
+            values: Valores por campo (se ignoran los que no están en FIELDS).
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._load().setdefault(username.lower(), {})
+            for name in self.FIELDS:
+                if name in values:
+                    entry[name] = [values[name], now]
+            self._dirty = True
+    
+    def save(self) -> bool:
+        """
+        Escribe la caché en disco si cambió (de forma atómica).
+        
+        Returns:
+            bool: True si está guardada.
+        """
+        with self._lock:
+            if not self._dirty:
+                return True
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_suffix('.tmp')
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._entries, f, ensure_ascii=False, separators=(',', ':'))
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+                return True
+            except Exception as e:
+                print(f"Error al guardar la caché de perfiles: {e}")
+                return False
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._load())
+
+
+class ProfileEnricher:
+    """
+    Completa la caché de metadatos para un conjunto de usuarios.
+    Solo se consultan los perfiles que faltan o tienen algún campo vencido, con varios
+    hilos a la vez; cada consulta pasa por el repositorio, así que respeta su limitador
+    de velocidad y los hilos solo solapan la latencia de red. La caché se guarda cada
+    save_every perfiles para no perder el avance si se interrumpe.
+    """
+    
+    def __init__(
+        self,
+        repository: IInstagramRepository,
+        cache: ProfileMetadataCache,
+        max_workers: int = 4,
+        save_every: int = 100
+    ):
+        """
+        Inicializa el enriquecedor.
+        
+        Args:
+            repository: Repositorio con el que consultar los perfiles.
+            cache: Caché de metadatos a completar.
+            max_workers: Consultas simultáneas como máximo.
+            save_every: Perfiles consultados entre escrituras de la caché.
+        """
+        self._repository = repository
+        self._cache = cache
+        self._max_workers = max(1, max_workers)
+        self._save_every = max(1, save_every)
+    
+    def enrich(self, usernames: Iterable[str]) -> EnrichmentStats:
+        """
+        Obtiene los metadatos de los usuarios que no están vigentes en la caché.
+        
+        Args:
+            usernames: Nombres de usuario.
+            
+        Returns:
+            EnrichmentStats: Cuántos se consultaron, cuántos ya estaban y cuántos fallaron.
+        """
+        start = time.monotonic()
+        usernames = sorted(set(usernames))
+        now = time.time()
+        pending = [username for username in usernames if self._cache.needs_refresh(username, now)]
+        stats = EnrichmentStats(requested=len(usernames), cached=len(usernames) - len(pending))
+        
+        if pending:
+            print(f"\n🔎 Consultando {len(pending)} perfiles ({stats.cached} ya estaban en caché)...")
+            try:
+                with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="enrich") as executor:
+                    futures = {executor.submit(self._repository.get_profile_info, username): username
+                               for username in pending}
+                    try:
+                        for done, future in enumerate(as_completed(futures), 1):
+                            try:
+                                info = future.result()
+                            except Exception:
+                                stats.failed += 1
+                            else:
+                                self._cache.update(futures[future], info)
+                                stats.resolved += 1
+                            
+                            if done % self._save_every == 0:
+                                self._cache.save()
+                                print(f"   Consultados {done} de {len(pending)} perfiles...\n", end="")
+                    except BaseException:
+                        # Se descartan las consultas sin empezar; solo se espera a las que están en curso
+                        for future in futures:
+                            future.cancel()
+                        raise
+            finally:
+                self._cache.save()
+        
+        stats.elapsed_seconds = time.monotonic() - start
+        return stats
@@ -0,0 +1,223 @@
+"""
+Limitador de velocidad adaptativo para las solicitudes a Instagram.
+"""
+
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Optional, TypeVar
+import instaloader
+import requests
+
+T = TypeVar('T')
+
+# Errores de red que suelen resolverse solos al repetir la solicitud
+_TRANSPORT_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+    ConnectionError,
+    TimeoutError
+)
+# Instaloader informa los códigos sin excepción propia como "503 Service Unavailable"
+_SERVER_ERROR = re.compile(r'5\d\d ')
+
+
+@dataclass
+class RateLimiterStats:
+    """
+    Métricas acumuladas del limitador.
+    """
+    requests: int = 0
+    retries: int = 0
+    throttle_events: int = 0
+    throttled_seconds: float = 0.0  # Tiempo en pausa por 429/5xx
+    paced_seconds: float = 0.0      # Tiempo esperando turno en el token bucket
+    elapsed_seconds: float = 0.0
+    current_delay: float = 0.0
+    
+    @property
+    def requests_per_second(self) -> float:
+        """Solicitudes por segundo sostenidas durante la descarga."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.requests / self.elapsed_seconds
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket con reintentos, backoff exponencial con jitter y ajuste adaptativo.
+    En modo adaptativo el intervalo entre solicitudes baja un 10% tras cada racha de
+    respuestas sanas (sin pasar de min_delay) y se duplica tras cada 429/5xx.
+    Es seguro compartirlo entre hilos: todas las descargas que lo usan comparten el mismo presupuesto.
+    Se suma al control de velocidad interno de Instaloader, no lo reemplaza.
+    """
+    
+    HEALTHY_STREAK = 20
+    SPEEDUP_FACTOR = 0.9
+    SLOWDOWN_FACTOR = 2.0
+    
+    def __init__(
+        self,
+        delay: float = 1.0,
+        min_delay: float = 0.5,
+        max_delay: float = 60.0,
+        max_retries: int = 3,
+        adaptive: bool = True,
+        burst: int = 1,
+        max_backoff: float = 300.0
+    ):
+        """
+        Inicializa el limitador.
+        
+        Args:
+            delay: Segundos iniciales entre solicitudes.
+            min_delay: Intervalo mínimo al que puede acelerar el modo adaptativo.
+            max_delay: Intervalo máximo al que puede frenar el modo adaptativo.
+            max_retries: Reintentos por solicitud ante 429/5xx o errores de conexión.
+            adaptive: Si es False, el intervalo se mantiene fijo en delay.
+            burst: Solicitudes que se pueden hacer seguidas sin esperar.
+            max_backoff: Espera máxima entre reintentos.
+        """
+        self._base_delay = delay
+        self._delay = delay
+        self._min_delay = min(min_delay, delay)
+        self._max_delay = max(max_delay, delay)
+        self._max_retries = max_retries
+        self._adaptive = adaptive
+        self._burst = max(1, burst)
+        self._max_backoff = max_backoff
+        
+        self._lock = threading.Lock()
+        self._tokens = float(self._burst)
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self._healthy_streak = 0
+        self._started_at: Optional[float] = None
+        self._stats = RateLimiterStats(current_delay=delay)
+    
+    def acquire(self) -> None:
+        """Espera hasta que haya turno para hacer una solicitud."""
+        with self._lock:
+            now = time.monotonic()
+            if self._started_at is None:
+                self._started_at = now
+            
+            if self._delay > 0:
+                self._tokens = min(self._burst, self._tokens + (now - self._last_refill) / self._delay)
+            else:
+                self._tokens = float(self._burst)
+            self._last_refill = now
+            
+            # Los tokens negativos son turnos ya reservados por otros hilos
+            self._tokens -= 1
+            wait = -self._tokens * self._delay if self._tokens < 0 else 0.0
+            wait = max(wait, self._blocked_until - now)
+            self._stats.requests += 1
+            self._stats.paced_seconds += max(0.0, wait - max(0.0, self._blocked_until - now))
+        
+        if wait > 0:
+            time.sleep(wait)
+    
+    def call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Ejecuta una solicitud respetando el límite y reintentando los errores transitorios.
+        
+        Args:
+            func: Función que realiza la solicitud.
+            
+        Returns:
+            T: Resultado de la función.
+        """
+        attempt = 0
+        while True:
+            self.acquire()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                if attempt >= self._max_retries or not self.is_retryable(e):
+                    self._finish()
+                    raise
+                attempt += 1
+                self._on_failure(e, attempt)
+                continue
+            
+            self._on_success()
+            return result
+    
+    @staticmethod
+    def _causes(error: BaseException) -> Iterator[BaseException]:
+        """Recorre el error y los que lo causaron (Instaloader envuelve el original tras sus reintentos)."""
+        while error is not None:
+            yield error
+            error = error.__cause__
+    
+    @classmethod
+    def is_retryable(cls, error: Exception) -> bool:
+        """
+        Indica si un error es transitorio (429, 5xx o conexión caída).
+        Los 400, 401, 403, 404 y los que piden iniciar sesión no se arreglan repitiendo la solicitud.
+        
+        Args:
+            error: Excepción lanzada por la solicitud.
+            
+        Returns:
+            bool: True si vale la pena reintentar.
+        """
+        for cause in cls._causes(error):
+            if isinstance(cause, (instaloader.exceptions.TooManyRequestsException, *_TRANSPORT_ERRORS)):
+                return True
+            # Solo los ConnectionException genéricos traen el código HTTP al principio del mensaje
+            if type(cause) is instaloader.exceptions.ConnectionException and _SERVER_ERROR.match(str(cause)):
+                return True
+        return False
+    
+    @classmethod
+    def is_throttle(cls, error: Exception) -> bool:
+        """Indica si un error es un 429 de Instagram."""
+        return any(isinstance(cause, instaloader.exceptions.TooManyRequestsException)
+                   for cause in cls._causes(error))
+    
+    def _on_success(self) -> None:
+        with self._lock:
+            self._healthy_streak += 1
+            if self._adaptive and self._healthy_streak >= self.HEALTHY_STREAK:
+                self._healthy_streak = 0
+                self._delay = max(self._min_delay, self._delay * self.SPEEDUP_FACTOR)
+            self._finish_locked()
+    
+    def _on_failure(self, error: Exception, attempt: int) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._healthy_streak = 0
+            self._stats.retries += 1
+            if self.is_throttle(error):
+                self._stats.throttle_events += 1
+            if self._adaptive:
+                self._delay = min(self._max_delay, max(self._delay, self._base_delay) * self.SLOWDOWN_FACTOR)
+            
+            # Backoff exponencial con jitter; bloquea a todos los hilos que comparten el limitador
+            backoff = min(self._max_backoff, self._delay * (2 ** attempt)) * random.uniform(0.5, 1.5)
+            until = now + backoff
+            if until > self._blocked_until:
+                self._stats.throttled_seconds += until - max(self._blocked_until, now)
+                self._blocked_until = until
+        print(f"   ⏳ Instagram limitó la solicitud ({error}); reintento {attempt}/{self._max_retries} "
+              f"en {backoff:.0f}s")
+    
+    def _finish(self) -> None:
+        with self._lock:
+            self._finish_locked()
+    
+    def _finish_locked(self) -> None:
+        if self._started_at is not None:
+            self._stats.elapsed_seconds = time.monotonic() - self._started_at
+        self._stats.current_delay = self._delay
+    
+    @property
+    def stats(self) -> RateLimiterStats:
+        """Métricas acumuladas del limitador."""
+        with self._lock:
+            return RateLimiterStats(**self._stats.__dict__)
@@ -0,0 +1,111 @@
+"""
+Almacén de la última lista descargada de seguidores y seguidos.
+"""
+
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+from ..analysis.models import UserRecord
+
+
+@dataclass
+class RelationSnapshot:
+    """
+    Última lista guardada de una cuenta y cuándo se comprobó entera por última vez.
+    """
+    members: List[UserRecord]
+    full_sync_at: float = 0.0  # Última descarga completa (0 si se desconoce)
+    delta_syncs: int = 0       # Sincronizaciones incrementales desde entonces
+
+
+class RelationSnapshotStore:
+    """
+    Guarda la última lista completa de cada cuenta y tipo, en el orden en que la devolvió
+    Instagram (más recientes primero). Es la referencia de la sincronización incremental.
+    Cada usuario se guarda con su identificador numérico, que no cambia al renombrarse.
+    También guarda cuándo se descargó la lista completa, para saber cuándo volver a hacerlo.
+    """
+    
+    def __init__(self, directory: Path):
+        """
+        Inicializa el almacén.
+        
+        Args:
+            directory: Directorio donde guardar las listas.
+        """
+        self.directory = directory
+    
+    def _path(self, target: str, kind: str) -> Path:
+        return self.directory / f"{target.lower()}_{kind}.json"
+    
+    def load(self, target: str, kind: str) -> Optional[RelationSnapshot]:
+        """
+        Carga la última lista guardada.
+        
+        Args:
+            target: Cuenta de la lista.
+            kind: Tipo de lista ('followers' o 'following').
+            
+        Returns:
+            Optional[RelationSnapshot]: Usuarios en orden de Instagram, o None si no hay lista guardada.
+        """
+        path = self._path(target, kind)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return RelationSnapshot(
+                members=[UserRecord(int(user_id), username) for user_id, username in data['members']],
+                full_sync_at=float(data.get('full_sync_at', 0.0)),
+                delta_syncs=int(data.get('delta_syncs', 0))
+            )
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"Lista guardada inválida en {path.name}, se ignora: {e}")
+            return None
+    
+    def save(
+        self,
+        target: str,
+        kind: str,
+        members: List[UserRecord],
+        previous: Optional[RelationSnapshot] = None
+    ) -> bool:
+        """
+        Guarda una lista completa reemplazando la anterior.
+        
+        Args:
+            target: Cuenta de la lista.
+            kind: Tipo de lista.
+            members: Usuarios en orden de Instagram.
+            previous: Lista de la que se partió si la sincronización fue incremental;
+                None si members viene de una descarga completa.
+            
+        Returns:
+            bool: True si se guardó exitosamente.
+        """
+        if previous is None:
+            full_sync_at, delta_syncs = time.time(), 0
+        else:
+            full_sync_at, delta_syncs = previous.full_sync_at, previous.delta_syncs + 1
+        
+        path = self._path(target, kind)
+        tmp_path = path.with_suffix('.tmp')
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'target': target,
+                    'kind': kind,
+                    'full_sync_at': full_sync_at,
+                    'delta_syncs': delta_syncs,
+                    'members': members
+                }, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+            return True
+        except Exception as e:
+            print(f"Error al guardar lista {path.name}: {e}")
+            return False
@@ -0,0 +1,20 @@
+"""
+Módulo de grabación y reproducción.
+Permite grabar las respuestas de Instagram y ejecutar la aplicación sin conexión
+contra un servidor local, para medir y comparar el rendimiento de las descargas.
+"""
+
+from .cassette import Cassette, HTTPRecorder, RecordedResponse
+from .stand_in_server import InstagramStandInServer, SyntheticInstagram, StandInStats
+from .redirect import InstagramRedirect, InstaloaderPacingDisabled
+
+__all__ = [
+    'Cassette',
+    'HTTPRecorder',
+    'RecordedResponse',
+    'InstagramStandInServer',
+    'SyntheticInstagram',
+    'StandInStats',
+    'InstagramRedirect',
+    'InstaloaderPacingDisabled'
+]
@@ -0,0 +1,208 @@
+"""
+Grabación de las respuestas HTTP de Instagram para reproducirlas sin conexión.
+"""
+
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+import requests
+
+INSTAGRAM_HOSTS = ('www.instagram.com', 'i.instagram.com')
+
+
+def exchange_key(method: str, path: str, params: Dict[str, str]) -> str:
+    """
+    Clave canónica de una solicitud: método, ruta y parámetros ordenados.
+    Las variables de GraphQL se normalizan para que el orden de sus claves no importe.
+    
+    Args:
+        method: Método HTTP.
+        path: Ruta sin host (por ejemplo '/graphql/query').
+        params: Parámetros de la URL y del cuerpo del formulario.
+        
+    Returns:
+        str: Clave de la solicitud.
+    """
+    normalized = dict(params)
+    if 'variables' in normalized:
+        try:
+            normalized['variables'] = json.dumps(json.loads(normalized['variables']), sort_keys=True)
+        except ValueError:
+            pass
+    return f"{method.upper()} {path.rstrip('/') or '/'} {json.dumps(normalized, sort_keys=True)}"
+
+
+def request_params(request: requests.PreparedRequest) -> Tuple[str, Dict[str, str]]:
+    """
+    Extrae la ruta y los parámetros (URL y formulario) de una solicitud preparada.
+    
+    Args:
+        request: Solicitud de requests.
+        
+    Returns:
+        Tuple[str, Dict[str, str]]: Ruta y parámetros.
+    """
+    url = urlsplit(request.url)
+    params = dict(parse_qsl(url.query, keep_blank_values=True))
+    
+    body = request.body
+    content_type = request.headers.get('Content-Type', '')
+    if body and content_type.startswith('application/x-www-form-urlencoded'):
+        if isinstance(body, bytes):
+            body = body.decode('utf-8')
+        params.update(parse_qsl(body, keep_blank_values=True))
+    
+    return url.path, params
+
+
+@dataclass
+class RecordedResponse:
+    """
+    Respuesta grabada de Instagram.
+    """
+    status: int
+    content_type: str
+    body: str
+
+
+class Cassette:
+    """
+    Conjunto de respuestas grabadas, en un archivo JSON Lines (una solicitud por línea).
+    Si la misma solicitud se grabó varias veces, las respuestas se entregan en orden y
+    la última se repite.
+    """
+    
+    def __init__(self, exchanges: Optional[Dict[str, List[RecordedResponse]]] = None):
+        """
+        Inicializa la grabación.
+        
+        Args:
+            exchanges: Respuestas por clave de solicitud.
+        """
+        self._exchanges = exchanges or {}
+        self._served: Dict[str, int] = {}
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def load(cls, path: Path) -> 'Cassette':
+        """
+        Carga una grabación desde disco.
+        
+        Args:
+            path: Archivo .jsonl generado por HTTPRecorder.
+            
+        Returns:
+            Cassette: Grabación cargada.
+        """
+        exchanges: Dict[str, List[RecordedResponse]] = {}
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                key = exchange_key(entry['method'], entry['path'], entry['params'])
+                exchanges.setdefault(key, []).append(
+                    RecordedResponse(entry['status'], entry['content_type'], entry['body'])
+                )
+        return cls(exchanges)
+    
+    def lookup(self, method: str, path: str, params: Dict[str, str]) -> Optional[RecordedResponse]:
+        """
+        Busca la respuesta grabada para una solicitud.
+        
+        Args:
+            method: Método HTTP.
+            path: Ruta sin host.
+            params: Parámetros de la URL y del formulario.
+            
+        Returns:
+            Optional[RecordedResponse]: Respuesta grabada, o None si no se grabó esa solicitud.
+        """
+        key = exchange_key(method, path, params)
+        responses = self._exchanges.get(key)
+        if not responses:
+            return None
+        
+        with self._lock:
+            index = self._served.get(key, 0)
+            self._served[key] = index + 1
+        return responses[min(index, len(responses) - 1)]
+    
+    def __len__(self) -> int:
+        return sum(len(responses) for responses in self._exchanges.values())
+
+
+class HTTPRecorder:
+    """
+    Graba las respuestas que Instagram devuelve a Instaloader mientras está activo.
+    Instaloader crea sesiones de requests nuevas para cada consulta GraphQL, por eso la
+    grabación se engancha a requests.Session.send en lugar de a una sesión concreta.
+    Solo se guardan método, ruta, parámetros y cuerpo de la respuesta: nunca cookies
+    ni cabeceras, así que la sesión no queda en el archivo (los datos de las cuentas sí).
+    
+    Uso:
+        with HTTPRecorder(Path("crawl.jsonl")):
+            app.run()
+    """
+    
+    def __init__(self, path: Path):
+        """
+        Inicializa el grabador.
+        
+        Args:
+            path: Archivo .jsonl donde se agregan las respuestas.
+        """
+        self.path = path
+        self.recorded = 0
+        self._lock = threading.Lock()
+        self._file = None
+        self._original_send = None
+    
+    def __enter__(self) -> 'HTTPRecorder':
+        self._file = open(self.path, 'a', encoding='utf-8')
+        self._original_send = requests.Session.send
+        recorder = self
+        original_send = self._original_send
+        
+        def send(session: requests.Session, request: requests.PreparedRequest, **kwargs: Any):
+            # La ruta se toma antes de enviar: otro enganche (InstagramRedirect) puede cambiar la URL
+            recorded = urlsplit(request.url).hostname in INSTAGRAM_HOSTS
+            method, (path, params) = request.method, request_params(request)
+            response = original_send(session, request, **kwargs)
+            if recorded:
+                recorder._record(method, path, params, response)
+            return response
+        
+        requests.Session.send = send
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        requests.Session.send = self._original_send
+        self._file.close()
+        print(f"💾 {self.recorded} respuestas de Instagram grabadas en: {self.path}")
+    
+    def _record(self, method: str, path: str, params: Dict[str, str], response: requests.Response) -> None:
+        """
+        Agrega una respuesta a la grabación.
+        
+        Args:
+            method: Método HTTP de la solicitud.
+            path: Ruta de la solicitud.
+            params: Parámetros de la URL y del formulario.
+            response: Respuesta recibida.
+        """
+        entry = {
+            'method': method,
+            'path': path,
+            'params': params,
+            'status': response.status_code,
+            'content_type': response.headers.get('Content-Type', ''),
+            'body': response.text
+        }
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + '\n')
+            self.recorded += 1
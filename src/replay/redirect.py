@@ -0,0 +1,75 @@
+"""
+Redirección de las solicitudes de Instaloader a un servidor local.
+"""
+
+from typing import Any
+from urllib.parse import urlsplit, urlunsplit
+import instaloader
+import requests
+from .cassette import INSTAGRAM_HOSTS
+
+
+class InstagramRedirect:
+    """
+    Envía a base_url todas las solicitudes dirigidas a Instagram mientras está activa.
+    Como la grabación, se engancha a requests.Session.send porque Instaloader crea
+    sesiones nuevas para cada consulta; el resto del tráfico no se toca.
+    
+    Uso:
+        with InstagramStandInServer(dataset) as server, InstagramRedirect(server.base_url):
+            app.run_batch(jobs_file)
+    """
+    
+    def __init__(self, base_url: str):
+        """
+        Inicializa la redirección.
+        
+        Args:
+            base_url: URL del servidor local (por ejemplo 'http://127.0.0.1:8123').
+        """
+        target = urlsplit(base_url)
+        self._scheme = target.scheme
+        self._netloc = target.netloc
+        self._original_send = None
+    
+    def __enter__(self) -> 'InstagramRedirect':
+        self._original_send = requests.Session.send
+        original_send = self._original_send
+        scheme, netloc = self._scheme, self._netloc
+        
+        def send(session: requests.Session, request: requests.PreparedRequest, **kwargs: Any):
+            url = urlsplit(request.url)
+            if url.hostname in INSTAGRAM_HOSTS:
+                request.url = urlunsplit((scheme, netloc, url.path, url.query, url.fragment))
+                request.headers['X-Forwarded-Host'] = url.hostname
+            return original_send(session, request, **kwargs)
+        
+        requests.Session.send = send
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        requests.Session.send = self._original_send
+
+
+class InstaloaderPacingDisabled:
+    """
+    Desactiva las pausas propias de Instaloader mientras está activo.
+    Instaloader espera un tiempo aleatorio antes de cada solicitud y lleva su propia
+    ventana de solicitudes por tipo de consulta; contra el servidor local eso solo
+    mediría esas pausas. El limitador de la aplicación (AdaptiveRateLimiter) sigue activo.
+    """
+    
+    def __enter__(self) -> 'InstaloaderPacingDisabled':
+        self._do_sleep = instaloader.InstaloaderContext.do_sleep
+        self._wait_before_query = instaloader.RateController.wait_before_query
+        self._handle_429 = instaloader.RateController.handle_429
+        
+        instaloader.InstaloaderContext.do_sleep = lambda context: None
+        instaloader.RateController.wait_before_query = lambda controller, query_type: None
+        instaloader.RateController.handle_429 = lambda controller, query_type: None
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        instaloader.InstaloaderContext.do_sleep = self._do_sleep
+        instaloader.RateController.wait_before_query = self._wait_before_query
+        instaloader.RateController.handle_429 = self._handle_429
@@ -0,0 +1,410 @@
+"""
+Servidor local que imita las respuestas de Instagram que usa Instaloader.
+"""
+
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+from .cassette import Cassette
+
+FOLLOWERS_QUERY_HASH = '37479f2b8209594dde7facb0d904896a'
+FOLLOWEES_QUERY_HASH = '58712303d941c6855d4e888c5f0cd22f'
+
+
+class SyntheticInstagram:
+    """
+    Datos sintéticos: una cuenta objetivo con N seguidores y M seguidos, y la cuenta
+    de la sesión con la que se consulta. Parte de los seguidos son también seguidores
+    (mutual_ratio), como en una cuenta real.
+    Las listas se guardan de más reciente a más antiguo, igual que las entrega Instagram.
+    """
+    
+    FIRST_USER_ID = 10_000_000
+    
+    def __init__(
+        self,
+        target: str = 'benchmark_target',
+        viewer: str = 'benchmark_viewer',
+        followers: int = 1000,
+        following: int = 800,
+        mutual_ratio: float = 0.6,
+        seed: int = 0
+    ):
+        """
+        Genera los datos.
+        
+        Args:
+            target: Cuenta cuyas listas se descargan.
+            viewer: Cuenta de la sesión que hace las consultas.
+            followers: Cantidad de seguidores de target.
+            following: Cantidad de seguidos de target.
+            mutual_ratio: Fracción de los seguidos que también son seguidores.
+            seed: Semilla para que dos corridas generen los mismos datos.
+        """
+        self.target = target
+        self.viewer = viewer
+        self._users: Dict[int, str] = {}
+        self._ids_by_name: Dict[str, int] = {}
+        self._next_id = self.FIRST_USER_ID
+        self._lock = threading.Lock()
+        
+        self._add_account(1, target)
+        self._add_account(2, viewer)
+        
+        follower_ids = [self._new_user() for _ in range(followers)]
+        mutual = min(int(following * mutual_ratio), followers)
+        rng = random.Random(seed)
+        following_ids = rng.sample(follower_ids, mutual) + [self._new_user() for _ in range(following - mutual)]
+        rng.shuffle(following_ids)
+        
+        self._edges: Dict[str, Dict[int, List[int]]] = {
+            'followers': {1: follower_ids},
+            'following': {1: following_ids}
+        }
+    
+    def _add_account(self, user_id: int, username: str) -> None:
+        self._users[user_id] = username
+        self._ids_by_name[username.lower()] = user_id
+    
+    def _new_user(self) -> int:
+        user_id = self._next_id
+        self._next_id += 1
+        self._add_account(user_id, f"user_{user_id - self.FIRST_USER_ID:07d}")
+        return user_id
+    
+    def add_followers(self, count: int) -> List[str]:
+        """
+        Agrega seguidores nuevos a la cuenta objetivo (al principio de la lista).
+        
+        Args:
+            count: Cantidad de seguidores nuevos.
+            
+        Returns:
+            List[str]: Nombres de usuario agregados.
+        """
+        with self._lock:
+            new_ids = [self._new_user() for _ in range(count)]
+            self._edges['followers'][1][:0] = new_ids
+        return [self._users[user_id] for user_id in new_ids]
+    
+    def user_id(self, username: str) -> Optional[int]:
+        """Identificador de un nombre de usuario, o None si no existe."""
+        return self._ids_by_name.get(username.lower())
+    
+    def profile(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Nodo de perfil con los campos que lee Instaloader.
+        
+        Args:
+            user_id: Identificador del usuario.
+            
+        Returns:
+            Optional[Dict[str, Any]]: Datos del perfil, o None si el usuario no existe.
+        """
+        username = self._users.get(user_id)
+        if username is None:
+            return None
+        return {
+            'id': str(user_id),
+            'pk': str(user_id),
+            'username': username,
+            'full_name': username.replace('_', ' ').title(),
+            'is_private': False,
+            'is_verified': False,
+            'biography': '',
+            'profile_pic_url': '',
+            'edge_followed_by': {'count': len(self._edges['followers'].get(user_id, []))},
+            'edge_follow': {'count': len(self._edges['following'].get(user_id, []))},
+            'edge_owner_to_timeline_media': {'count': 0},
+            'edge_felix_video_timeline': {'count': 0}
+        }
+    
+    def page(self, kind: str, user_id: int, first: int, after: Optional[str]) -> Dict[str, Any]:
+        """
+        Página de seguidores o seguidos con el formato de GraphQL.
+        
+        Args:
+            kind: 'followers' o 'following'.
+            user_id: Cuenta consultada.
+            first: Tamaño de página pedido.
+            after: Cursor de la página anterior.
+            
+        Returns:
+            Dict[str, Any]: Conexión (count, page_info, edges).
+        """
+        with self._lock:
+            members = list(self._edges[kind].get(user_id, []))
+        
+        start = int(after) if after else 0
+        chunk = members[start:start + first]
+        end = start + len(chunk)
+        return {
+            'count': len(members),
+            'page_info': {'has_next_page': end < len(members), 'end_cursor': str(end)},
+            'edges': [{'node': self._edge_node(member)} for member in chunk]
+        }
+    
+    def _edge_node(self, user_id: int) -> Dict[str, Any]:
+        username = self._users[user_id]
+        return {
+            'id': str(user_id),
+            'username': username,
+            'full_name': username.replace('_', ' ').title(),
+            'is_private': user_id % 7 == 0,
+            'is_verified': False,
+            'profile_pic_url': ''
+        }
+
+
+@dataclass
+class StandInStats:
+    """
+    Métricas del servidor local.
+    """
+    requests: int = 0
+    throttled: int = 0
+    not_found: int = 0
+    by_endpoint: Dict[str, int] = field(default_factory=dict)
+
+
+class InstagramStandInServer:
+    """
+    Servidor HTTP local que responde como Instagram a las consultas de una descarga
+    de seguidores: página del perfil, consulta GraphQL del perfil y páginas de
+    seguidores/seguidos. Las respuestas salen de los datos sintéticos o, si se
+    indica, de una grabación (la grabación tiene prioridad).
+    
+    Permite simular latencia, el tamaño máximo de página que acepta Instagram (más
+    grande responde 400, igual que el servicio real) y respuestas 429.
+    """
+    
+    def __init__(
+        self,
+        dataset: Optional[SyntheticInstagram] = None,
+        cassette: Optional[Cassette] = None,
+        latency: float = 0.0,
+        page_size: int = 50,
+        throttle_every: int = 0,
+        throttle_rate: float = 0.0,
+        seed: Optional[int] = None,
+        host: str = '127.0.0.1',
+        port: int = 0
+    ):
+        """
+        Inicializa el servidor.
+        
+        Args:
+            dataset: Datos sintéticos a servir.
+            cassette: Grabación a reproducir.
+            latency: Segundos de espera antes de cada respuesta.
+            page_size: Tamaño de página máximo aceptado.
+            throttle_every: Responde 429 a una de cada N consultas (0 desactiva).
+            throttle_rate: Probabilidad de responder 429 a cada consulta.
+            seed: Semilla de los 429 aleatorios.
+            host: Dirección en la que escuchar.
+            port: Puerto (0 elige uno libre).
+        """
+        if dataset is None and cassette is None:
+            dataset = SyntheticInstagram()
+        
+        self.dataset = dataset
+        self.cassette = cassette
+        self.latency = latency
+        self.page_size = page_size
+        self.throttle_every = throttle_every
+        self.throttle_rate = throttle_rate
+        self._random = random.Random(seed)
+        self._stats = StandInStats()
+        self._api_requests = 0
+        self._lock = threading.Lock()
+        
+        self._httpd = ThreadingHTTPServer((host, port), _StandInHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.stand_in = self
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def base_url(self) -> str:
+        """URL del servidor."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    @property
+    def stats(self) -> StandInStats:
+        """Métricas acumuladas."""
+        with self._lock:
+            return StandInStats(
+                self._stats.requests,
+                self._stats.throttled,
+                self._stats.not_found,
+                dict(self._stats.by_endpoint)
+            )
+    
+    def start(self) -> 'InstagramStandInServer':
+        """Arranca el servidor en un hilo aparte."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="stand-in", daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self) -> None:
+        """Detiene el servidor."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
+    
+    def __enter__(self) -> 'InstagramStandInServer':
+        return self.start()
+    
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+    
+    def respond(self, method: str, path: str, params: Dict[str, str]) -> Tuple[int, str, str]:
+        """
+        Calcula la respuesta a una solicitud.
+        
+        Args:
+            method: Método HTTP.
+            path: Ruta de la solicitud.
+            params: Parámetros de la URL y del formulario.
+            
+        Returns:
+            Tuple[int, str, str]: Código de estado, tipo de contenido y cuerpo.
+        """
+        if self.latency > 0:
+            time.sleep(self.latency)
+        
+        endpoint = self._endpoint(path, params)
+        with self._lock:
+            self._stats.requests += 1
+            self._stats.by_endpoint[endpoint] = self._stats.by_endpoint.get(endpoint, 0) + 1
+            throttled = endpoint != 'page' and self._should_throttle()
+            if throttled:
+                self._stats.throttled += 1
+        
+        if throttled:
+            return 429, 'application/json', json.dumps(
+                {'message': 'Please wait a few minutes before you try again.', 'status': 'fail'}
+            )
+        
+        if self.cassette is not None:
+            recorded = self.cassette.lookup(method, path, params)
+            if recorded is not None:
+                return recorded.status, recorded.content_type, recorded.body
+        
+        response = self._synthesize(endpoint, path, params) if self.dataset is not None else None
+        if response is None:
+            with self._lock:
+                self._stats.not_found += 1
+            return 404, 'application/json', json.dumps({'message': 'not found', 'status': 'fail'})
+        return response
+    
+    def _should_throttle(self) -> bool:
+        # Se llama con el lock adquirido
+        self._api_requests += 1
+        if self.throttle_every and self._api_requests % self.throttle_every == 0:
+            return True
+        return self.throttle_rate > 0 and self._random.random() < self.throttle_rate
+    
+    @staticmethod
+    def _endpoint(path: str, params: Dict[str, str]) -> str:
+        if path.rstrip('/') == '/graphql/query':
+            if params.get('query_hash') == FOLLOWERS_QUERY_HASH:
+                return 'followers'
+            if params.get('query_hash') == FOLLOWEES_QUERY_HASH:
+                return 'following'
+            return 'graphql'
+        if path.startswith('/api/'):
+            return 'api'
+        return 'page'
+    
+    def _synthesize(self, endpoint: str, path: str, params: Dict[str, str]) -> Optional[Tuple[int, str, str]]:
+        """
+        Genera la respuesta a partir de los datos sintéticos.
+        
+        Returns:
+            Optional[Tuple[int, str, str]]: Respuesta, o None si la ruta no se conoce.
+        """
+        dataset = self.dataset
+        variables = json.loads(params.get('variables') or '{}')
+        
+        if endpoint in ('followers', 'following'):
+            first = int(variables.get('first', 12))
+            if first > self.page_size:
+                return 400, 'application/json', json.dumps({'message': 'invalid first', 'status': 'fail'})
+            
+            edge = 'edge_followed_by' if endpoint == 'followers' else 'edge_follow'
+            connection = dataset.page(endpoint, int(variables['id']), first, variables.get('after'))
+            return 200, 'application/json', json.dumps({'data': {'user': {edge: connection}}, 'status': 'ok'})
+        
+        if endpoint == 'graphql':
+            # Consulta del perfil por identificador (doc_id)
+            user = dataset.profile(int(variables.get('id', 0)))
+            return 200, 'application/json', json.dumps({'data': {'user': user}, 'status': 'ok'})
+        
+        if endpoint == 'api' and path.rstrip('/').endswith('web_profile_info'):
+            user_id = dataset.user_id(params.get('username', ''))
+            if user_id is None:
+                return None
+            return 200, 'application/json', json.dumps({'data': {'user': dataset.profile(user_id)}, 'status': 'ok'})
+        
+        if endpoint == 'page':
+            username = path.strip('/')
+            if not username:
+                return 200, 'text/html', '<html></html>'
+            user_id = dataset.user_id(username)
+            if user_id is None:
+                return None
+            # La página del perfil incluye los datos en un <script type="application/json">
+            embedded = {'__bbox': {'result': {'data': {'xig_user_by_username': dataset.profile(user_id)}}}}
+            return 200, 'text/html', (
+                '<html><body><script type="application/json">'
+                f'{json.dumps(embedded)}</script></body></html>'
+            )
+        
+        return None
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Manejador HTTP del servidor local (conexiones persistentes, sin registro por consola)."""
+    
+    protocol_version = 'HTTP/1.1'
+    # Cabeceras y cuerpo van en dos escrituras: con Nagle, una conexión reutilizada espera el ACK retardado
+    disable_nagle_algorithm = True
+    
+    def do_GET(self):
+        self._handle()
+    
+    def do_POST(self):
+        self._handle()
+    
+    def _handle(self):
+        url = urlsplit(self.path)
+        params = dict(parse_qsl(url.query, keep_blank_values=True))
+        
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            body = self.rfile.read(length).decode('utf-8')
+            if self.headers.get('Content-Type', '').startswith('application/x-www-form-urlencoded'):
+                params.update(parse_qsl(body, keep_blank_values=True))
+        
+        status, content_type, body = self.server.stand_in.respond(self.command, url.path, params)
+        payload = body.encode('utf-8')
+        
+        self.send_response(status)
+        if 'charset' not in content_type:
+            content_type += '; charset=utf-8'
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        if url.path == '/':
+            self.send_header('Set-Cookie', 'csrftoken=standin; Path=/')
+        self.end_headers()
+        self.wfile.write(payload)
+    
+    def log_message(self, format, *args):
+        pass
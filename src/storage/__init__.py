@@ -0,0 +1,20 @@
+"""
+Módulo de almacenamiento.
+Proporciona el historial de ejecuciones del análisis y las instantáneas binarias.
+"""
+
+from .models import AnalysisRun, RunDiff, SnapshotDiff, UserPresence, FollowInterval, CompactionReport
+from .run_store import RunSnapshotStore
+from .binary_snapshot import BinarySnapshot, write_binary_snapshot
+
+__all__ = [
+    'AnalysisRun',
+    'RunDiff',
+    'SnapshotDiff',
+    'UserPresence',
+    'FollowInterval',
+    'CompactionReport',
+    'RunSnapshotStore',
+    'BinarySnapshot',
+    'write_binary_snapshot'
+]
@@ -0,0 +1,351 @@
+"""
+Instantáneas binarias de un análisis (.igsnap), legibles con mmap sin cargarlas en memoria.
+
+Formato (little-endian; cada sección empieza alineada a 8 bytes):
+
+    Cabecera    magic 'IGSNAP1\\n', versión u16, reservado u16, usuarios u32,
+                seguidores u32, seguidos u32, fecha f64 y seis pares (offset u64, longitud u64)
+                con las secciones en este orden:
+    account     Cuenta analizada en UTF-8.
+    user_ids    Identificadores de todos los usuarios, ordenados y codificados por diferencias.
+                Los usuarios sin identificador de Instagram (exportaciones) usan el sintético
+                de UserTable, que sale del nombre: dos instantáneas de los mismos datos coinciden.
+    offsets     u32 por usuario más uno: posición de su nombre en 'names'.
+    names       Nombres en UTF-8 concatenados, cada usuario una sola vez aunque esté en las dos listas.
+    followers   Mapa de bits sobre user_ids (bit i del byte j = usuario 8j+i): quién te sigue.
+    following   Mapa de bits sobre user_ids: a quién sigues.
+    
+Las secuencias ordenadas se guardan en bloques de hasta BLOCK_SIZE valores: el primer valor
+completo (i64), el ancho de las diferencias (1, 2, 4 u 8 bytes, el menor en el que caben todas
+las del bloque), la cantidad de valores y las diferencias. Se decodifican sin recorrer byte a byte en Python:
+cada bloque se interpreta directamente como arreglo del ancho indicado y se acumula.
+Las listas ocupan un bit por usuario.
+"""
+
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from itertools import accumulate, compress
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Tuple
+from ..analysis.models import FollowerAnalysisResult
+from .models import SnapshotDiff
+
+MAGIC = b'IGSNAP1\n'
+VERSION = 1
+BLOCK_SIZE = 1024
+
+_HEADER = struct.Struct('<8sHHIIId12Q')
+_BLOCK_HEADER = struct.Struct('<qBxHxxxx')
+_WIDTH_FORMATS = {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}
+# Byte del mapa de bits → un byte 0/1 por usuario, para filtrar con itertools.compress
+_BIT_FLAGS = tuple(bytes((value >> bit) & 1 for bit in range(8)) for value in range(256))
+
+
+def _padding(length: int) -> bytes:
+    return b'\0' * (-length % 8)
+
+
+def _encode_sorted(values: Sequence[int]) -> bytes:
+    """
+    Codifica una secuencia ordenada sin repetidos por diferencias, en bloques.
+    
+    Args:
+        values: Enteros en orden creciente.
+        
+    Returns:
+        bytes: Bloques codificados (longitud múltiplo de 8).
+    """
+    parts = []
+    for start in range(0, len(values), BLOCK_SIZE):
+        block = values[start:start + BLOCK_SIZE]
+        deltas = [b - a for a, b in zip(block, block[1:])]
+        largest = max(deltas, default=0)
+        width = next(width for width in (1, 2, 4, 8) if largest < 1 << (8 * width))
+        packed = array(_WIDTH_FORMATS[width], deltas)
+        if sys.byteorder != 'little':
+            packed.byteswap()
+        data = packed.tobytes()
+        parts.append(_BLOCK_HEADER.pack(block[0], width, len(block)))
+        parts.append(data + _padding(len(data)))
+    return b''.join(parts)
+
+
+def _encode_bitmap(positions: Iterable[int], size: int) -> bytes:
+    """
+    Codifica un subconjunto de posiciones como mapa de bits.
+    
+    Args:
+        positions: Posiciones incluidas.
+        size: Cantidad total de posiciones.
+        
+    Returns:
+        bytes: Un bit por posición.
+    """
+    bitmap = bytearray((size + 7) // 8)
+    for position in positions:
+        bitmap[position >> 3] |= 1 << (position & 7)
+    return bytes(bitmap)
+
+
+def _sorted_difference(before: array, after: array, step: int = 64) -> Tuple[List[int], List[int]]:
+    """
+    Compara dos secuencias ordenadas sin convertirlas enteras en conjuntos.
+    Recorre 'before' por tramos de 'step' valores y busca el tramo con el mismo rango en 'after';
+    los tramos iguales se descartan con una comparación en C y solo los distintos se comparan
+    como conjuntos. Entre dos instantáneas cercanas casi todos los tramos son iguales.
+    
+    Args:
+        before: Valores anteriores, en orden creciente.
+        after: Valores posteriores, en orden creciente.
+        step: Valores por tramo.
+        
+    Returns:
+        Tuple[List[int], List[int]]: Valores que solo están en 'before' y valores que solo están en 'after'.
+    """
+    if not before:
+        return [], list(after)
+    
+    removed, added = [], []
+    start = after_start = 0
+    while start < len(before):
+        end = min(start + step, len(before))
+        after_end = len(after) if end == len(before) else bisect_left(after, before[end], after_start)
+        chunk, after_chunk = before[start:end], after[after_start:after_end]
+        if chunk != after_chunk:
+            chunk_set, after_set = set(chunk), set(after_chunk)
+            removed.extend(chunk_set - after_set)
+            added.extend(after_set - chunk_set)
+        start, after_start = end, after_end
+    return removed, added
+
+
+def write_binary_snapshot(
+    path: Path,
+    result: FollowerAnalysisResult,
+    account: str = '',
+    created_at: Optional[float] = None
+) -> int:
+    """
+    Escribe una instantánea binaria del resultado (de forma atómica).
+    
+    Args:
+        path: Archivo de destino.
+        result: Resultado del análisis.
+        account: Cuenta analizada.
+        created_at: Momento del análisis (time.time()). Por defecto, ahora.
+        
+    Returns:
+        int: Bytes escritos.
+    """
+    user_ids = sorted(set(result.follower_ids).union(result.following_ids))
+    position = {user_id: index for index, user_id in enumerate(user_ids)}
+    
+    names = [result.users.username(user_id).encode('utf-8') for user_id in user_ids]
+    offsets = array('I', accumulate((len(name) for name in names), initial=0))
+    if sys.byteorder != 'little':
+        offsets.byteswap()
+    
+    sections = [
+        account.lower().encode('utf-8'),
+        _encode_sorted(user_ids),
+        offsets.tobytes(),
+        b''.join(names),
+        _encode_bitmap((position[user_id] for user_id in result.follower_ids), len(user_ids)),
+        _encode_bitmap((position[user_id] for user_id in result.following_ids), len(user_ids))
+    ]
+    
+    layout = []
+    offset = _HEADER.size + len(_padding(_HEADER.size))
+    for section in sections:
+        layout.extend((offset, len(section)))
+        offset += len(section) + len(_padding(len(section)))
+    
+    header = _HEADER.pack(
+        MAGIC, VERSION, 0, len(user_ids), len(result.follower_ids), len(result.following_ids),
+        time.time() if created_at is None else created_at, *layout
+    )
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(header + _padding(len(header)))
+        for section in sections:
+            f.write(section + _padding(len(section)))
+    os.replace(tmp_path, path)
+    return offset
+
+
+class BinarySnapshot:
+    """
+    Lector de instantáneas binarias mapeadas en memoria.
+    Abrir una instantánea solo lee la cabecera; los identificadores se decodifican por bloques
+    la primera vez que se piden y los nombres se leen directamente del archivo (sin copiar
+    el resto) solo para los usuarios que se muestran.
+    """
+    
+    def __init__(self, path: Path):
+        """
+        Abre una instantánea.
+        
+        Args:
+            path: Archivo .igsnap.
+            
+        Raises:
+            ValueError: Si el archivo no es una instantánea válida.
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        
+        try:
+            if len(self._view) < _HEADER.size:
+                raise ValueError(f"{path.name} no es una instantánea binaria")
+            (magic, version, _, self.user_count, self.follower_count, self.following_count,
+             self.created_at, *layout) = _HEADER.unpack_from(self._view)
+            if magic != MAGIC:
+                raise ValueError(f"{path.name} no es una instantánea binaria")
+            if version != VERSION:
+                raise ValueError(f"{path.name} usa la versión {version} del formato, no soportada")
+            self._sections = [self._view[start:start + length] for start, length in zip(layout[::2], layout[1::2])]
+        except BaseException:
+            self.close()
+            raise
+        
+        self.account = str(self._sections[0], 'utf-8')
+        if sys.byteorder == 'little':
+            self._offsets = self._sections[2].cast('I')
+        else:
+            self._offsets = array('I', self._sections[2])
+            self._offsets.byteswap()
+        self._user_ids: Optional[array] = None
+        self._follower_ids: Optional[array] = None
+        self._following_ids: Optional[array] = None
+    
+    def __enter__(self) -> 'BinarySnapshot':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Libera el archivo mapeado."""
+        for view in (getattr(self, '_offsets', None), *getattr(self, '_sections', ()), self._view):
+            if isinstance(view, memoryview):
+                view.release()
+        self._mmap.close()
+    
+    @property
+    def user_ids(self) -> array:
+        """Identificadores de todos los usuarios de la instantánea, ordenados."""
+        if self._user_ids is None:
+            self._user_ids = self._decode(self._sections[1])
+        return self._user_ids
+    
+    @property
+    def follower_ids(self) -> array:
+        """Identificadores de los seguidores, ordenados."""
+        if self._follower_ids is None:
+            self._follower_ids = self._select(self._sections[4])
+        return self._follower_ids
+    
+    @property
+    def following_ids(self) -> array:
+        """Identificadores de los seguidos, ordenados."""
+        if self._following_ids is None:
+            self._following_ids = self._select(self._sections[5])
+        return self._following_ids
+    
+    def username(self, user_id: int) -> str:
+        """
+        Obtiene el nombre de un usuario de la instantánea.
+        
+        Args:
+            user_id: Identificador del usuario.
+            
+        Returns:
+            str: Nombre de usuario.
+            
+        Raises:
+            KeyError: Si el usuario no está en la instantánea.
+        """
+        user_ids = self.user_ids
+        index = bisect_left(user_ids, user_id)
+        if index == len(user_ids) or user_ids[index] != user_id:
+            raise KeyError(user_id)
+        offsets = self._offsets
+        return str(self._sections[3][offsets[index]:offsets[index + 1]], 'utf-8')
+    
+    def usernames(self, user_ids: Iterable[int]) -> List[str]:
+        """
+        Obtiene los nombres de varios usuarios.
+        
+        Args:
+            user_ids: Identificadores de usuario.
+            
+        Returns:
+            List[str]: Nombres en orden alfabético.
+        """
+        return sorted(self.username(user_id) for user_id in user_ids)
+    
+    def diff(self, after: 'BinarySnapshot') -> SnapshotDiff:
+        """
+        Compara esta instantánea con una posterior.
+        Los usuarios se comparan por identificador, así que un cambio de nombre no cuenta como cambio.
+        
+        Args:
+            after: Instantánea posterior.
+            
+        Returns:
+            SnapshotDiff: Seguidores y seguidos ganados y perdidos.
+        """
+        lost_followers, new_followers = _sorted_difference(self.follower_ids, after.follower_ids)
+        lost_following, new_following = _sorted_difference(self.following_ids, after.following_ids)
+        return SnapshotDiff(
+            new_followers=after.usernames(new_followers),
+            lost_followers=self.usernames(lost_followers),
+            new_following=after.usernames(new_following),
+            lost_following=self.usernames(lost_following)
+        )
+    
+    def _decode(self, data: memoryview) -> array:
+        """
+        Decodifica una secuencia guardada por bloques.
+        
+        Args:
+            data: Sección con los bloques.
+            
+        Returns:
+            array: Valores ('q') en orden creciente.
+        """
+        values = array('q')
+        position = 0
+        while position < len(data):
+            base, width, count = _BLOCK_HEADER.unpack_from(data, position)
+            position += _BLOCK_HEADER.size
+            length = (count - 1) * width
+            if sys.byteorder == 'little':
+                with data[position:position + length] as raw, raw.cast(_WIDTH_FORMATS[width]) as deltas:
+                    values.extend(accumulate(deltas, initial=base))
+            else:
+                deltas = array(_WIDTH_FORMATS[width], data[position:position + length])
+                deltas.byteswap()
+                values.extend(accumulate(deltas, initial=base))
+            position += length + len(_padding(length))
+        return values
+    
+    def _select(self, bitmap: memoryview) -> array:
+        """
+        Obtiene los identificadores marcados en un mapa de bits.
+        
+        Args:
+            bitmap: Sección con el mapa de bits.
+            
+        Returns:
+            array: Identificadores ('q') en orden creciente.
+        """
+        flags = b''.join(map(_BIT_FLAGS.__getitem__, bitmap))
+        return array('q', compress(self.user_ids, flags))
@@ -0,0 +1,115 @@
+"""
+Modelos del historial de análisis.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+# Listas guardadas por ejecución; el índice es el código que se guarda en la base de datos
+KINDS = ('followers', 'following')
+
+
+@dataclass(frozen=True)
+class AnalysisRun:
+    """
+    Una ejecución guardada del análisis de una cuenta, con sus tiempos.
+    """
+    run_id: int
+    account: str
+    started_at: float          # time.time() al empezar la descarga
+    source: str                # 'instagram' o 'export'
+    followers: int
+    following: int
+    crawl_seconds: float       # Descarga (o lectura de la exportación)
+    analysis_seconds: float
+    store_seconds: float = 0.0  # Escritura en el historial
+    checkpoint: bool = True    # Listas completas; si es False solo se guardaron los cambios
+
+
+@dataclass(frozen=True)
+class UserPresence:
+    """
+    Ejecuciones de una cuenta en las que aparece un usuario dentro de una lista.
+    """
+    kind: str                  # 'followers' o 'following'
+    first_run_id: int
+    first_seen_at: float
+    last_run_id: int
+    last_seen_at: float
+    runs_seen: int
+    in_latest_run: bool        # Si sigue en la lista en la última ejecución de la cuenta
+
+
+@dataclass(frozen=True)
+class CompactionReport:
+    """
+    Resultado de compactar el historial.
+    """
+    accounts: int
+    runs_before: int
+    runs_after: int
+    rows_before: int           # Filas de listas completas y cambios
+    rows_after: int
+    bytes_before: int          # Tamaño de la base de datos en disco
+    bytes_after: int
+    seconds: float
+    
+    @property
+    def runs_removed(self) -> int:
+        """Ejecuciones descartadas por la política de retención."""
+        return self.runs_before - self.runs_after
+    
+    @property
+    def bytes_saved(self) -> int:
+        """Bytes liberados en disco."""
+        return self.bytes_before - self.bytes_after
+    
+    @property
+    def saved_percentage(self) -> float:
+        """Porcentaje del tamaño original que se liberó."""
+        if self.bytes_before == 0:
+            return 0.0
+        return (self.bytes_saved / self.bytes_before) * 100
+
+
+@dataclass(frozen=True)
+class FollowInterval:
+    """
+    Periodo en el que un usuario estuvo en una lista de una cuenta.
+    Las fechas son las de los análisis que detectaron el cambio: el cambio real ocurrió
+    entre ese análisis y el anterior.
+    """
+    kind: str                  # 'followers' o 'following'
+    start_run_id: int
+    started_at: float
+    end_run_id: Optional[int]  # None si sigue en la lista
+    ended_at: Optional[float]
+    since_first_run: bool      # Ya estaba en el primer análisis: empezó antes
+
+
+@dataclass(frozen=True)
+class SnapshotDiff:
+    """
+    Cambios en las listas de una cuenta entre dos momentos.
+    """
+    new_followers: List[str]
+    lost_followers: List[str]   # Te dejaron de seguir
+    new_following: List[str]    # Empezaste a seguir
+    lost_following: List[str]   # Dejaste de seguir
+    
+    @property
+    def total_changes(self) -> int:
+        """Usuarios que entraron o salieron de alguna lista."""
+        return (len(self.new_followers) + len(self.lost_followers) +
+                len(self.new_following) + len(self.lost_following))
+
+
+@dataclass(frozen=True)
+class RunDiff(SnapshotDiff):
+    """
+    Cambios entre dos ejecuciones guardadas en el historial.
+    """
+    before: AnalysisRun
+    after: AnalysisRun
+    changes_read: int = 0       # Cambios guardados que hubo que leer
+    user_ids: Dict[str, int] = field(default_factory=dict)  # Identificador guardado de cada usuario que cambió
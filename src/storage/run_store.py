@@ -0,0 +1,1023 @@
+"""
+Historial de análisis en SQLite: quién seguía y a quién seguía cada cuenta en cada ejecución.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from ..analysis.models import ChurnStatistics, FollowerAnalysisResult
+from ..analysis.statistics_calculator import StatisticsCalculator
+from .models import KINDS, AnalysisRun, CompactionReport, FollowInterval, RunDiff, UserPresence
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS accounts (
+    account_id INTEGER PRIMARY KEY,
+    username TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    account_id INTEGER NOT NULL REFERENCES accounts(account_id),
+    started_at REAL NOT NULL,
+    source TEXT NOT NULL,
+    followers INTEGER NOT NULL,
+    following INTEGER NOT NULL,
+    crawl_seconds REAL NOT NULL,
+    analysis_seconds REAL NOT NULL,
+    store_seconds REAL NOT NULL DEFAULT 0,
+    checkpoint INTEGER NOT NULL DEFAULT 1,
+    previous_run_id INTEGER
+);
+CREATE INDEX IF NOT EXISTS runs_by_account ON runs(account_id, run_id);
+CREATE TABLE IF NOT EXISTS users (
+    user_id INTEGER PRIMARY KEY,
+    username TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS users_by_name ON users(username);
+CREATE TABLE IF NOT EXISTS members (
+    run_id INTEGER NOT NULL,
+    kind INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    PRIMARY KEY (run_id, kind, user_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS members_by_user ON members(user_id, run_id);
+CREATE TABLE IF NOT EXISTS changes (
+    run_id INTEGER NOT NULL,
+    kind INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    added INTEGER NOT NULL,
+    PRIMARY KEY (run_id, kind, user_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS changes_by_user ON changes(user_id, run_id);
+CREATE TABLE IF NOT EXISTS intervals (
+    account_id INTEGER NOT NULL,
+    kind INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    start_run_id INTEGER NOT NULL,
+    started_at REAL NOT NULL,
+    end_run_id INTEGER,
+    ended_at REAL,
+    initial INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (account_id, kind, user_id, start_run_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS intervals_by_start ON intervals(account_id, kind, started_at);
+CREATE INDEX IF NOT EXISTS intervals_by_end ON intervals(account_id, kind, ended_at);
+"""
+
+_RUN_COLUMNS = ("r.run_id, a.username, r.started_at, r.source, r.followers, r.following, "
+                "r.crawl_seconds, r.analysis_seconds, r.store_seconds, r.checkpoint")
+
+# Parámetros por consulta con IN (...): el límite de SQLite antiguo es 999
+_CHUNK_SIZE = 500
+
+
+class RunSnapshotStore:
+    """
+    Guarda cada ejecución del análisis (seguidores y seguidos de una cuenta en un momento)
+    para responder preguntas históricas sin volver a descargar nada.
+    Cada checkpoint_every ejecuciones de una cuenta se guardan las listas completas; las
+    demás solo guardan quién entró y quién salió respecto a la anterior. Comparar dos
+    ejecuciones lee únicamente los cambios entre ellas, así que cuesta lo mismo en una
+    cuenta de 100 seguidores que en una de un millón si cambiaron los mismos usuarios.
+    compact() aplica una política de retención (todas las ejecuciones recientes, luego una por
+    día y luego una por semana) y vuelve a repartir los checkpoints entre las que quedan, así
+    que las cadenas de cambios siguen siendo cortas también en los periodos antiguos.
+    Además mantiene un índice de intervalos (cuándo entró y salió cada usuario de cada lista)
+    que se actualiza solo con los cambios de cada ejecución; con él, el historial de un
+    usuario y la evolución diaria de una cuenta no recorren las ejecuciones guardadas.
+    Los usuarios se guardan por su identificador de Instagram; los que no lo tienen
+    (exportaciones) reciben uno negativo estable ligado a su nombre de usuario.
+    Es segura para usar desde varios hilos (modo por lotes).
+    """
+    
+    def __init__(self, path: Path, checkpoint_every: int = 10):
+        """
+        Inicializa el almacén. La base de datos se abre con la primera operación.
+        
+        Args:
+            path: Archivo SQLite.
+            checkpoint_every: Ejecuciones de una cuenta entre dos guardados completos.
+        """
+        self.path = path
+        self._checkpoint_every = max(1, checkpoint_every)
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Abre la base de datos y crea las tablas si no existen (con el lock adquirido)."""
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.path), check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            tables = {name for name, in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+            columns = {row[1] for row in connection.execute("PRAGMA table_info(runs)")}
+            if columns and 'checkpoint' not in columns:
+                # Historial anterior a los cambios por ejecución: todas sus ejecuciones son completas
+                connection.execute("ALTER TABLE runs ADD COLUMN checkpoint INTEGER NOT NULL DEFAULT 1")
+                connection.execute("ALTER TABLE runs ADD COLUMN previous_run_id INTEGER")
+            connection.executescript(_SCHEMA)
+            if 'runs' in tables and 'intervals' not in tables:
+                # Historial anterior al índice de intervalos: se construye una sola vez
+                self._rebuild_intervals(connection)
+            self._connection = connection
+        return self._connection
+    
+    def record_run(
+        self,
+        account: str,
+        result: FollowerAnalysisResult,
+        started_at: float,
+        crawl_seconds: float,
+        analysis_seconds: float,
+        source: str = 'instagram'
+    ) -> AnalysisRun:
+        """
+        Guarda una ejecución, completa o como cambios respecto a la anterior.
+        
+        Args:
+            account: Cuenta analizada.
+            result: Resultado del análisis.
+            started_at: Momento en que empezó la descarga (time.time()).
+            crawl_seconds: Segundos de descarga.
+            analysis_seconds: Segundos de análisis.
+            source: Origen de los datos ('instagram' o 'export').
+            
+        Returns:
+            AnalysisRun: Ejecución guardada.
+        """
+        start = time.perf_counter()
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                account_id = self._account_id(connection, account, create=True)
+                ids = self._store_users(connection, result)
+                current = [
+                    {ids.get(user_id, user_id) for user_id in user_ids}
+                    for user_ids in (result.follower_ids, result.following_ids)
+                ]
+                previous_run_id, chain_length = self._latest_chain(connection, account_id)
+                changes = self._changes_since(connection, account_id, previous_run_id, current)
+                # Las listas completas se guardan al empezar, cada checkpoint_every ejecuciones
+                # y cuando los cambios ocupan tanto como las propias listas
+                checkpoint = (
+                    previous_run_id is None
+                    or chain_length + 1 >= self._checkpoint_every
+                    or len(changes) >= sum(len(members) for members in current)
+                )
+                
+                cursor = connection.execute(
+                    "INSERT INTO runs (account_id, started_at, source, followers, following, "
+                    "crawl_seconds, analysis_seconds, checkpoint, previous_run_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (account_id, started_at, source, len(current[0]), len(current[1]),
+                     crawl_seconds, analysis_seconds, int(checkpoint), previous_run_id)
+                )
+                run_id = cursor.lastrowid
+                if checkpoint:
+                    for code, members in enumerate(current):
+                        connection.executemany(
+                            "INSERT INTO members (run_id, kind, user_id) VALUES (?, ?, ?)",
+                            ((run_id, code, user_id) for user_id in sorted(members))
+                        )
+                # También en los checkpoints, para que comparar nunca tenga que leer listas completas
+                connection.executemany(
+                    "INSERT INTO changes (run_id, kind, user_id, added) VALUES (?, ?, ?, ?)",
+                    ((run_id, code, user_id, added) for code, user_id, added in changes)
+                )
+                if previous_run_id is None:
+                    # Primera ejecución de la cuenta: todos empiezan un intervalo
+                    self._update_intervals(connection, account_id, run_id, started_at, [
+                        (code, user_id, 1) for code, members in enumerate(current) for user_id in members
+                    ], initial=True)
+                else:
+                    self._update_intervals(connection, account_id, run_id, started_at, changes)
+                store_seconds = time.perf_counter() - start
+                connection.execute("UPDATE runs SET store_seconds = ? WHERE run_id = ?", (store_seconds, run_id))
+        
+        return AnalysisRun(
+            run_id=run_id,
+            account=account.lower(),
+            started_at=started_at,
+            source=source,
+            followers=len(current[0]),
+            following=len(current[1]),
+            crawl_seconds=crawl_seconds,
+            analysis_seconds=analysis_seconds,
+            store_seconds=store_seconds,
+            checkpoint=checkpoint
+        )
+    
+    def runs(self, account: str) -> List[AnalysisRun]:
+        """
+        Obtiene las ejecuciones guardadas de una cuenta.
+        
+        Args:
+            account: Cuenta analizada.
+            
+        Returns:
+            List[AnalysisRun]: Ejecuciones de la más antigua a la más reciente.
+        """
+        with self._lock:
+            rows = self._connect().execute(
+                f"SELECT {_RUN_COLUMNS} FROM runs r JOIN accounts a ON a.account_id = r.account_id "
+                "WHERE a.username = ? ORDER BY r.run_id",
+                (account.lower(),)
+            ).fetchall()
+        return [_run_from_row(row) for row in rows]
+    
+    def get_run(self, run_id: int) -> Optional[AnalysisRun]:
+        """
+        Obtiene una ejecución por su número.
+        
+        Args:
+            run_id: Número de ejecución.
+            
+        Returns:
+            Optional[AnalysisRun]: La ejecución, o None si no existe.
+        """
+        with self._lock:
+            row = self._get_run(self._connect(), run_id)
+        return _run_from_row(row) if row else None
+    
+    def accounts(self) -> List[str]:
+        """
+        Obtiene las cuentas con alguna ejecución guardada.
+        
+        Returns:
+            List[str]: Cuentas en orden alfabético.
+        """
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT username FROM accounts a WHERE EXISTS "
+                "(SELECT 1 FROM runs r WHERE r.account_id = a.account_id) ORDER BY username"
+            ).fetchall()
+        return [username for username, in rows]
+    
+    def current_member_ids(self, account: str, kind: str = 'followers') -> Optional[array]:
+        """
+        Obtiene una lista de la última ejecución de una cuenta como identificadores guardados.
+        Sale de los intervalos abiertos, así que no reconstruye la ejecución con sus cambios.
+        
+        Args:
+            account: Cuenta analizada.
+            kind: Tipo de lista ('followers' o 'following').
+            
+        Returns:
+            Optional[array]: Identificadores ordenados, o None si la cuenta no tiene ejecuciones.
+        """
+        with self._lock:
+            connection = self._connect()
+            account_id = self._account_id(connection, account)
+            if account_id is None:
+                return None
+            # La clave primaria empieza por (cuenta, lista, usuario): las filas ya salen ordenadas
+            return array('q', (user_id for user_id, in connection.execute(
+                "SELECT user_id FROM intervals WHERE account_id = ? AND kind = ? AND end_run_id IS NULL "
+                "ORDER BY user_id",
+                (account_id, KINDS.index(kind))
+            )))
+    
+    def members(self, run_id: int, kind: str) -> List[str]:
+        """
+        Obtiene una lista completa de una ejecución (el checkpoint anterior más sus cambios).
+        
+        Args:
+            run_id: Número de ejecución.
+            kind: Tipo de lista ('followers' o 'following').
+            
+        Returns:
+            List[str]: Nombres de usuario en orden alfabético.
+        """
+        with self._lock:
+            connection = self._connect()
+            row = self._get_run(connection, run_id)
+            if row is None:
+                return []
+            members = self._membership(connection, _account_id_of(connection, run_id), run_id)[KINDS.index(kind)]
+            return self._usernames(connection, members)
+    
+    def diff(self, before: int, after: int) -> RunDiff:
+        """
+        Compara dos ejecuciones de la misma cuenta leyendo solo los cambios guardados entre ellas.
+        
+        Args:
+            before: Ejecución anterior.
+            after: Ejecución posterior.
+            
+        Returns:
+            RunDiff: Seguidores y seguidos ganados y perdidos de una a otra.
+            
+        Raises:
+            ValueError: Si alguna ejecución no existe o son de cuentas distintas.
+        """
+        with self._lock:
+            connection = self._connect()
+            rows = [self._get_run(connection, run_id) for run_id in (before, after)]
+            if None in rows:
+                raise ValueError("La ejecución no existe")
+            runs = [_run_from_row(row) for row in rows]
+            if runs[0].account != runs[1].account:
+                raise ValueError("Las ejecuciones son de cuentas distintas")
+            
+            account_id = _account_id_of(connection, before)
+            low, high = sorted((before, after))
+            added, removed, changes_read = self._net_changes(connection, account_id, low, high)
+            if before > after:
+                added, removed = removed, added
+            
+            names = self._user_names(connection, set().union(*added, *removed))
+            
+            def listed(user_ids: Set[int]) -> List[str]:
+                return sorted(map(names.__getitem__, user_ids))
+            
+            return RunDiff(
+                before=runs[0],
+                after=runs[1],
+                new_followers=listed(added[0]),
+                lost_followers=listed(removed[0]),
+                new_following=listed(added[1]),
+                lost_following=listed(removed[1]),
+                changes_read=changes_read,
+                user_ids={name: user_id for user_id, name in names.items()}
+            )
+    
+    def presence(self, account: str, username: str) -> List[UserPresence]:
+        """
+        Obtiene la primera y la última ejecución de una cuenta en las que aparece un usuario.
+        
+        Args:
+            account: Cuenta analizada.
+            username: Usuario buscado.
+            
+        Returns:
+            List[UserPresence]: Una entrada por lista en la que apareció alguna vez.
+        """
+        with self._lock:
+            connection = self._connect()
+            account_id = self._account_id(connection, account)
+            if account_id is None:
+                return []
+            runs = connection.execute(
+                "SELECT run_id, started_at, checkpoint FROM runs WHERE account_id = ? ORDER BY run_id",
+                (account_id,)
+            ).fetchall()
+            user_filter = "user_id IN (SELECT user_id FROM users WHERE username = ?)"
+            name = username.lower().lstrip('@')
+            in_checkpoint = set(connection.execute(
+                f"SELECT run_id, kind FROM members WHERE {user_filter}", (name,)
+            ).fetchall())
+            events = {
+                (run_id, kind): added
+                for run_id, kind, added in connection.execute(
+                    f"SELECT run_id, kind, added FROM changes WHERE {user_filter}", (name,)
+                )
+            }
+        
+        # Se recorren las ejecuciones de la cuenta reconstruyendo si estaba en cada lista
+        presences = []
+        for code, kind in enumerate(KINDS):
+            present = False
+            seen: List[Tuple[int, float]] = []
+            for run_id, started_at, checkpoint in runs:
+                if checkpoint:
+                    present = (run_id, code) in in_checkpoint
+                elif (run_id, code) in events:
+                    present = bool(events[run_id, code])
+                if present:
+                    seen.append((run_id, started_at))
+            if seen:
+                presences.append(UserPresence(
+                    kind=kind,
+                    first_run_id=seen[0][0],
+                    first_seen_at=seen[0][1],
+                    last_run_id=seen[-1][0],
+                    last_seen_at=seen[-1][1],
+                    runs_seen=len(seen),
+                    in_latest_run=present
+                ))
+        return presences
+    
+    def follow_history(self, account: str, username: str) -> List[FollowInterval]:
+        """
+        Obtiene cuándo un usuario entró y salió de las listas de una cuenta (índice de intervalos).
+        
+        Args:
+            account: Cuenta analizada.
+            username: Usuario buscado.
+            
+        Returns:
+            List[FollowInterval]: Intervalos del más antiguo al más reciente.
+        """
+        with self._lock:
+            connection = self._connect()
+            account_id = self._account_id(connection, account)
+            if account_id is None:
+                return []
+            rows = connection.execute(
+                "SELECT kind, start_run_id, started_at, end_run_id, ended_at, initial FROM intervals "
+                "WHERE account_id = ? AND kind IN (0, 1) AND user_id IN "
+                "(SELECT user_id FROM users WHERE username = ?) ORDER BY started_at, kind",
+                (account_id, username.lower().lstrip('@'))
+            ).fetchall()
+        return [
+            FollowInterval(KINDS[kind], start_run_id, started_at, end_run_id, ended_at, bool(initial))
+            for kind, start_run_id, started_at, end_run_id, ended_at, initial in rows
+        ]
+    
+    def churn(
+        self,
+        account: str,
+        kind: str = 'followers',
+        days: int = 90,
+        rolling_days: int = 7
+    ) -> Optional[ChurnStatistics]:
+        """
+        Calcula altas, bajas y retención diarias de una lista en los últimos días.
+        Solo lee los intervalos que empezaron o terminaron en el periodo.
+        
+        Args:
+            account: Cuenta analizada.
+            kind: Tipo de lista ('followers' o 'following').
+            days: Días del periodo, contando hasta el último análisis de la cuenta.
+            rolling_days: Días de la ventana de las sumas móviles.
+            
+        Returns:
+            Optional[ChurnStatistics]: Estadísticas del periodo, o None si la cuenta no tiene análisis.
+        """
+        code = KINDS.index(kind)
+        with self._lock:
+            connection = self._connect()
+            account_id = self._account_id(connection, account)
+            latest = connection.execute(
+                "SELECT MAX(started_at) FROM runs WHERE account_id = ?", (account_id,)
+            ).fetchone()[0] if account_id is not None else None
+            if latest is None:
+                return None
+            
+            end = datetime.fromtimestamp(latest).date()
+            start = end - timedelta(days=max(1, days) - 1)
+            since = datetime.combine(start, datetime.min.time()).timestamp()
+            gained = connection.execute(
+                "SELECT started_at, end_run_id FROM intervals "
+                "WHERE account_id = ? AND kind = ? AND started_at >= ? AND initial = 0",
+                (account_id, code, since)
+            ).fetchall()
+            lost_at = [ended_at for ended_at, in connection.execute(
+                "SELECT ended_at FROM intervals WHERE account_id = ? AND kind = ? AND ended_at >= ?",
+                (account_id, code, since)
+            )]
+            # Tamaño de la lista en el último análisis anterior al periodo (o en el primero, si no hay)
+            row = connection.execute(
+                f"SELECT {kind} FROM runs WHERE account_id = ? AND started_at < ? ORDER BY started_at DESC LIMIT 1",
+                (account_id, since)
+            ).fetchone() or connection.execute(
+                f"SELECT {kind} FROM runs WHERE account_id = ? ORDER BY started_at LIMIT 1", (account_id,)
+            ).fetchone()
+        
+        return StatisticsCalculator().calculate_churn(
+            kind,
+            start,
+            end,
+            gained_at=[started_at for started_at, _ in gained],
+            lost_at=lost_at,
+            size_at_start=row[0],
+            retained=sum(1 for _, end_run_id in gained if end_run_id is None),
+            rolling_days=rolling_days
+        )
+    
+    def compact(
+        self,
+        keep_all_days: int = 30,
+        keep_daily_days: int = 180,
+        now: Optional[float] = None
+    ) -> CompactionReport:
+        """
+        Descarta las ejecuciones que no cumplen la política de retención y compacta las cadenas de cambios.
+        Se conservan todas las ejecuciones de los últimos keep_all_days días, la última de cada día
+        hasta keep_daily_days días y la última de cada semana antes; la última de cada cuenta
+        siempre se conserva. Los cambios de las ejecuciones descartadas se acumulan en la siguiente
+        conservada. El índice de intervalos no se toca: conserva la fecha en que se detectó cada cambio.
+        
+        Args:
+            keep_all_days: Días en los que se conservan todas las ejecuciones.
+            keep_daily_days: Días en los que se conserva una ejecución por día.
+            now: Momento de referencia (time.time()). Por defecto, ahora.
+            
+        Returns:
+            CompactionReport: Ejecuciones, filas y bytes antes y después.
+        """
+        start = time.perf_counter()
+        now = time.time() if now is None else now
+        with self._lock:
+            connection = self._connect()
+            # Se mide tras vaciar el -wal, igual que después: si no, el ahorro incluiría el -wal
+            connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            bytes_before = self._database_size()
+            runs_before, rows_before = self._storage_counts(connection)
+            
+            accounts = [account_id for account_id, in connection.execute("SELECT account_id FROM accounts")]
+            with connection:
+                for account_id in accounts:
+                    self._compact_account(connection, account_id, now, keep_all_days, keep_daily_days)
+            
+            # VACUUM devuelve al sistema las páginas liberadas; el checkpoint vacía el archivo -wal
+            connection.execute("VACUUM")
+            connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            runs_after, rows_after = self._storage_counts(connection)
+            bytes_after = self._database_size()
+        
+        return CompactionReport(
+            accounts=len(accounts),
+            runs_before=runs_before,
+            runs_after=runs_after,
+            rows_before=rows_before,
+            rows_after=rows_after,
+            bytes_before=bytes_before,
+            bytes_after=bytes_after,
+            seconds=time.perf_counter() - start
+        )
+    
+    def close(self) -> None:
+        """Cierra la base de datos."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+    
+    def _get_run(self, connection: sqlite3.Connection, run_id: int) -> Optional[tuple]:
+        return connection.execute(
+            f"SELECT {_RUN_COLUMNS} FROM runs r JOIN accounts a ON a.account_id = r.account_id "
+            "WHERE r.run_id = ?",
+            (run_id,)
+        ).fetchone()
+    
+    def _account_id(self, connection: sqlite3.Connection, account: str, create: bool = False) -> Optional[int]:
+        """
+        Obtiene el número interno de una cuenta.
+        
+        Args:
+            connection: Conexión abierta.
+            account: Cuenta analizada.
+            create: Si es True, la cuenta se registra si no existe.
+            
+        Returns:
+            Optional[int]: Número de la cuenta, o None si no existe y create es False.
+        """
+        account = account.lower()
+        if create:
+            connection.execute("INSERT OR IGNORE INTO accounts (username) VALUES (?)", (account,))
+        row = connection.execute("SELECT account_id FROM accounts WHERE username = ?", (account,)).fetchone()
+        return row[0] if row else None
+    
+    def _latest_chain(self, connection: sqlite3.Connection, account_id: int) -> Tuple[Optional[int], int]:
+        """
+        Obtiene la última ejecución de una cuenta y cuántas hay desde el último checkpoint.
+        
+        Args:
+            connection: Conexión abierta.
+            account_id: Número de la cuenta.
+            
+        Returns:
+            Tuple[Optional[int], int]: Última ejecución (None si no hay) y ejecuciones guardadas como cambios.
+        """
+        latest, checkpoint = connection.execute(
+            "SELECT MAX(run_id), MAX(CASE WHEN checkpoint = 1 THEN run_id END) FROM runs WHERE account_id = ?",
+            (account_id,)
+        ).fetchone()
+        if latest is None:
+            return None, 0
+        chain_length, = connection.execute(
+            "SELECT COUNT(*) FROM runs WHERE account_id = ? AND run_id > ?", (account_id, checkpoint)
+        ).fetchone()
+        return latest, chain_length
+    
+    def _changes_since(
+        self,
+        connection: sqlite3.Connection,
+        account_id: int,
+        previous_run_id: Optional[int],
+        current: List[Set[int]]
+    ) -> List[Tuple[int, int, int]]:
+        """
+        Calcula los cambios de las listas actuales respecto a una ejecución anterior.
+        
+        Args:
+            connection: Conexión abierta.
+            account_id: Número de la cuenta.
+            previous_run_id: Ejecución anterior, o None si es la primera.
+            current: Seguidores y seguidos actuales.
+            
+        Returns:
+            List[Tuple[int, int, int]]: Filas (lista, usuario, 1 si entró / 0 si salió).
+        """
+        if previous_run_id is None:
+            return []
+        changes = []
+        previous = self._membership(connection, account_id, previous_run_id)
+        for code in range(len(KINDS)):
+            changes.extend((code, user_id, 1) for user_id in current[code] - previous[code])
+            changes.extend((code, user_id, 0) for user_id in previous[code] - current[code])
+        return changes
+    
+    def _membership(self, connection: sqlite3.Connection, account_id: int, run_id: int) -> List[Set[int]]:
+        """
+        Reconstruye las listas de una ejecución: el checkpoint anterior más los cambios hasta ella.
+        
+        Args:
+            connection: Conexión abierta.
+            account_id: Número de la cuenta.
+            run_id: Número de ejecución.
+            
+        Returns:
+            List[Set[int]]: Seguidores y seguidos de la ejecución.
+        """
+        checkpoint, = connection.execute(
+            "SELECT MAX(run_id) FROM runs WHERE account_id = ? AND checkpoint = 1 AND run_id <= ?",
+            (account_id, run_id)
+        ).fetchone()
+        members: List[Set[int]] = [set() for _ in KINDS]
+        for kind, user_id in connection.execute(
+            "SELECT kind, user_id FROM members WHERE run_id = ?", (checkpoint,)
+        ):
+            members[kind].add(user_id)
+        
+        for kind, user_id, added in connection.execute(
+            "SELECT c.kind, c.user_id, c.added FROM changes c JOIN runs r ON r.run_id = c.run_id "
+            "WHERE r.account_id = ? AND c.run_id > ? AND c.run_id <= ? ORDER BY c.run_id",
+            (account_id, checkpoint, run_id)
+        ):
+            if added:
+                members[kind].add(user_id)
+            else:
+                members[kind].discard(user_id)
+        return members
+    
+    def _net_changes(
+        self,
+        connection: sqlite3.Connection,
+        account_id: int,
+        low: int,
+        high: int
+    ) -> Tuple[List[Set[int]], List[Set[int]], int]:
+        """
+        Calcula quién entró y quién salió de cada lista entre dos ejecuciones.
+        Los cambios de un usuario alternan entrada y salida, así que basta con el primero
+        (si salió, estaba en la ejecución anterior) y el último (si entró, está en la posterior).
+        Las ejecuciones de un historial antiguo no tienen cambios guardados: se comparan sus listas.
+        
+        Args:
+            connection: Conexión abierta.
+            account_id: Número de la cuenta.
+            low: Ejecución anterior.
+            high: Ejecución posterior.
+            
+        Returns:
+            Tuple: Usuarios que entraron y que salieron de cada lista, y cambios leídos.
+        """
+        first: List[Dict[int, int]] = [{} for _ in KINDS]
+        last: List[Dict[int, int]] = [{} for _ in KINDS]
+        changes_read = 0
+        
+        runs = connection.execute(
+            "SELECT run_id, previous_run_id FROM runs WHERE account_id = ? AND run_id > ? AND run_id <= ? "
+            "ORDER BY run_id",
+            (account_id, low, high)
+        ).fetchall()
+        previous = low
+        for run_id, previous_run_id in runs:
+            if previous_run_id is None:
+                rows = self._changes_since(
+                    connection, account_id, previous, self._membership(connection, account_id, run_id)
+                )
+            else:
+                rows = connection.execute(
+                    "SELECT kind, user_id, added FROM changes WHERE run_id = ?", (run_id,)
+                ).fetchall()
+            for kind, user_id, added in rows:
+                first[kind].setdefault(user_id, added)
+                last[kind][user_id] = added
+            changes_read += len(rows)
+            previous = run_id
+        
+        added_users = [{user_id for user_id, state in last[code].items() if state and first[code][user_id]}
+                       for code in range(len(KINDS))]
+        removed_users = [{user_id for user_id, state in last[code].items() if not state and not first[code][user_id]}
+                         for code in range(len(KINDS))]
+        return added_users, removed_users, changes_read
+    
+    def _update_intervals(
+        self,
+        connection: sqlite3.Connection,
+        account_id: int,
+        run_id: int,
+        started_at: float,
+        changes: List[Tuple[int, int, int]],
+        initial: bool = False
+    ):
+        """
+        Abre un intervalo por cada usuario que entró a una lista y cierra el de cada uno que salió.
+        
+        Args:
+            connection: Conexión dentro de una transacción.
+            account_id: Número de la cuenta.
+            run_id: Ejecución que detectó los cambios.
+            started_at: Momento de esa ejecución.
+            changes: Filas (lista, usuario, 1 si entró / 0 si salió).
+            initial: Si son las listas de la primera ejecución de la cuenta.
+        """
+        connection.executemany(
+            "INSERT INTO intervals (account_id, kind, user_id, start_run_id, started_at, initial) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            ((account_id, code, user_id, run_id, started_at, int(initial))
+             for code, user_id, added in changes if added)
+        )
+        connection.executemany(
+            "UPDATE intervals SET end_run_id = ?, ended_at = ? "
+            "WHERE account_id = ? AND kind = ? AND user_id = ? AND end_run_id IS NULL",
+            ((run_id, started_at, account_id, code, user_id)
+             for code, user_id, added in changes if not added)
+        )
+    
+    def _rebuild_intervals(self, connection: sqlite3.Connection):
+        """
+        Construye el índice de intervalos recorriendo una vez las ejecuciones guardadas.
+        
+        Args:
+            connection: Conexión abierta.
+        """
+        with connection:
+            for account_id, in connection.execute("SELECT account_id FROM accounts").fetchall():
+                members: List[Set[int]] = [set() for _ in KINDS]
+                runs = connection.execute(
+                    "SELECT run_id, started_at, previous_run_id FROM runs WHERE account_id = ? ORDER BY run_id",
+                    (account_id,)
+                ).fetchall()
+                for index, (run_id, started_at, previous_run_id) in enumerate(runs):
+                    if previous_run_id is None:
+                        # Primera ejecución o historial sin cambios guardados: se comparan las listas
+                        current = self._membership(connection, account_id, run_id)
+                        changes = []
+                        for code in range(len(KINDS)):
+                            changes.extend((code, user_id, 1) for user_id in current[code] - members[code])
+                            changes.extend((code, user_id, 0) for user_id in members[code] - current[code])
+                        members = current
+                    else:
+                        changes = connection.execute(
+                            "SELECT kind, user_id, added FROM changes WHERE run_id = ?", (run_id,)
+                        ).fetchall()
+                        for code, user_id, added in changes:
+                            if added:
+                                members[code].add(user_id)
+                            else:
+                                members[code].discard(user_id)
+                    self._update_intervals(connection, account_id, run_id, started_at, changes, initial=index == 0)
+    
+    def _compact_account(
+        self,
+        connection: sqlite3.Connection,
+        account_id: int,
+        now: float,
+        keep_all_days: int,
+        keep_daily_days: int
+    ):
+        """
+        Aplica la política de retención a una cuenta (dentro de la transacción de compact).
+        Recorre sus ejecuciones una vez, reconstruyendo las listas con los cambios guardados:
+        cada ejecución conservada recibe los cambios netos desde la anterior conservada y los
+        checkpoints se vuelven a repartir cada checkpoint_every ejecuciones conservadas.
+        
+        Args:
+            connection: Conexión dentro de una transacción.
+            account_id: Número de la cuenta.
+            now: Momento de referencia.
+            keep_all_days: Días en los que se conservan todas las ejecuciones.
+            keep_daily_days: Días en los que se conserva una ejecución por día.
+        """
+        runs = connection.execute(
+            "SELECT run_id, started_at, checkpoint, previous_run_id FROM runs WHERE account_id = ? ORDER BY run_id",
+            (account_id,)
+        ).fetchall()
+        keep = _retained_runs([(run_id, started_at) for run_id, started_at, _, _ in runs],
+                              now, keep_all_days, keep_daily_days)
+        if len(keep) == len(runs):
+            return
+        
+        members: List[Set[int]] = [set() for _ in KINDS]
+        first: List[Dict[int, int]] = [{} for _ in KINDS]
+        last: List[Dict[int, int]] = [{} for _ in KINDS]
+        previous_kept: Optional[int] = None
+        chain_length = 0
+        for run_id, _, checkpoint, previous_run_id in runs:
+            if previous_run_id is None:
+                # Primera ejecución o historial sin cambios guardados: sus listas completas
+                current: List[Set[int]] = [set() for _ in KINDS]
+                for kind, user_id in connection.execute(
+                    "SELECT kind, user_id FROM members WHERE run_id = ?", (run_id,)
+                ):
+                    current[kind].add(user_id)
+                rows = []
+                for code in range(len(KINDS)):
+                    rows.extend((code, user_id, 1) for user_id in current[code] - members[code])
+                    rows.extend((code, user_id, 0) for user_id in members[code] - current[code])
+                members = current
+            else:
+                rows = connection.execute(
+                    "SELECT kind, user_id, added FROM changes WHERE run_id = ?", (run_id,)
+                ).fetchall()
+                for code, user_id, added in rows:
+                    if added:
+                        members[code].add(user_id)
+                    else:
+                        members[code].discard(user_id)
+            for code, user_id, added in rows:
+                first[code].setdefault(user_id, added)
+                last[code][user_id] = added
+            
+            if run_id not in keep:
+                continue
+            
+            # Cambios netos desde la ejecución conservada anterior (ver _net_changes)
+            changes = [] if previous_kept is None else [
+                (code, user_id, added)
+                for code in range(len(KINDS))
+                for user_id, added in last[code].items() if first[code][user_id] == added
+            ]
+            first = [{} for _ in KINDS]
+            last = [{} for _ in KINDS]
+            new_checkpoint = (
+                previous_kept is None
+                or chain_length + 1 >= self._checkpoint_every
+                or len(changes) >= sum(len(users) for users in members)
+            )
+            chain_length = 0 if new_checkpoint else chain_length + 1
+            
+            if new_checkpoint and not checkpoint:
+                for code, users in enumerate(members):
+                    connection.executemany(
+                        "INSERT INTO members (run_id, kind, user_id) VALUES (?, ?, ?)",
+                        ((run_id, code, user_id) for user_id in sorted(users))
+                    )
+            elif checkpoint and not new_checkpoint:
+                connection.execute("DELETE FROM members WHERE run_id = ?", (run_id,))
+            if previous_run_id != previous_kept:
+                connection.execute("DELETE FROM changes WHERE run_id = ?", (run_id,))
+                connection.executemany(
+                    "INSERT INTO changes (run_id, kind, user_id, added) VALUES (?, ?, ?, ?)",
+                    ((run_id, code, user_id, added) for code, user_id, added in changes)
+                )
+            connection.execute(
+                "UPDATE runs SET checkpoint = ?, previous_run_id = ? WHERE run_id = ?",
+                (int(new_checkpoint), previous_kept, run_id)
+            )
+            previous_kept = run_id
+        
+        dropped = [run_id for run_id, _, _, _ in runs if run_id not in keep]
+        for run_ids in _chunks(dropped):
+            placeholders = ','.join('?' * len(run_ids))
+            for table in ('members', 'changes', 'runs'):
+                connection.execute(f"DELETE FROM {table} WHERE run_id IN ({placeholders})", run_ids)
+    
+    def _storage_counts(self, connection: sqlite3.Connection) -> Tuple[int, int]:
+        """Ejecuciones guardadas y filas de listas completas y cambios."""
+        runs, = connection.execute("SELECT COUNT(*) FROM runs").fetchone()
+        rows, = connection.execute(
+            "SELECT (SELECT COUNT(*) FROM members) + (SELECT COUNT(*) FROM changes)"
+        ).fetchone()
+        return runs, rows
+    
+    def _database_size(self) -> int:
+        """Bytes en disco de la base de datos y su archivo -wal."""
+        return sum(
+            os.path.getsize(path)
+            for path in (self.path, self.path.with_name(self.path.name + '-wal'))
+            if path.exists()
+        )
+    
+    def _usernames(self, connection: sqlite3.Connection, user_ids: Iterable[int]) -> List[str]:
+        """
+        Resuelve identificadores guardados a nombres de usuario.
+        
+        Args:
+            connection: Conexión abierta.
+            user_ids: Identificadores guardados.
+            
+        Returns:
+            List[str]: Nombres de usuario en orden alfabético.
+        """
+        return sorted(self._user_names(connection, user_ids).values())
+    
+    def _user_names(self, connection: sqlite3.Connection, user_ids: Iterable[int]) -> Dict[int, str]:
+        """
+        Obtiene el nombre guardado de cada identificador.
+        
+        Args:
+            connection: Conexión abierta.
+            user_ids: Identificadores guardados.
+            
+        Returns:
+            Dict[int, str]: Identificador guardado → nombre de usuario.
+        """
+        names: Dict[int, str] = {}
+        for ids in _chunks(list(user_ids)):
+            names.update(connection.execute(
+                f"SELECT user_id, username FROM users WHERE user_id IN ({','.join('?' * len(ids))})", ids
+            ))
+        return names
+    
+    def _store_users(self, connection: sqlite3.Connection, result: FollowerAnalysisResult) -> Dict[int, int]:
+        """
+        Registra los usuarios del resultado y actualiza los nombres que cambiaron.
+        
+        Args:
+            connection: Conexión dentro de la transacción de record_run.
+            result: Resultado del análisis.
+            
+        Returns:
+            Dict[int, int]: Identificador sintético del análisis → identificador guardado.
+        """
+        users = result.users
+        user_ids = set(result.follower_ids).union(result.following_ids)
+        
+        connection.executemany(
+            "INSERT INTO users (user_id, username) VALUES (?, ?) "
+            "ON CONFLICT(user_id) DO UPDATE SET username = excluded.username "
+            "WHERE username != excluded.username",
+            ((user_id, users.username(user_id)) for user_id in user_ids if user_id >= 0)
+        )
+        
+        # Sin identificador de Instagram, el nombre de usuario es lo único estable entre ejecuciones
+        synthetic = {users.username(user_id): user_id for user_id in user_ids if user_id < 0}
+        if not synthetic:
+            return {}
+        
+        stored: Dict[str, int] = {}
+        for names in _chunks(list(synthetic)):
+            stored.update(connection.execute(
+                f"SELECT username, MAX(user_id) FROM users WHERE username IN ({','.join('?' * len(names))}) "
+                "GROUP BY username",
+                names
+            ).fetchall())
+        
+        # Los nuevos conservan el identificador del análisis (calculado a partir del nombre), así
+        # coinciden con las instantáneas; los nombres guardados antes de eso mantienen el suyo
+        new_users = [(user_id, name) for name, user_id in synthetic.items() if name not in stored]
+        taken = set()
+        for ids in _chunks([user_id for user_id, _ in new_users]):
+            taken.update(user_id for user_id, in connection.execute(
+                f"SELECT user_id FROM users WHERE user_id IN ({','.join('?' * len(ids))})", ids
+            ))
+        if taken:
+            next_id, = connection.execute("SELECT MIN(COALESCE(MIN(user_id), 0), 0) - 1 FROM users").fetchone()
+            for index, (user_id, name) in enumerate(new_users):
+                if user_id in taken:
+                    new_users[index] = (next_id, name)
+                    next_id -= 1
+        stored.update((name, user_id) for user_id, name in new_users)
+        connection.executemany("INSERT INTO users (user_id, username) VALUES (?, ?)", new_users)
+        
+        return {user_id: stored[name] for name, user_id in synthetic.items()}
+
+
+def _run_from_row(row: tuple) -> AnalysisRun:
+    *values, checkpoint = row
+    return AnalysisRun(*values, checkpoint=bool(checkpoint))
+
+
+def _retained_runs(runs: List[Tuple[int, float]], now: float, keep_all_days: int, keep_daily_days: int) -> Set[int]:
+    """
+    Elige las ejecuciones que conserva la política de retención.
+    
+    Args:
+        runs: (número, momento) de las ejecuciones de una cuenta, de la más antigua a la más reciente.
+        now: Momento de referencia.
+        keep_all_days: Días en los que se conservan todas.
+        keep_daily_days: Días en los que se conserva la última de cada día.
+        
+    Returns:
+        Set[int]: Ejecuciones conservadas (siempre incluye la última).
+    """
+    keep = {runs[-1][0]} if runs else set()
+    latest_by_period: Dict[tuple, int] = {}
+    for run_id, started_at in runs:
+        age_days = (now - started_at) / 86400
+        if age_days <= keep_all_days:
+            keep.add(run_id)
+            continue
+        moment = datetime.fromtimestamp(started_at)
+        period = ('day', moment.date()) if age_days <= keep_daily_days else ('week', *moment.isocalendar()[:2])
+        latest_by_period[period] = run_id
+    keep.update(latest_by_period.values())
+    return keep
+
+
+def _account_id_of(connection: sqlite3.Connection, run_id: int) -> int:
+    return connection.execute("SELECT account_id FROM runs WHERE run_id = ?", (run_id,)).fetchone()[0]
+
+
+def _chunks(items: list) -> Iterable[list]:
+    for start in range(0, len(items), _CHUNK_SIZE):
+        yield items[start:start + _CHUNK_SIZE]
@@ -2,8 +2,14 @@
 Impresora de consola.
 """
 
+from datetime import datetime
 from typing import List
-from ..analysis.models import FollowerAnalysisResult
+from ..analysis.models import AudienceOverlap, ChurnStatistics, FollowerAnalysisResult
+from ..batch.models import BatchReport
+from ..auth.http_transport import TransportStats
+from ..data.profile_metadata import EnrichmentStats
+from ..data.rate_limiter import RateLimiterStats
+from ..storage.models import AnalysisRun, CompactionReport, FollowInterval, RunDiff, SnapshotDiff, UserPresence
 
 
 class ConsolePrinter:
@@ -110,6 +116,286 @@ class ConsolePrinter:
         else:
             print("\n✓ Todos los usuarios que sigues te siguen de vuelta")
     
+    @staticmethod
+    def print_cache_statistics(hits: int, misses: int):
+        """
+        Imprime el uso de la caché de perfiles.
+        
+        Args:
+            hits: Perfiles servidos desde la caché.
+            misses: Perfiles resueltos en Instagram.
+        """
+        print(f"\n🗂️  Caché de perfiles: {hits} reutilizados, {misses} consultados "
+              f"({hits} solicitudes ahorradas)")
+    
+    @staticmethod
+    def print_rate_limit_statistics(stats: RateLimiterStats, users: int = 0):
+        """
+        Imprime las métricas del limitador de velocidad.
+        
+        Args:
+            stats: Métricas acumuladas del limitador.
+            users: Usuarios obtenidos con esas solicitudes (seguidores más seguidos).
+        """
+        print(f"\n⏱️  Solicitudes: {stats.requests} en {stats.elapsed_seconds:.1f}s "
+              f"({stats.requests_per_second:.2f}/s, intervalo actual {stats.current_delay:.2f}s)")
+        if users:
+            print(f"   • {1000 * stats.requests / users:.1f} solicitudes por cada 1000 usuarios")
+        if stats.throttle_events or stats.retries:
+            print(f"   • Reintentos: {stats.retries} ({stats.throttle_events} por 429)")
+            print(f"   • Tiempo en pausa por límites de Instagram: {stats.throttled_seconds:.1f}s")
+    
+    @staticmethod
+    def print_transport_statistics(stats: TransportStats):
+        """
+        Imprime el uso de conexiones y cómo se reparte la latencia de las solicitudes.
+        
+        Args:
+            stats: Métricas acumuladas del transporte.
+        """
+        if not stats.requests:
+            return
+        total = stats.connect_seconds + stats.server_seconds
+        connect_share = 100 * stats.connect_seconds / total if total else 0.0
+        print(f"🔌 Conexiones: {stats.new_connections} abiertas, {stats.reused_connections} de "
+              f"{stats.requests} solicitudes reutilizaron una ya abierta")
+        print(f"   • Latencia: {connect_share:.0f}% estableciendo conexión "
+              f"({stats.average_connect_ms:.0f} ms por conexión), {100 - connect_share:.0f}% en el servidor "
+              f"({stats.average_server_ms:.0f} ms por solicitud)")
+    
+    @staticmethod
+    def print_enrichment_statistics(stats: EnrichmentStats):
+        """
+        Imprime el resultado de la consulta de perfiles.
+        
+        Args:
+            stats: Resultado del enriquecimiento.
+        """
+        print(f"\n🔎 Perfiles: {stats.resolved} consultados, {stats.cached} ya estaban en caché, "
+              f"{stats.failed} no disponibles ({stats.elapsed_seconds:.1f}s)")
+        if stats.resolved:
+            print("   Los reportes incluirán nombre, seguidores y privacidad")
+    
+    @staticmethod
+    def print_run_history(account: str, runs: List[AnalysisRun]):
+        """
+        Imprime los análisis guardados de una cuenta.
+        
+        Args:
+            account: Cuenta analizada.
+            runs: Ejecuciones de la más antigua a la más reciente.
+        """
+        print(f"\n🗄️  Análisis guardados de @{account}: {len(runs)}")
+        for run in runs:
+            date = datetime.fromtimestamp(run.started_at).strftime('%Y-%m-%d %H:%M')
+            source = "exportación" if run.source == 'export' else "Instagram"
+            print(f"   #{run.run_id}  {date}  {run.followers} seguidores, {run.following} seguidos "
+                  f"({source}: descarga {run.crawl_seconds:.1f}s, análisis {run.analysis_seconds:.2f}s)")
+    
+    @staticmethod
+    def print_user_list(title: str, usernames: List[str], limit: int = 50):
+        """
+        Imprime una lista de usuarios, recortada si es muy larga.
+        
+        Args:
+            title: Título de la lista.
+            usernames: Nombres de usuario.
+            limit: Usuarios que se muestran como máximo.
+        """
+        print(f"\n{title} ({len(usernames)}):")
+        for username in usernames[:limit]:
+            print(f"   • @{username}")
+        if len(usernames) > limit:
+            print(f"   ... y {len(usernames) - limit} más")
+    
+    @staticmethod
+    def print_run_diff(diff: RunDiff):
+        """
+        Imprime los cambios entre dos análisis guardados.
+        
+        Args:
+            diff: Cambios entre las dos ejecuciones.
+        """
+        before = datetime.fromtimestamp(diff.before.started_at).strftime('%Y-%m-%d %H:%M')
+        after = datetime.fromtimestamp(diff.after.started_at).strftime('%Y-%m-%d %H:%M')
+        ConsolePrinter.print_snapshot_diff(
+            f"🔄 @{diff.after.account}: #{diff.before.run_id} ({before}) → #{diff.after.run_id} ({after})",
+            diff
+        )
+    
+    @staticmethod
+    def print_snapshot_diff(title: str, diff: SnapshotDiff):
+        """
+        Imprime los seguidores y seguidos ganados y perdidos entre dos momentos.
+        
+        Args:
+            title: Encabezado (qué se compara).
+            diff: Cambios entre los dos momentos.
+        """
+        ConsolePrinter.print_header(title)
+        if not diff.total_changes:
+            print("Sin cambios en seguidores ni seguidos")
+            return
+        
+        for title, usernames in (
+            ("💔 Te dejaron de seguir", diff.lost_followers),
+            ("🎉 Nuevos seguidores", diff.new_followers),
+            ("➖ Dejaste de seguir", diff.lost_following),
+            ("➕ Empezaste a seguir", diff.new_following)
+        ):
+            if usernames:
+                ConsolePrinter.print_user_list(title, usernames)
+    
+    @staticmethod
+    def print_user_presence(username: str, presences: List[UserPresence]):
+        """
+        Imprime la primera y la última vez que un usuario apareció en el historial.
+        
+        Args:
+            username: Usuario buscado.
+            presences: Una entrada por lista en la que apareció.
+        """
+        if not presences:
+            print(f"\n@{username} no aparece en ningún análisis guardado")
+            return
+        
+        labels = {'followers': "Te sigue", 'following': "Lo sigues"}
+        print(f"\n👤 @{username}:")
+        for presence in presences:
+            first = datetime.fromtimestamp(presence.first_seen_at).strftime('%Y-%m-%d %H:%M')
+            last = datetime.fromtimestamp(presence.last_seen_at).strftime('%Y-%m-%d %H:%M')
+            status = "sigue en la lista" if presence.in_latest_run else "ya no está en la lista"
+            print(f"   • {labels[presence.kind]}: visto por primera vez {first} (#{presence.first_run_id}), "
+                  f"por última vez {last} (#{presence.last_run_id}), en {presence.runs_seen} análisis; {status}")
+    
+    @staticmethod
+    def print_follow_history(intervals: List[FollowInterval]):
+        """
+        Imprime cuándo un usuario entró y salió de cada lista.
+        
+        Args:
+            intervals: Intervalos del más antiguo al más reciente.
+        """
+        if not intervals:
+            return
+        
+        labels = {'followers': "Te siguió", 'following': "Lo seguiste"}
+        print("   Historial:")
+        for interval in intervals:
+            started = datetime.fromtimestamp(interval.started_at).strftime('%Y-%m-%d %H:%M')
+            start = (f"desde antes del primer análisis ({started})" if interval.since_first_run
+                     else f"desde {started} (#{interval.start_run_id})")
+            if interval.end_run_id is None:
+                end = "hasta hoy"
+            else:
+                end = f"hasta {datetime.fromtimestamp(interval.ended_at).strftime('%Y-%m-%d %H:%M')} (#{interval.end_run_id})"
+            print(f"     - {labels[interval.kind]} {start} {end}")
+    
+    @staticmethod
+    def print_churn(account: str, stats: ChurnStatistics):
+        """
+        Imprime la evolución de una lista en un periodo.
+        
+        Args:
+            account: Cuenta analizada.
+            stats: Altas, bajas y sumas móviles por día.
+        """
+        label = "seguidores" if stats.kind == 'followers' else "seguidos"
+        ConsolePrinter.print_header(f"📉 @{account}: {label} del {stats.days[0].day} al {stats.days[-1].day}")
+        print(f"   • Altas: {stats.gained}")
+        print(f"   • Bajas: {stats.lost} ({stats.churn_percentage:.1f}% de los {stats.size_at_start} del inicio)")
+        print(f"   • Variación neta: {stats.net:+d}")
+        print(f"   • Altas que siguen: {stats.retained} de {stats.gained} ({stats.retention_percentage:.1f}%)")
+        
+        print(f"\n   Cada {stats.rolling_days} días (altas, bajas y neto de los {stats.rolling_days} días anteriores):")
+        rolling_net = stats.rolling_net
+        for index in reversed(range(len(stats.days) - 1, -1, -stats.rolling_days)):
+            print(f"   {stats.days[index].day}  +{stats.rolling_gained[index]:<6} -{stats.rolling_lost[index]:<6} "
+                  f"{rolling_net[index]:+d}")
+    
+    @staticmethod
+    def print_audience_overlap(overlap: AudienceOverlap, top: int = 10):
+        """
+        Imprime el solapamiento de audiencias: exclusivos de cada cuenta y los pares más parecidos.
+        
+        Args:
+            overlap: Solapamiento calculado.
+            top: Pares a mostrar.
+        """
+        count = len(overlap.accounts)
+        ConsolePrinter.print_header(f"🔗 AUDIENCIAS DE {count} CUENTAS")
+        print(f"   • Alcance: {overlap.reach} usuarios distintos siguen a alguna de las cuentas")
+        print(f"   • Tiempo: {overlap.seconds:.2f}s")
+        
+        print("\n   Seguidores y exclusivos (no siguen a ninguna de las otras cuentas):")
+        width = max(len(account) for account in overlap.accounts)
+        for i, account in enumerate(overlap.accounts):
+            print(f"   @{account:<{width}}  {overlap.followers(i):>9}  exclusivos {overlap.exclusive[i]:>9} "
+                  f"({overlap.exclusive_percentage(i):.1f}%)")
+        
+        pairs = sorted(
+            ((i, j) for i in range(count) for j in range(i + 1, count)),
+            key=lambda pair: overlap.jaccard(*pair),
+            reverse=True
+        )[:top]
+        if pairs:
+            print("\n   Audiencias más parecidas (Jaccard):")
+            for i, j in pairs:
+                first, second = overlap.accounts[i], overlap.accounts[j]
+                print(f"   @{first} ↔ @{second}: {overlap.jaccard(i, j) * 100:.1f}% "
+                      f"({overlap.shared[i][j]} en común)")
+                print(f"      {overlap.also_follow_percentage(i, j):.1f}% de los seguidores de @{first} siguen a @{second}, "
+                      f"{overlap.also_follow_percentage(j, i):.1f}% de los de @{second} siguen a @{first}")
+    
+    @staticmethod
+    def print_compaction_report(report: CompactionReport):
+        """
+        Imprime cuánto espacio liberó la compactación del historial.
+        
+        Args:
+            report: Resultado de la compactación.
+        """
+        ConsolePrinter.print_header("🧹 HISTORIAL COMPACTADO")
+        print(f"   • Cuentas: {report.accounts}")
+        print(f"   • Análisis: {report.runs_before} → {report.runs_after} ({report.runs_removed} descartados)")
+        print(f"   • Filas de listas y cambios: {report.rows_before} → {report.rows_after}")
+        print(f"   • Tamaño: {report.bytes_before / 1024 / 1024:.1f} MB → {report.bytes_after / 1024 / 1024:.1f} MB "
+              f"({report.saved_percentage:.1f}% menos)")
+        print(f"   • Tiempo: {report.seconds:.1f}s")
+    
+    @staticmethod
+    def print_batch_summary(report: BatchReport):
+        """
+        Imprime el resumen de un análisis por lotes.
+        
+        Args:
+            report: Resultado del lote.
+        """
+        ConsolePrinter.print_header("📦 RESUMEN DEL LOTE")
+        
+        print(f"{'Cuenta':<25} {'Seguidores':>10} {'Seguidos':>10} {'No te siguen':>13}")
+        print("-" * 61)
+        for job_result in report.results:
+            name = f"@{job_result.job.target}"
+            if job_result.succeeded:
+                stats = job_result.result.statistics
+                print(f"{name:<25} {stats.total_followers:>10} {stats.total_following:>10} "
+                      f"{stats.not_following_back:>13}")
+            else:
+                print(f"{name:<25} ✗ {job_result.error}")
+        
+        print(f"\n✓ {report.succeeded} cuentas analizadas, {report.failed} con error "
+              f"en {report.elapsed_seconds:.1f}s")
+        for session, stats in report.session_stats.items():
+            print(f"   • Sesión @{session}: {stats.requests} solicitudes "
+                  f"({stats.requests_per_second:.2f}/s, {stats.throttle_events} por 429)")
+        
+        users = sum(r.result.statistics.total_followers + r.result.statistics.total_following
+                    for r in report.results if r.succeeded)
+        requests = sum(stats.requests for stats in report.session_stats.values())
+        if users:
+            print(f"   • {1000 * requests / users:.1f} solicitudes por cada 1000 usuarios")
+    
     @staticmethod
     def print_cookie_instructions():
         """Imprime instrucciones para obtener cookies."""
@@ -4,12 +4,37 @@ Proporciona servicios auxiliares como exportación de reportes y manejo de archi
 """
 
 from .file_manager import FileManager
-from .report_exporter import ReportExporter, TextReportExporter, JSONReportExporter, UnfollowersListExporter
+from .config_loader import (
+    ConfigLoader,
+    InstagramSettings,
+    AnalysisSettings,
+    BatchSettings,
+    SessionPoolSettings,
+    EnrichmentSettings
+)
+from .report_exporter import (
+    ReportExporter,
+    TextReportExporter,
+    JSONReportExporter,
+    UnfollowersListExporter,
+    BinarySnapshotExporter,
+    BatchSummaryExporter,
+    AudienceOverlapExporter
+)
 
 __all__ = [
     'FileManager',
     'ReportExporter',
     'TextReportExporter',
     'JSONReportExporter',
-    'UnfollowersListExporter'
+    'UnfollowersListExporter',
+    'BinarySnapshotExporter',
+    'BatchSummaryExporter',
+    'AudienceOverlapExporter',
+    'ConfigLoader',
+    'InstagramSettings',
+    'AnalysisSettings',
+    'BatchSettings',
+    'SessionPoolSettings',
+    'EnrichmentSettings'
 ]
@@ -0,0 +1,231 @@
+"""
+Cargador de la configuración de la aplicación.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import yaml
+except ImportError:  # PyYAML es opcional: sin él se usan los valores por defecto
+    yaml = None
+
+
+DEFAULT_CONFIG_PATH = Path(__file__).resolve().parent.parent.parent / "config" / "config.yaml"
+
+
+@dataclass
+class InstagramSettings:
+    """
+    Configuración de acceso a Instagram (sección 'instagram' de config.yaml).
+    """
+    rate_limit_delay: float = 1.0     # Segundos entre solicitudes
+    min_rate_limit_delay: float = 0.5  # Límite inferior del modo adaptativo
+    adaptive_rate_limit: bool = True
+    max_retries: int = 3
+    timeout: float = 30.0              # Segundos de espera máximos por solicitud
+    connection_pool_size: int = 10     # Conexiones keep-alive abiertas por host
+    compression: bool = True
+    prefetch_pages: int = 1            # Páginas pedidas por adelantado mientras se procesa la actual
+    page_size: int = 50                # Usuarios por página (se reduce solo si Instagram lo rechaza)
+
+
+@dataclass
+class AnalysisSettings:
+    """
+    Configuración del análisis (sección 'analysis' de config.yaml).
+    """
+    incremental_sync: bool = True
+    incremental_stop_after: int = 50  # Usuarios ya conocidos seguidos antes de dejar de paginar
+    incremental_full_sync_every: int = 10   # Sincronizaciones incrementales antes de forzar una completa
+    incremental_full_sync_days: float = 7.0  # Días desde la última descarga completa antes de forzar otra
+    keep_history: bool = True         # Guardar cada ejecución en el historial
+    history_checkpoint_every: int = 10  # Ejecuciones entre dos guardados completos de las listas
+    history_keep_all_days: int = 30     # Días en los que se conservan todas las ejecuciones al compactar
+    history_keep_daily_days: int = 180  # Hasta aquí, la última de cada día; después, la última de cada semana
+    set_backend: str = 'auto'           # auto, hash o sorted (motor de conjuntos del análisis)
+
+
+@dataclass
+class BatchSettings:
+    """
+    Configuración del modo por lotes (sección 'batch' de config.yaml).
+    """
+    max_workers: int = 4        # Cuentas analizadas a la vez en total
+    jobs_per_session: int = 1   # Cuentas analizadas a la vez con una misma sesión
+
+
+@dataclass
+class SessionPoolSettings:
+    """
+    Grupos de sesiones guardadas (sección 'session_pool' de config.yaml).
+    """
+    strategy: str = 'round_robin'   # round_robin o least_throttled
+    cooldown_seconds: float = 600.0  # Tiempo fuera de rotación tras un 429
+    pools: Dict[str, List[str]] = field(default_factory=dict)  # Nombre del grupo → sesiones
+
+
+@dataclass
+class EnrichmentSettings:
+    """
+    Consulta de nombre, seguidores y privacidad de los perfiles (sección 'enrichment' de config.yaml).
+    """
+    max_workers: int = 4  # Perfiles consultados a la vez
+    ttl_days: Dict[str, float] = field(default_factory=lambda: {
+        'full_name': 30.0,
+        'followers': 1.0,
+        'is_private': 7.0
+    })  # Vigencia de cada campo en la caché
+    
+    @property
+    def ttl_seconds(self) -> Dict[str, float]:
+        """Vigencia de cada campo en segundos."""
+        return {name: days * 86400 for name, days in self.ttl_days.items()}
+
+
+class ConfigLoader:
+    """
+    Cargador de config.yaml.
+    Siguiendo Single Responsibility Principle: solo lee y expone la configuración.
+    """
+    
+    def __init__(self, config_path: Optional[Path] = None, data: Optional[Dict[str, Any]] = None):
+        """
+        Inicializa el cargador.
+        
+        Args:
+            config_path: Ruta al archivo de configuración. Por defecto config/config.yaml.
+            data: Configuración ya cargada; si se indica, no se lee ningún archivo.
+        """
+        self.config_path = config_path or DEFAULT_CONFIG_PATH
+        self._data: Optional[Dict[str, Any]] = data
+    
+    def load(self) -> Dict[str, Any]:
+        """
+        Lee el archivo de configuración (solo la primera vez).
+        
+        Returns:
+            Dict[str, Any]: Configuración completa, vacía si no se pudo leer.
+        """
+        if self._data is not None:
+            return self._data
+        
+        self._data = {}
+        if yaml is None:
+            print("PyYAML no está instalado, se usa la configuración por defecto")
+            return self._data
+        
+        try:
+            with open(self.config_path, 'r', encoding='utf-8') as f:
+                self._data = yaml.safe_load(f) or {}
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error al leer configuración {self.config_path}: {e}")
+        
+        return self._data
+    
+    def get_section(self, name: str) -> Dict[str, Any]:
+        """
+        Obtiene una sección de la configuración.
+        
+        Args:
+            name: Nombre de la sección.
+            
+        Returns:
+            Dict[str, Any]: Valores de la sección, vacío si no existe.
+        """
+        section = self.load().get(name)
+        return section if isinstance(section, dict) else {}
+    
+    def get_analysis_settings(self) -> AnalysisSettings:
+        """
+        Obtiene la configuración del análisis.
+        
+        Returns:
+            AnalysisSettings: Configuración con valores por defecto para las claves ausentes.
+        """
+        section = self.get_section('analysis')
+        defaults = AnalysisSettings()
+        return AnalysisSettings(
+            incremental_sync=bool(section.get('incremental_sync', defaults.incremental_sync)),
+            incremental_stop_after=int(section.get('incremental_stop_after', defaults.incremental_stop_after)),
+            incremental_full_sync_every=int(
+                section.get('incremental_full_sync_every', defaults.incremental_full_sync_every)
+            ),
+            incremental_full_sync_days=float(
+                section.get('incremental_full_sync_days', defaults.incremental_full_sync_days)
+            ),
+            keep_history=bool(section.get('keep_history', defaults.keep_history)),
+            history_checkpoint_every=int(section.get('history_checkpoint_every', defaults.history_checkpoint_every)),
+            history_keep_all_days=int(section.get('history_keep_all_days', defaults.history_keep_all_days)),
+            history_keep_daily_days=int(section.get('history_keep_daily_days', defaults.history_keep_daily_days)),
+            set_backend=str(section.get('set_backend', defaults.set_backend))
+        )
+    
+    def get_batch_settings(self) -> BatchSettings:
+        """
+        Obtiene la configuración del modo por lotes.
+        
+        Returns:
+            BatchSettings: Configuración con valores por defecto para las claves ausentes.
+        """
+        section = self.get_section('batch')
+        defaults = BatchSettings()
+        return BatchSettings(
+            max_workers=int(section.get('max_workers', defaults.max_workers)),
+            jobs_per_session=int(section.get('jobs_per_session', defaults.jobs_per_session))
+        )
+    
+    def get_session_pool_settings(self) -> SessionPoolSettings:
+        """
+        Obtiene la configuración de los grupos de sesiones.
+        
+        Returns:
+            SessionPoolSettings: Configuración con valores por defecto para las claves ausentes.
+        """
+        section = self.get_section('session_pool')
+        defaults = SessionPoolSettings()
+        pools = section.get('pools') or {}
+        return SessionPoolSettings(
+            strategy=str(section.get('strategy', defaults.strategy)),
+            cooldown_seconds=float(section.get('cooldown_seconds', defaults.cooldown_seconds)),
+            pools={str(name): [str(user) for user in users] for name, users in pools.items()}
+        )
+    
+    def get_enrichment_settings(self) -> EnrichmentSettings:
+        """
+        Obtiene la configuración de la consulta de perfiles.
+        
+        Returns:
+            EnrichmentSettings: Configuración con valores por defecto para las claves ausentes.
+        """
+        section = self.get_section('enrichment')
+        defaults = EnrichmentSettings()
+        ttl_days = section.get('ttl_days') or {}
+        return EnrichmentSettings(
+            max_workers=int(section.get('max_workers', defaults.max_workers)),
+            ttl_days={**defaults.ttl_days, **{str(name): float(days) for name, days in ttl_days.items()}}
+        )
+    
+    def get_instagram_settings(self) -> InstagramSettings:
+        """
+        Obtiene la configuración de acceso a Instagram.
+        
+        Returns:
+            InstagramSettings: Configuración con valores por defecto para las claves ausentes.
+        """
+        section = self.get_section('instagram')
+        defaults = InstagramSettings()
+        return InstagramSettings(
+            rate_limit_delay=float(section.get('rate_limit_delay', defaults.rate_limit_delay)),
+            min_rate_limit_delay=float(section.get('min_rate_limit_delay', defaults.min_rate_limit_delay)),
+            adaptive_rate_limit=bool(section.get('adaptive_rate_limit', defaults.adaptive_rate_limit)),
+            max_retries=int(section.get('max_retries', defaults.max_retries)),
+            timeout=float(section.get('timeout', defaults.timeout)),
+            connection_pool_size=int(section.get('connection_pool_size', defaults.connection_pool_size)),
+            compression=bool(section.get('compression', defaults.compression)),
+            prefetch_pages=int(section.get('prefetch_pages', defaults.prefetch_pages)),
+            page_size=int(section.get('page_size', defaults.page_size))
+        )
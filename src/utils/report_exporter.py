@@ -4,11 +4,40 @@ Exportadores de reportes.
 
 from abc import ABC, abstractmethod
 from datetime import datetime
+from itertools import chain
 from typing import Optional
-from ..analysis.models import FollowerAnalysisResult
+from ..analysis.models import AudienceOverlap, FollowerAnalysisResult
+from ..batch.models import BatchReport
+from ..data.profile_metadata import ProfileMetadataCache
+from ..storage.binary_snapshot import write_binary_snapshot
 from .file_manager import FileManager
 
 
+def _describe_user(username: str, metadata: Optional[ProfileMetadataCache] = None) -> str:
+    """
+    Formatea un usuario con los datos que haya en la caché de perfiles (sin consultar Instagram).
+    
+    Args:
+        username: Nombre de usuario.
+        metadata: Caché de perfiles.
+        
+    Returns:
+        str: '@usuario' o '@usuario — Nombre · 1234 seguidores · privada'.
+    """
+    profile = metadata.get(username) if metadata else None
+    if not profile:
+        return f"@{username}"
+    
+    details = []
+    if profile.full_name:
+        details.append(profile.full_name)
+    if profile.followers is not None:
+        details.append(f"{profile.followers} seguidores")
+    if profile.is_private is not None:
+        details.append("privada" if profile.is_private else "pública")
+    return f"@{username} — {' · '.join(details)}" if details else f"@{username}"
+
+
 class ReportExporter(ABC):
     """
     Interfaz para exportadores de reportes.
@@ -35,14 +64,16 @@ class TextReportExporter(ReportExporter):
     Exportador de reportes en formato texto.
     """
     
-    def __init__(self, file_manager: FileManager):
+    def __init__(self, file_manager: FileManager, metadata: Optional[ProfileMetadataCache] = None):
         """
         Inicializa el exportador.
         
         Args:
             file_manager: Gestor de archivos.
+            metadata: Caché de perfiles de la que tomar nombre, seguidores y privacidad.
         """
         self._file_manager = file_manager
+        self._metadata = metadata
     
     def export(self, result: FollowerAnalysisResult, filename: Optional[str] = None) -> bool:
         """
@@ -93,25 +124,25 @@ class TextReportExporter(ReportExporter):
         lines.append(f"   • Los sigues pero no te siguen: {stats.not_following_back} ({stats.unfollowers_percentage:.1f}%)")
         
         # Lista de usuarios que no te siguen de vuelta
-        not_following_back = sorted(result.not_following_back)
+        not_following_back = result.users.sorted_usernames(result.not_following_back_ids)
         if not_following_back:
             lines.append(f"\n\n⚠️  USUARIOS QUE NO TE SIGUEN DE VUELTA ({len(not_following_back)}):")
             for i, user in enumerate(not_following_back, 1):
-                lines.append(f"   {i}. @{user}")
+                lines.append(f"   {i}. {_describe_user(user, self._metadata)}")
         else:
             lines.append("\n\n✓ Todos los usuarios que sigues te siguen de vuelta")
         
         # Lista de usuarios que te siguen pero no sigues
-        not_followed_back = sorted(result.not_followed_back)
+        not_followed_back = result.users.sorted_usernames(result.not_followed_back_ids)
         if not_followed_back:
             lines.append(f"\n\n👥 USUARIOS QUE TE SIGUEN Y NO SIGUES ({len(not_followed_back)}):")
             if len(not_followed_back) <= 20:
                 for i, user in enumerate(not_followed_back, 1):
-                    lines.append(f"   {i}. @{user}")
+                    lines.append(f"   {i}. {_describe_user(user, self._metadata)}")
             else:
                 lines.append("   (Lista muy larga, mostrando primeros 20)")
                 for i, user in enumerate(not_followed_back[:20], 1):
-                    lines.append(f"   {i}. @{user}")
+                    lines.append(f"   {i}. {_describe_user(user, self._metadata)}")
         
         lines.append("\n" + "=" * 70)
         
@@ -123,14 +154,16 @@ class JSONReportExporter(ReportExporter):
     Exportador de reportes en formato JSON.
     """
     
-    def __init__(self, file_manager: FileManager):
+    def __init__(self, file_manager: FileManager, metadata: Optional[ProfileMetadataCache] = None):
         """
         Inicializa el exportador.
         
         Args:
             file_manager: Gestor de archivos.
+            metadata: Caché de perfiles de la que tomar nombre, seguidores y privacidad.
         """
         self._file_manager = file_manager
+        self._metadata = metadata
     
     def export(self, result: FollowerAnalysisResult, filename: Optional[str] = None) -> bool:
         """
@@ -149,6 +182,17 @@ class JSONReportExporter(ReportExporter):
         
         data = result.to_dict()
         data['export_date'] = datetime.now().isoformat()
+        if self._metadata:
+            # Solo los perfiles que ya están en la caché: exportar no hace solicitudes
+            profiles = (self._metadata.get(user) for user in chain(data['followers'], data['following']))
+            data['profiles'] = {
+                profile.username: {
+                    'full_name': profile.full_name,
+                    'followers': profile.followers,
+                    'is_private': profile.is_private
+                }
+                for profile in profiles if profile
+            }
         
         success = self._file_manager.write_json_file(filename, data)
         
@@ -158,19 +202,64 @@ class JSONReportExporter(ReportExporter):
         return success
 
 
+class BinarySnapshotExporter(ReportExporter):
+    """
+    Exportador de instantáneas binarias (.igsnap).
+    Guarda las listas completas en un formato compacto que se abre sin cargarlo en memoria,
+    pensado para comparar análisis antiguos con --compare-snapshots.
+    """
+    
+    def __init__(self, file_manager: FileManager, account: str = ''):
+        """
+        Inicializa el exportador.
+        
+        Args:
+            file_manager: Gestor de archivos.
+            account: Cuenta analizada (se guarda en la instantánea).
+        """
+        self._file_manager = file_manager
+        self._account = account
+    
+    def export(self, result: FollowerAnalysisResult, filename: Optional[str] = None) -> bool:
+        """
+        Exporta el resultado a una instantánea binaria.
+        
+        Args:
+            result: Resultado del análisis.
+            filename: Nombre del archivo.
+            
+        Returns:
+            bool: True si se exportó exitosamente.
+        """
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"instagram_snapshot_{timestamp}.igsnap"
+        
+        try:
+            size = write_binary_snapshot(self._file_manager.base_directory / filename, result, self._account)
+        except OSError as e:
+            print(f"Error al escribir archivo {filename}: {e}")
+            return False
+        
+        print(f"💾 Instantánea guardada en: {filename} ({size / 1024:.0f} KB)")
+        return True
+
+
 class UnfollowersListExporter:
     """
     Exportador especializado para lista de unfollowers.
     """
     
-    def __init__(self, file_manager: FileManager):
+    def __init__(self, file_manager: FileManager, metadata: Optional[ProfileMetadataCache] = None):
         """
         Inicializa el exportador.
         
         Args:
             file_manager: Gestor de archivos.
+            metadata: Caché de perfiles de la que tomar nombre, seguidores y privacidad.
         """
         self._file_manager = file_manager
+        self._metadata = metadata
     
     def export(self, unfollowers: set, filename: str = "unfollowers.txt") -> bool:
         """
@@ -192,7 +281,7 @@ class UnfollowersListExporter:
         ]
         
         for user in unfollowers_sorted:
-            lines.append(f"@{user}")
+            lines.append(_describe_user(user, self._metadata))
         
         content = '\n'.join(lines)
         success = self._file_manager.write_text_file(filename, content)
@@ -201,3 +290,135 @@ class UnfollowersListExporter:
             print(f"✓ Lista guardada en: {filename}")
         
         return success
+
+
+class BatchSummaryExporter:
+    """
+    Exportador del resumen combinado de un análisis por lotes.
+    Reúne en un solo JSON el reporte de cada cuenta (el mismo de JSONReportExporter),
+    los errores y las métricas de velocidad de cada sesión.
+    """
+    
+    def __init__(self, file_manager: FileManager):
+        """
+        Inicializa el exportador.
+        
+        Args:
+            file_manager: Gestor de archivos.
+        """
+        self._file_manager = file_manager
+    
+    def export(self, report: BatchReport, filename: Optional[str] = None) -> bool:
+        """
+        Exporta el resumen del lote a un archivo JSON.
+        
+        Args:
+            report: Resultado del lote.
+            filename: Nombre del archivo.
+            
+        Returns:
+            bool: True si se exportó exitosamente.
+        """
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"instagram_batch_{timestamp}.json"
+        
+        accounts = []
+        for job_result in report.results:
+            entry = {
+                'account': job_result.job.target,
+                'session': job_result.job.session,
+                'elapsed_seconds': round(job_result.elapsed_seconds, 1)
+            }
+            if job_result.succeeded:
+                entry.update(job_result.result.to_dict())
+            else:
+                entry['error'] = job_result.error
+            accounts.append(entry)
+        
+        data = {
+            'export_date': datetime.now().isoformat(),
+            'elapsed_seconds': round(report.elapsed_seconds, 1),
+            'succeeded': report.succeeded,
+            'failed': report.failed,
+            'sessions': {
+                session: {
+                    'requests': stats.requests,
+                    'retries': stats.retries,
+                    'throttle_events': stats.throttle_events,
+                    'requests_per_second': round(stats.requests_per_second, 2)
+                }
+                for session, stats in report.session_stats.items()
+            },
+            'accounts': accounts
+        }
+        
+        success = self._file_manager.write_json_file(filename, data)
+        
+        if success:
+            print(f"💾 Resumen del lote guardado en: {filename}")
+        
+        return success
+
+
+class AudienceOverlapExporter:
+    """
+    Exportador del solapamiento de audiencias entre varias cuentas.
+    Guarda los seguidores de cada cuenta y una entrada por cada par ordenado (A, B)
+    con los seguidores en común, el índice de Jaccard y cuántos seguidores de A siguen a B.
+    """
+    
+    def __init__(self, file_manager: FileManager):
+        """
+        Inicializa el exportador.
+        
+        Args:
+            file_manager: Gestor de archivos.
+        """
+        self._file_manager = file_manager
+    
+    def export(self, overlap: AudienceOverlap, filename: Optional[str] = None) -> bool:
+        """
+        Exporta el solapamiento a un archivo JSON.
+        
+        Args:
+            overlap: Solapamiento calculado.
+            filename: Nombre del archivo.
+            
+        Returns:
+            bool: True si se exportó exitosamente.
+        """
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"instagram_overlap_{timestamp}.json"
+        
+        accounts = range(len(overlap.accounts))
+        data = {
+            'export_date': datetime.now().isoformat(),
+            'reach': overlap.reach,
+            'accounts': [
+                {
+                    'account': overlap.accounts[i],
+                    'followers': overlap.followers(i),
+                    'exclusive': overlap.exclusive[i],
+                    'exclusive_percentage': round(overlap.exclusive_percentage(i), 2)
+                }
+                for i in accounts
+            ],
+            'pairs': [
+                {
+                    'account': overlap.accounts[i],
+                    'other': overlap.accounts[j],
+                    'shared': overlap.shared[i][j],
+                    'jaccard': round(overlap.jaccard(i, j), 4),
+                    'also_follow_percentage': round(overlap.also_follow_percentage(i, j), 2)
+                }
+                for i in accounts for j in accounts if i != j
+            ]
+        }
+        success = self._file_manager.write_json_file(filename, data)
+        
+        if success:
+            print(f"💾 Solapamiento guardado en: {filename}")
+        
+        return success
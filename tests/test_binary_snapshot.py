@@ -0,0 +1,91 @@
+"""
+Pruebas de las instantáneas binarias (.igsnap).
+"""
+
+import random
+import pytest
+from src.analysis import FollowerAnalyzer, UserRecord
+from src.storage import BinarySnapshot, write_binary_snapshot
+from src.storage.binary_snapshot import BLOCK_SIZE
+
+
+def _ids(seed: int, count: int):
+    # Diferencias de todos los anchos: consecutivos, saltos medianos y saltos de más de 32 bits
+    rng = random.Random(seed)
+    ids, current = [], 0
+    for _ in range(count):
+        current += rng.choice((1, rng.randrange(2, 60_000), rng.randrange(2**33, 2**40)))
+        ids.append(current)
+    return ids
+
+
+def _analysis(follower_ids, following_ids, names=None):
+    names = names or {}
+    
+    def users(ids):
+        return [UserRecord(user_id, names.get(user_id, f"user_{user_id}")) for user_id in ids]
+    return FollowerAnalyzer(users(follower_ids), users(following_ids)).analyze()
+
+
+def test_round_trip_keeps_lists_names_and_header(tmp_path):
+    ids = _ids(1, 3 * BLOCK_SIZE + 17)
+    rng = random.Random(2)
+    followers, following = rng.sample(ids, 2000), rng.sample(ids, 1800)
+    result = FollowerAnalyzer(
+        [UserRecord(user_id, f"user_{user_id}") for user_id in followers] + ['sin_id', 'ñandú.ü'],
+        [UserRecord(user_id, f"user_{user_id}") for user_id in following] + ['sin_id']
+    ).analyze()
+    path = tmp_path / "cuenta.igsnap"
+    
+    size = write_binary_snapshot(path, result, account='Cuenta', created_at=1234.5)
+    
+    assert path.stat().st_size == size
+    with BinarySnapshot(path) as snapshot:
+        assert snapshot.account == 'cuenta'
+        assert snapshot.created_at == 1234.5
+        assert (snapshot.follower_count, snapshot.following_count) == (len(followers) + 2, len(following) + 1)
+        assert snapshot.follower_ids == result.follower_ids
+        assert snapshot.following_ids == result.following_ids
+        assert snapshot.usernames(snapshot.follower_ids) == sorted(result.followers)
+        assert snapshot.usernames(snapshot.following_ids) == sorted(result.following)
+        with pytest.raises(KeyError):
+            snapshot.username(-42)
+
+
+def test_empty_result_round_trip(tmp_path):
+    path = tmp_path / "vacia.igsnap"
+    write_binary_snapshot(path, _analysis([], []))
+    
+    with BinarySnapshot(path) as snapshot:
+        assert len(snapshot.follower_ids) == 0
+        assert len(snapshot.following_ids) == 0
+        assert snapshot.user_count == 0
+
+
+def test_diff_matches_set_differences_and_ignores_renames(tmp_path):
+    ids = _ids(3, 2500)
+    rng = random.Random(4)
+    before_lists = rng.sample(ids, 1500), rng.sample(ids, 1200)
+    after_lists = rng.sample(ids, 1400), rng.sample(ids, 1300)
+    renamed = sorted(set(before_lists[0]) & set(after_lists[0]))[0]
+    before, after = tmp_path / "antes.igsnap", tmp_path / "despues.igsnap"
+    write_binary_snapshot(before, _analysis(*before_lists))
+    write_binary_snapshot(after, _analysis(*after_lists, names={renamed: "nuevo_nombre"}))
+    
+    with BinarySnapshot(before) as old, BinarySnapshot(after) as new:
+        diff = old.diff(new)
+    
+    def names(user_ids):
+        return sorted(f"user_{user_id}" for user_id in user_ids)
+    assert diff.new_followers == names(set(after_lists[0]) - set(before_lists[0]))
+    assert diff.lost_followers == names(set(before_lists[0]) - set(after_lists[0]))
+    assert diff.new_following == names(set(after_lists[1]) - set(before_lists[1]))
+    assert diff.lost_following == names(set(before_lists[1]) - set(after_lists[1]))
+
+
+def test_rejects_files_that_are_not_snapshots(tmp_path):
+    path = tmp_path / "otro.igsnap"
+    path.write_bytes(b'{"followers": []}' + bytes(200))
+    
+    with pytest.raises(ValueError):
+        BinarySnapshot(path)
@@ -0,0 +1,59 @@
+"""
+Pruebas de ConcurrentRelationsFetcher.
+"""
+
+import threading
+import time
+import pytest
+from src.analysis.models import UserRecord
+from src.data.concurrent_fetcher import ConcurrentRelationsFetcher
+
+
+class _FailingRepository:
+    """Seguidores que fallan tras el primer lote y seguidos que paginan sin fin."""
+    
+    def __init__(self):
+        self.following_closed = threading.Event()
+        self.following_pages = 0
+    
+    def iter_followers(self, username=None):
+        yield [UserRecord(1, 'a')]
+        raise PermissionError("sesión vencida")
+    
+    def iter_following(self, username=None):
+        try:
+            while True:
+                time.sleep(0.01)
+                self.following_pages += 1
+                yield [UserRecord(1000 + self.following_pages, 'b')]
+        finally:
+            self.following_closed.set()
+
+
+def test_stream_delivers_both_lists():
+    class Repository:
+        def iter_followers(self, username=None):
+            yield [UserRecord(1, 'a'), UserRecord(2, 'b')]
+        
+        def iter_following(self, username=None):
+            yield [UserRecord(2, 'b')]
+            yield [UserRecord(3, 'c')]
+    
+    followers, following = ConcurrentRelationsFetcher(Repository()).fetch()
+    
+    assert followers == {'a', 'b'}
+    assert following == {'b', 'c'}
+
+
+def test_stream_error_stops_the_other_crawl():
+    repository = _FailingRepository()
+    start = time.monotonic()
+    
+    with pytest.raises(PermissionError):
+        ConcurrentRelationsFetcher(repository).stream(lambda kind, batch: None)
+    
+    assert time.monotonic() - start < 1.0
+    assert repository.following_closed.wait(1.0)
+    pages = repository.following_pages
+    time.sleep(0.05)
+    assert repository.following_pages == pages
@@ -0,0 +1,82 @@
+"""
+Pruebas de IncrementalFollowerAnalyzer.
+"""
+
+import random
+import pytest
+from src.analysis import (
+    FollowerAnalyzer,
+    HashSetBackend,
+    IncrementalFollowerAnalyzer,
+    SortedArrayBackend,
+    UserRecord
+)
+from src.storage import RunSnapshotStore
+
+
+def _records(user_ids):
+    return [UserRecord(user_id, f"user{user_id}") for user_id in user_ids]
+
+
+def _assert_same(incremental, rebuilt):
+    result = incremental.analyze()
+    assert result.statistics == rebuilt.statistics
+    assert incremental.statistics == rebuilt.statistics
+    assert list(result.follower_ids) == list(rebuilt.follower_ids)
+    assert list(result.following_ids) == list(rebuilt.following_ids)
+    assert list(incremental.mutual_follower_ids) == list(rebuilt.mutual_follower_ids)
+    assert list(incremental.not_following_back_ids) == list(rebuilt.not_following_back_ids)
+    assert list(incremental.not_followed_back_ids) == list(rebuilt.not_followed_back_ids)
+    assert incremental.mutual_followers == rebuilt.mutual_followers
+
+
+@pytest.mark.parametrize('backend', [HashSetBackend(), SortedArrayBackend()])
+def test_random_changes_match_full_rebuild(backend):
+    rng = random.Random(7)
+    followers = set(rng.sample(range(1, 500), 200))
+    following = set(rng.sample(range(1, 500), 150))
+    incremental = IncrementalFollowerAnalyzer(
+        FollowerAnalyzer(_records(followers), _records(following)).analyze(), set_backend=backend
+    )
+    
+    for _ in range(300):
+        user_id = rng.randrange(1, 600)
+        change = rng.randrange(4)
+        if change == 0:
+            incremental.add_followers(_records([user_id]))
+            followers.add(user_id)
+        elif change == 1:
+            incremental.remove_followers(_records([user_id]))
+            followers.discard(user_id)
+        elif change == 2:
+            incremental.add_following(_records([user_id]))
+            following.add(user_id)
+        else:
+            incremental.remove_following(_records([user_id]))
+            following.discard(user_id)
+    
+    _assert_same(incremental, FollowerAnalyzer(_records(followers), _records(following)).analyze())
+
+
+def test_constructor_does_not_build_the_categories():
+    previous = FollowerAnalyzer(_records(range(1, 100)), _records(range(50, 150))).analyze()
+    incremental = IncrementalFollowerAnalyzer(previous)
+    incremental.add_followers(_records([120]))
+    
+    assert incremental.statistics.mutual_followers == 51
+    assert previous._mutual_follower_ids is None
+
+
+def test_run_diff_applied_to_previous_run_matches_rebuild(tmp_path):
+    store = RunSnapshotStore(tmp_path / "history.db")
+    before = FollowerAnalyzer(_records(range(1, 40)), _records(range(20, 60))).analyze()
+    after = FollowerAnalyzer(
+        _records(list(range(5, 45)) + [100]), _records(list(range(20, 50)) + [100])
+    ).analyze()
+    first = store.record_run('cuenta', before, started_at=1000.0, crawl_seconds=1, analysis_seconds=0)
+    second = store.record_run('cuenta', after, started_at=2000.0, crawl_seconds=1, analysis_seconds=0)
+    
+    incremental = IncrementalFollowerAnalyzer(before)
+    incremental.apply_diff(store.diff(first.run_id, second.run_id))
+    
+    _assert_same(incremental, after)
@@ -0,0 +1,53 @@
+"""
+Pruebas de la lectura incremental de arreglos JSON.
+"""
+
+import io
+import json
+import pytest
+from src.data.json_stream import iter_json_array
+
+_DOCUMENTS = [
+    '[]',
+    '  [ ]  ',
+    '{"relationships_following": []}',
+    '[1, 23, -4.5e3, 1000000]',
+    '[ "a" , "b,]" ,"c\\"]" ]',
+    '["ñandú", "\\u00e9\\n", "😀"]',
+    '[{"a": [1, {"b": "]"}]}, [], {}, null, true, false]',
+    '\n{ "relationships_following" :\n [\n {"string_list_data": [{"value": "x", "timestamp": 1}]}\n ]\n}\n',
+    '[{"string_list_data": [{"href": "https://www.instagram.com/y", "value": "y"}]}]'
+]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 64 * 1024])
+@pytest.mark.parametrize('document', _DOCUMENTS)
+def test_matches_json_loads_at_any_chunk_size(document, chunk_size):
+    expected = json.loads(document)
+    if isinstance(expected, dict):
+        expected = next(iter(expected.values()))
+    
+    assert list(iter_json_array(io.StringIO(document), chunk_size=chunk_size)) == expected
+
+
+def test_number_split_across_chunks_is_not_truncated():
+    assert list(iter_json_array(io.StringIO('[12345,6789]'), chunk_size=3)) == [12345, 6789]
+
+
+@pytest.mark.parametrize('document', ['', '   ', '[', '[1,', '[1 2]', '[1,]', '["abc', '{"a": 1}', '42', '"x"'])
+def test_malformed_input_raises_value_error(document):
+    with pytest.raises(ValueError):
+        list(iter_json_array(io.StringIO(document), chunk_size=2))
+
+
+def test_elements_are_yielded_before_the_end_is_read():
+    class Stream(io.StringIO):
+        def read(self, size=-1):
+            chunk = super().read(size)
+            if not chunk:
+                raise AssertionError("se leyó el final antes de tiempo")
+            return chunk
+    
+    items = iter_json_array(Stream('[1, 2, 3'), chunk_size=4)
+    
+    assert next(items) == 1
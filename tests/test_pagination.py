@@ -0,0 +1,89 @@
+"""
+Pruebas de las utilidades de paginación.
+"""
+
+import time
+import pytest
+from instaloader import FrozenNodeIterator, NodeIterator
+from src.data.pagination import freeze_page_boundary, iter_pages, prefetch
+
+TOTAL = 30
+PAGE = 12
+
+
+class _Context:
+    """Contexto de Instaloader que pagina los números 0..TOTAL-1 de a PAGE."""
+    
+    username = 'me'
+    
+    def graphql_query(self, query_hash, variables, referer=None):
+        start = int(variables.get('after') or 0)
+        edges = [{'node': {'id': i}} for i in range(start, min(start + PAGE, TOTAL))]
+        return {'data': {'edges': {
+            'edges': edges,
+            'page_info': {'has_next_page': start + PAGE < TOTAL, 'end_cursor': str(start + PAGE)}
+        }}}
+
+
+def _iterator() -> NodeIterator:
+    return NodeIterator(_Context(), 'hash', lambda data: data['data']['edges'], lambda node: node['id'])
+
+
+def _resume(state) -> tuple:
+    iterator = _iterator()
+    iterator.thaw(FrozenNodeIterator(**state))
+    return [item for page in iter_pages(iterator) for item in page.items], iterator
+
+
+def test_resume_after_page_boundary_does_not_repeat_a_user():
+    iterator = _iterator()
+    first = next(iter_pages(iterator)).items
+    
+    rest, resumed = _resume(freeze_page_boundary(iterator))
+    
+    assert first == list(range(PAGE))
+    assert first + rest == list(range(TOTAL))
+    assert resumed.total_index == TOTAL
+
+
+def test_plain_freeze_would_repeat_the_last_user():
+    iterator = _iterator()
+    first = next(iter_pages(iterator)).items
+    
+    rest, _ = _resume(iterator.freeze()._asdict())
+    
+    assert rest[0] == first[-1]
+
+
+def test_prefetch_yields_items_in_order():
+    assert list(prefetch(iter(range(10)), depth=2)) == list(range(10))
+
+
+def test_prefetch_reraises_producer_error_after_earlier_items():
+    def items():
+        yield 1
+        yield 2
+        raise ConnectionError("sin red")
+    
+    received = []
+    with pytest.raises(ConnectionError, match="sin red"):
+        for item in prefetch(items()):
+            received.append(item)
+    
+    assert received == [1, 2]
+
+
+def test_prefetch_stops_requesting_when_consumer_stops():
+    requested = []
+    
+    def items():
+        for number in range(100):
+            requested.append(number)
+            yield number
+    
+    consumer = prefetch(items(), depth=1)
+    assert next(consumer) == 0
+    consumer.close()
+    time.sleep(0.05)
+    
+    assert len(requested) <= 3
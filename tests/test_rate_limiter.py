@@ -0,0 +1,76 @@
+"""
+Pruebas de la clasificación de errores de AdaptiveRateLimiter.
+"""
+
+import pytest
+import requests
+from instaloader.exceptions import (
+    BadResponseException,
+    ConnectionException,
+    LoginRequiredException,
+    QueryReturnedForbiddenException,
+    QueryReturnedNotFoundException,
+    TooManyRequestsException
+)
+from src.data.rate_limiter import AdaptiveRateLimiter
+
+
+def _wrapped(cause: Exception) -> ConnectionException:
+    """Error como lo relanza Instaloader tras agotar sus propios reintentos."""
+    try:
+        raise cause
+    except Exception as e:
+        try:
+            raise ConnectionException("JSON Query to graphql/query: error") from e
+        except ConnectionException as wrapped:
+            return wrapped
+
+
+@pytest.mark.parametrize('error', [
+    TooManyRequestsException("429 Too Many Requests"),
+    ConnectionException("503 Service Unavailable when accessing https://www.instagram.com/"),
+    ConnectionException("500 Internal Server Error"),
+    requests.exceptions.ConnectionError("connection reset"),
+    requests.exceptions.Timeout("read timed out"),
+    requests.exceptions.ChunkedEncodingError("incomplete read"),
+    ConnectionResetError("reset by peer"),
+    TimeoutError("timed out"),
+    _wrapped(TooManyRequestsException("429")),
+    _wrapped(requests.exceptions.ConnectionError("connection reset"))
+])
+def test_transient_errors_are_retryable(error):
+    assert AdaptiveRateLimiter.is_retryable(error)
+
+
+@pytest.mark.parametrize('error', [
+    ConnectionException("400 Bad Request"),
+    ConnectionException("JSON Query to graphql/query: error"),
+    QueryReturnedForbiddenException("403 Forbidden"),
+    QueryReturnedNotFoundException("404 Not Found"),
+    LoginRequiredException("Login required"),
+    BadResponseException("503 Service Unavailable"),
+    ValueError("500 no es un error HTTP"),
+    _wrapped(QueryReturnedForbiddenException("403 Forbidden"))
+])
+def test_permanent_errors_are_not_retryable(error):
+    assert not AdaptiveRateLimiter.is_retryable(error)
+
+
+def test_only_too_many_requests_is_a_throttle():
+    assert AdaptiveRateLimiter.is_throttle(_wrapped(TooManyRequestsException("429")))
+    assert not AdaptiveRateLimiter.is_throttle(ConnectionException("503 Service Unavailable"))
+
+
+def test_call_does_not_retry_permanent_errors():
+    limiter = AdaptiveRateLimiter(delay=0, min_delay=0, max_retries=3)
+    calls = []
+    
+    def forbidden():
+        calls.append(1)
+        raise QueryReturnedForbiddenException("403 Forbidden")
+    
+    with pytest.raises(QueryReturnedForbiddenException):
+        limiter.call(forbidden)
+    
+    assert len(calls) == 1
+    assert limiter.stats.retries == 0
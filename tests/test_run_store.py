@@ -0,0 +1,88 @@
+"""
+Pruebas de RunSnapshotStore: listas y diferencias antes y después de compactar.
+"""
+
+import random
+import pytest
+from src.analysis import FollowerAnalyzer, UserRecord
+from src.storage import RunSnapshotStore
+
+DAY = 86400.0
+NOW = 1_700_000_000.0
+
+
+def _analysis(followers, following):
+    # Algunos usuarios llegan sin identificador, como en las exportaciones
+    def users(names):
+        return [name if name.startswith('anon') else UserRecord(int(name[4:]), name) for name in names]
+    return FollowerAnalyzer(users(followers), users(following)).analyze()
+
+
+@pytest.fixture
+def history(tmp_path):
+    """Once ejecuciones de una cuenta, una cada dos días, con sus listas esperadas."""
+    store = RunSnapshotStore(tmp_path / "history.db", checkpoint_every=3)
+    rng = random.Random(5)
+    pool = [f"user{i}" for i in range(60)] + [f"anon{i}" for i in range(10)]
+    followers, following = set(rng.sample(pool, 30)), set(rng.sample(pool, 25))
+    expected = {}
+    for index in range(11):
+        followers ^= set(rng.sample(pool, 6))
+        following ^= set(rng.sample(pool, 4))
+        run = store.record_run(
+            'cuenta',
+            _analysis(followers, following),
+            started_at=NOW - (10 - index) * 2 * DAY,
+            crawl_seconds=1,
+            analysis_seconds=0
+        )
+        expected[run.run_id] = (sorted(followers), sorted(following))
+    yield store, expected
+    store.close()
+
+
+def _assert_runs_match(store, expected, run_ids):
+    for run_id in run_ids:
+        assert store.members(run_id, 'followers') == expected[run_id][0]
+        assert store.members(run_id, 'following') == expected[run_id][1]
+    for before in run_ids:
+        for after in run_ids:
+            diff = store.diff(before, after)
+            old, new = [set(names) for names in expected[before]], [set(names) for names in expected[after]]
+            assert diff.new_followers == sorted(new[0] - old[0])
+            assert diff.lost_followers == sorted(old[0] - new[0])
+            assert diff.new_following == sorted(new[1] - old[1])
+            assert diff.lost_following == sorted(old[1] - new[1])
+
+
+def test_members_and_diff_before_compaction(history):
+    store, expected = history
+    
+    _assert_runs_match(store, expected, list(expected))
+
+
+def test_members_and_diff_after_compaction(history):
+    store, expected = history
+    
+    report = store.compact(keep_all_days=3, keep_daily_days=9, now=NOW)
+    kept = [run.run_id for run in store.runs('cuenta')]
+    
+    assert report.runs_before == 11
+    assert report.runs_after == len(kept) < 11
+    assert kept[-1] == max(expected)
+    _assert_runs_match(store, expected, kept)
+    dropped = min(set(expected) - set(kept))
+    assert store.get_run(dropped) is None
+    assert store.members(dropped, 'followers') == []
+
+
+def test_current_member_ids_follow_the_last_run(history):
+    store, expected = history
+    last = expected[max(expected)]
+    
+    before = list(store.current_member_ids('cuenta', 'followers'))
+    store.compact(keep_all_days=0, keep_daily_days=0, now=NOW)
+    
+    assert list(store.current_member_ids('cuenta', 'followers')) == before
+    assert len(before) == len(last[0])
+    assert store.current_member_ids('nadie') is None
@@ -0,0 +1,78 @@
+"""
+Pruebas de los motores de conjuntos.
+"""
+
+import random
+from array import array
+import pytest
+from src.analysis import FollowerAnalyzer, HashSetBackend, SortedArrayBackend, UserRecord
+from src.analysis.set_backends import choose_set_backend, get_set_backend
+from src.analysis.user_table import to_id_array
+
+_CASES = [
+    ([], []),
+    ([1, 2, 3], []),
+    ([], [4, 5]),
+    ([1, 2, 3], [1, 2, 3]),
+    ([1, 3, 5], [2, 4, 6]),
+    ([-7, -1, 0, 2**62], [-7, 0, 5]),
+    ([10], [10])
+]
+
+
+def _random_case(seed: int):
+    rng = random.Random(seed)
+    pool = rng.sample(range(-10**12, 10**12), 3000)
+    return rng.sample(pool, 2000), rng.sample(pool, 1500)
+
+
+@pytest.mark.parametrize('a, b', _CASES + [_random_case(seed) for seed in range(3)])
+def test_sorted_array_backend_matches_hash_backend(a, b):
+    a, b = to_id_array(a), to_id_array(b)
+    hashed, merged = HashSetBackend(), SortedArrayBackend()
+    
+    assert merged.intersection(a, b) == hashed.intersection(a, b)
+    assert merged.union(a, b) == hashed.union(a, b)
+    assert merged.difference(a, b) == hashed.difference(a, b)
+    assert merged.difference(b, a) == hashed.difference(b, a)
+    common = hashed.intersection(a, b)
+    assert merged.subset_difference(a, common) == hashed.subset_difference(a, common)
+    assert merged.subset_difference(b, common) == hashed.subset_difference(b, common)
+
+
+def test_results_are_sorted_q_arrays():
+    a, b = _random_case(9)
+    for backend in (HashSetBackend(), SortedArrayBackend()):
+        union = backend.union(to_id_array(a), to_id_array(b))
+        assert union.typecode == 'q'
+        assert list(union) == sorted(set(a) | set(b))
+
+
+def test_analysis_is_the_same_with_both_backends():
+    followers, following = _random_case(4)
+    results = [
+        FollowerAnalyzer(
+            [UserRecord(user_id, str(user_id)) for user_id in followers],
+            [UserRecord(user_id, str(user_id)) for user_id in following],
+            set_backend=backend
+        ).analyze()
+        for backend in (HashSetBackend(), SortedArrayBackend())
+    ]
+    
+    assert results[0].to_dict() == results[1].to_dict()
+
+
+def test_backend_selection():
+    assert isinstance(choose_set_backend(10), HashSetBackend)
+    assert isinstance(choose_set_backend(10**6), SortedArrayBackend)
+    assert get_set_backend('auto') is None
+    assert isinstance(get_set_backend('sorted'), SortedArrayBackend)
+    with pytest.raises(ValueError):
+        get_set_backend('bitmap')
+
+
+def test_subset_difference_with_empty_subset_copies():
+    a = array('q', [1, 2])
+    result = SortedArrayBackend().subset_difference(a, array('q'))
+    
+    assert result == a and result is not a